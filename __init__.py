@@ -62,6 +62,7 @@ def ensure_site_packages(packages: typing.List[typing.Tuple[str, str]]):
     
     importlib.invalidate_caches()
     
+site_packages_start = timer()
 ensure_site_packages([
     ("PIL", "Pillow"),
     # ("imagesize", "imagesize"),
@@ -76,6 +77,7 @@ ensure_site_packages([
     ("cached_property", "cached-property"),
     ("inflection", "inflection")
 ])
+site_packages_time = timer() - site_packages_start
 
 ADDON_FILES_POSTFIXES = ('_operator.py', '_ui.py', 'data.py')
 ADDON_UTILS_POSTFIXES = ('utils.py', 'asset_parser.py', 'type_definer.py')
@@ -83,6 +85,7 @@ ADDON_UTILS_POSTFIXES = ('utils.py', 'asset_parser.py', 'type_definer.py')
 import importlib
 modules = []
 utils_names = set()
+import_times = {} # type: typing.Dict[str, float]
 for file in os.scandir(os.path.dirname(__file__)):
     if not file.is_file():
         continue
@@ -90,7 +93,9 @@ for file in os.scandir(os.path.dirname(__file__)):
     stem = os.path.splitext(file.name)[0]
     
     if file.name.endswith(ADDON_FILES_POSTFIXES):
+        module_start = timer()
         modules.append(importlib.import_module('.' + stem, package = __package__))
+        import_times[stem] = timer() - module_start
     elif file.name.endswith(ADDON_UTILS_POSTFIXES):
         utils_names.add(stem)
 
@@ -99,6 +104,15 @@ config = utils.read_local_file("config.json") # type: dict
 if config and config.get("dev_mode"):
     modules.append(importlib.import_module('.dev_tools', package = __package__))
 
+def stop_workers():
+    """ Shut down the background Blender processes and remove their handlers, a reloaded module creates new ones. """
+    from . import data
+    from . import view_3d_fur_operator
+    data.ICON_RENDER_POOL.stop()
+    view_3d_fur_operator.PREVIEW_WORKER.stop()
+    view_3d_fur_operator.remove_preview_handlers()
+    data.ICON_RENDER_QUEUE.stop_redraw()
+
 class ATOOL_OT_reload_addon(bpy.types.Operator):
     bl_idname = "atool.reload_addon"
     bl_label = "Reload Atool Addon"
@@ -112,6 +126,8 @@ class ATOOL_OT_reload_addon(bpy.types.Operator):
                 if key in utils_names:
                     utils_to_reload.add(value)
                     
+        stop_workers()
+
         for util in utils_to_reload:
             importlib.reload(util)
 
@@ -119,6 +135,9 @@ class ATOOL_OT_reload_addon(bpy.types.Operator):
             module.register.unregister()
             importlib.reload(module)
             module.register.register()
+
+        from . import data
+        data.ICON_RENDER_QUEUE.start_redraw()
             
         wm = context.window_manager
         wm["at_asset_previews"] = 0
@@ -140,16 +159,25 @@ def register():
     for module in modules:
         module.register.register()
 
+    addon_preferences = bpy.context.preferences.addons[__package__].preferences
+    utils.PROFILER.is_enabled = addon_preferences.use_profiler
+    from . import data
+    data.ICON_RENDER_QUEUE.quality_mode = addon_preferences.icon_quality
+    data.ICON_RENDER_QUEUE.start_redraw()
+    if addon_preferences.icon_render_workers:
+        data.ICON_RENDER_POOL.resize(addon_preferences.icon_render_workers)
+
     wm = bpy.context.window_manager
     wm["at_asset_previews"] = 0
     wm["at_current_page"] = 1
 
     threading.Thread(target=wm.at_asset_data.update, args=(bpy.context,), daemon=True).start()
-    threading.Thread(target=utils.EVERYTHING.set_es_exe, daemon=True).start()
 
     register_time = timer() - start
     log.info(f"register time:\t {register_time:.2f} sec")
     log.info(f"all time:\t\t {register_time + init_time:.2f} sec")
+    log.debug(f"site packages check time: {site_packages_time:.3f} sec")
+    log.debug("module import times, the first import of a module includes its dependencies: " + ', '.join(f"{name} {time:.3f}" for name, time in sorted(import_times.items(), key = lambda item: item[1], reverse = True)))
 
 
 def unregister():
@@ -158,6 +186,8 @@ def unregister():
 
     for module in modules:
         module.register.unregister()
+
+    stop_workers()
         
 
 init_time = timer() - start
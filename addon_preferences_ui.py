@@ -4,6 +4,7 @@ import bpy
 
 from . import addon_updater_ops
 from . import bl_utils
+from . import utils
 
 register = bl_utils.Register(globals())
 
@@ -18,6 +19,22 @@ def update_auto_path(self, context):
     asset_data.check_path(self.auto_path, 'auto')
     threading.Thread(target=asset_data.update_auto, args=(context,), daemon=True).start()
 
+def update_remote_roots(self, context):
+    asset_data = context.window_manager.at_asset_data
+    asset_data.set_remote_roots(self.remote_roots)
+    threading.Thread(target=asset_data.update_remote, args=(context,), daemon=True).start()
+
+def update_icon_render_workers(self, context):
+    from . import data
+    data.ICON_RENDER_POOL.resize(self.icon_render_workers)
+
+def update_icon_quality(self, context):
+    from . import data
+    data.ICON_RENDER_QUEUE.quality_mode = self.icon_quality
+
+def update_use_profiler(self, context):
+    utils.PROFILER.is_enabled = self.use_profiler
+
 class ATOOL_PT_addon_preferences(bpy.types.AddonPreferences):
     bl_idname = __package__
 
@@ -33,6 +50,34 @@ class ATOOL_PT_addon_preferences(bpy.types.AddonPreferences):
         description="A path to folder to be autoprocessed on the startup",
         update=update_auto_path
     )
+    remote_roots: bpy.props.StringProperty(
+        name="Remote Roots",
+        description="Folders separated by \";\" to search for the remote assets (__asset__.json), the search is indexed and only the changed folders are rescanned. If empty, Everything is used on Windows",
+        update=update_remote_roots
+    )
+    icon_render_workers: bpy.props.IntProperty(
+        name="Icon Render Workers",
+        description="Number of background Blender processes rendering asset icons in parallel. 0 to choose by the number of CPU cores",
+        default = 0,
+        min = 0,
+        max = 64,
+        update=update_icon_render_workers
+    )
+    icon_quality: bpy.props.EnumProperty(
+        name="Icon Quality",
+        items=[
+            ('FINAL', 'Final', 'Render icons in the final quality'),
+            ('PROGRESSIVE', 'Draft Then Final', 'Render quick draft icons first and refine them in the background when no other icons are queued')
+        ],
+        default='FINAL',
+        update=update_icon_quality
+    )
+    use_profiler: bpy.props.BoolProperty(
+        name="Profiler",
+        description="Record timings of the asset loading, search, material import and icon rendering. Shown in the 3D View's AT panel and can be exported as a Chrome trace",
+        default = False,
+        update=update_use_profiler
+    )
 
     auto_check_update: bpy.props.BoolProperty(
         name="Auto-check for Update",
@@ -71,7 +116,11 @@ class ATOOL_PT_addon_preferences(bpy.types.AddonPreferences):
         layout = self.layout
         layout.prop(self, "library_path")
         layout.prop(self, "auto_path")
+        layout.prop(self, "remote_roots")
         layout.operator('atool.data_paths')
+        layout.prop(self, "icon_render_workers")
+        layout.prop(self, "icon_quality")
+        layout.prop(self, "use_profiler")
         addon_updater_ops.update_settings_ui(self,context)
 
 
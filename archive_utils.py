@@ -0,0 +1,455 @@
+"""
+A minimal in-process 7z reader for reading single members without extracting the archive, used for the `.sbsar` files. \n
+Supports the COPY, LZMA and LZMA2 coders, optionally preceded by the BCJ and Delta filters, and encoded headers, otherwise raises `Seven_Zip_Error`.
+https://py7zr.readthedocs.io/en/latest/archive_format.html
+"""
+
+import io
+import lzma
+import struct
+import typing
+import zlib
+
+SIGNATURE = b"7z\xBC\xAF\x27\x1C"
+SIGNATURE_HEADER_SIZE = 32
+CHUNK_SIZE = 64 * 1024
+
+K_END = 0x00
+K_HEADER = 0x01
+K_ARCHIVE_PROPERTIES = 0x02
+K_ADDITIONAL_STREAMS_INFO = 0x03
+K_MAIN_STREAMS_INFO = 0x04
+K_FILES_INFO = 0x05
+K_PACK_INFO = 0x06
+K_UNPACK_INFO = 0x07
+K_SUBSTREAMS_INFO = 0x08
+K_SIZE = 0x09
+K_CRC = 0x0A
+K_FOLDER = 0x0B
+K_CODERS_UNPACK_SIZE = 0x0C
+K_NUM_UNPACK_STREAM = 0x0D
+K_EMPTY_STREAM = 0x0E
+K_NAME = 0x11
+K_ENCODED_HEADER = 0x17
+
+CODER_COPY = b'\x00'
+CODER_LZMA = b'\x03\x01\x01'
+CODER_LZMA2 = b'\x21'
+CODER_DELTA = b'\x03'
+CODER_BCJ_FILTERS = {
+    b'\x03\x03\x01\x03': lzma.FILTER_X86,
+    b'\x03\x03\x02\x05': lzma.FILTER_POWERPC,
+    b'\x03\x03\x04\x01': lzma.FILTER_IA64,
+    b'\x03\x03\x05\x01': lzma.FILTER_ARM,
+    b'\x03\x03\x07\x01': lzma.FILTER_ARMTHUMB,
+    b'\x03\x03\x08\x05': lzma.FILTER_SPARC,
+}
+
+
+class Seven_Zip_Error(Exception):
+    pass
+
+
+class Header_Reader(io.BytesIO):
+
+    def read_byte(self) -> int:
+        data = self.read(1)
+        if not data:
+            raise Seven_Zip_Error("Unexpected end of the header.")
+        return data[0]
+
+    def read_number(self) -> int:
+        """ 7z variable length `UINT64`. """
+        first = self.read_byte()
+        mask = 0x80
+        value = 0
+        for index in range(8):
+            if not first & mask:
+                return value | ((first & (mask - 1)) << (8 * index))
+            value |= self.read_byte() << (8 * index)
+            mask >>= 1
+        return value
+
+    def read_bits(self, number: int) -> typing.List[bool]:
+        bits = []
+        byte = 0
+        mask = 0
+        for _ in range(number):
+            if not mask:
+                byte = self.read_byte()
+                mask = 0x80
+            bits.append(bool(byte & mask))
+            mask >>= 1
+        return bits
+
+    def read_defined(self, number: int) -> typing.List[bool]:
+        if self.read_byte():
+            return [True] * number
+        return self.read_bits(number)
+
+    def skip_digests(self, number: int):
+        defined = self.read_defined(number)
+        self.read(4 * sum(defined))
+
+    def expect(self, property_id: int):
+        byte = self.read_byte()
+        if byte != property_id:
+            raise Seven_Zip_Error(f"Unexpected property: {byte}, expected: {property_id}")
+
+
+class Folder:
+    """ A solid block, the files of a folder are compressed as one stream. """
+
+    def __init__(self):
+        self.coders: typing.List[typing.Tuple[bytes, bytes]] = [] # (id, properties)
+        self.number_of_out_streams = 0
+        self.number_of_pack_streams = 0
+        self.bind_pairs: typing.Dict[int, int] = {} # in stream index: out stream index
+        self.main_out_stream = 0
+        self.unpack_size = 0
+        self.has_crc = False
+
+        self.pack_position = 0
+        self.pack_size = 0
+        self.substream_sizes: typing.List[int] = []
+
+
+class Member:
+
+    def __init__(self, name: str, folder: typing.Optional[Folder] = None, offset = 0, size = 0):
+        self.name = name
+        self.folder = folder
+        self.offset = offset
+        self.size = size
+
+
+class Seven_Zip_Reader:
+    """
+    Usage:
+    ```
+    with Seven_Zip_Reader(path) as archive:
+        data = archive.read(archive.names[0])
+    ```
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file: typing.BinaryIO = None
+        self.members: typing.Dict[str, Member] = {}
+
+    def __enter__(self):
+        self.file = open(self.path, 'rb')
+        try:
+            self.read_header()
+        except (Seven_Zip_Error, lzma.LZMAError, struct.error) as e:
+            self.file.close()
+            raise Seven_Zip_Error(f"Cannot read {self.path}: {e}") from e
+        except:
+            self.file.close()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.file.close()
+
+    @property
+    def names(self) -> typing.List[str]:
+        return list(self.members)
+
+    def read_header(self):
+        signature_header = self.file.read(SIGNATURE_HEADER_SIZE)
+        if len(signature_header) != SIGNATURE_HEADER_SIZE or not signature_header.startswith(SIGNATURE):
+            raise Seven_Zip_Error("Not a 7z archive.")
+
+        next_header_offset, next_header_size, next_header_crc = struct.unpack('<QQI', signature_header[12:32])
+        if not next_header_size:
+            return
+
+        self.file.seek(SIGNATURE_HEADER_SIZE + next_header_offset)
+        data = self.file.read(next_header_size)
+        if len(data) != next_header_size or zlib.crc32(data) != next_header_crc:
+            raise Seven_Zip_Error("The header is corrupted.")
+
+        header = Header_Reader(data)
+        property_id = header.read_byte()
+        while property_id == K_ENCODED_HEADER:
+            folders = self.read_streams_info(header)
+            if not folders:
+                raise Seven_Zip_Error("The encoded header has no streams.")
+            header = Header_Reader(b''.join(self.iter_folder(folders[0])))
+            property_id = header.read_byte()
+
+        if property_id != K_HEADER:
+            raise Seven_Zip_Error(f"Unexpected header property: {property_id}")
+
+        folders = []
+        property_id = header.read_byte()
+        if property_id == K_ARCHIVE_PROPERTIES:
+            while True:
+                if not header.read_byte():
+                    break
+                header.read(header.read_number())
+            property_id = header.read_byte()
+
+        if property_id == K_ADDITIONAL_STREAMS_INFO:
+            self.read_streams_info(header)
+            property_id = header.read_byte()
+
+        if property_id == K_MAIN_STREAMS_INFO:
+            folders = self.read_streams_info(header)
+            property_id = header.read_byte()
+
+        if property_id == K_FILES_INFO:
+            self.read_files_info(header, folders)
+            property_id = header.read_byte()
+
+        if property_id != K_END:
+            raise Seven_Zip_Error(f"Unexpected header property: {property_id}")
+
+    def read_streams_info(self, header: Header_Reader) -> typing.List[Folder]:
+        pack_position = 0
+        pack_sizes = []
+        folders = [] # type: typing.List[Folder]
+
+        property_id = header.read_byte()
+
+        if property_id == K_PACK_INFO:
+            pack_position = header.read_number()
+            number_of_pack_streams = header.read_number()
+            property_id = header.read_byte()
+            while property_id != K_END:
+                if property_id == K_SIZE:
+                    pack_sizes = [header.read_number() for _ in range(number_of_pack_streams)]
+                elif property_id == K_CRC:
+                    header.skip_digests(number_of_pack_streams)
+                else:
+                    raise Seven_Zip_Error(f"Unexpected pack info property: {property_id}")
+                property_id = header.read_byte()
+            property_id = header.read_byte()
+
+        if property_id == K_UNPACK_INFO:
+            folders = self.read_unpack_info(header)
+            property_id = header.read_byte()
+
+        position = SIGNATURE_HEADER_SIZE + pack_position
+        pack_index = 0
+        for folder in folders:
+            folder.pack_position = position
+            folder.pack_size = sum(pack_sizes[pack_index:pack_index + folder.number_of_pack_streams])
+            position += folder.pack_size
+            pack_index += folder.number_of_pack_streams
+            folder.substream_sizes = [folder.unpack_size]
+
+        if property_id == K_SUBSTREAMS_INFO:
+            self.read_substreams_info(header, folders)
+            property_id = header.read_byte()
+
+        if property_id != K_END:
+            raise Seven_Zip_Error(f"Unexpected streams info property: {property_id}")
+
+        return folders
+
+    def read_unpack_info(self, header: Header_Reader) -> typing.List[Folder]:
+        header.expect(K_FOLDER)
+        number_of_folders = header.read_number()
+        if header.read_byte():
+            raise Seven_Zip_Error("External folders are not supported.")
+
+        folders = []
+        for _ in range(number_of_folders):
+            folder = Folder()
+
+            number_of_in_streams = 0
+            for _ in range(header.read_number()):
+                flags = header.read_byte()
+                if flags & 0x80:
+                    raise Seven_Zip_Error("Alternative coder methods are not supported.")
+                id = header.read(flags & 0x0F)
+                if flags & 0x10:
+                    number_of_in_streams += header.read_number()
+                    folder.number_of_out_streams += header.read_number()
+                else:
+                    number_of_in_streams += 1
+                    folder.number_of_out_streams += 1
+                properties = header.read(header.read_number()) if flags & 0x20 else b''
+                folder.coders.append((id, properties))
+
+            number_of_bind_pairs = folder.number_of_out_streams - 1
+            for _ in range(number_of_bind_pairs):
+                in_index = header.read_number()
+                folder.bind_pairs[in_index] = header.read_number()
+            folder.main_out_stream = min(set(range(folder.number_of_out_streams)) - set(folder.bind_pairs.values()), default = 0)
+
+            folder.number_of_pack_streams = number_of_in_streams - number_of_bind_pairs
+            if folder.number_of_pack_streams > 1:
+                for _ in range(folder.number_of_pack_streams):
+                    header.read_number()
+
+            folders.append(folder)
+
+        header.expect(K_CODERS_UNPACK_SIZE)
+        for folder in folders:
+            unpack_sizes = [header.read_number() for _ in range(folder.number_of_out_streams)]
+            folder.unpack_size = unpack_sizes[folder.main_out_stream] if unpack_sizes else 0
+
+        property_id = header.read_byte()
+        if property_id == K_CRC:
+            for folder, has_crc in zip(folders, header.read_defined(number_of_folders)):
+                folder.has_crc = has_crc
+                if has_crc:
+                    header.read(4)
+            property_id = header.read_byte()
+
+        if property_id != K_END:
+            raise Seven_Zip_Error(f"Unexpected unpack info property: {property_id}")
+
+        return folders
+
+    def read_substreams_info(self, header: Header_Reader, folders: typing.List[Folder]):
+        numbers_of_streams = [1] * len(folders)
+
+        property_id = header.read_byte()
+        if property_id == K_NUM_UNPACK_STREAM:
+            numbers_of_streams = [header.read_number() for _ in folders]
+            property_id = header.read_byte()
+
+        has_sizes = property_id == K_SIZE
+        for folder, number in zip(folders, numbers_of_streams):
+            if not number:
+                folder.substream_sizes = []
+                continue
+            sizes = [header.read_number() for _ in range(number - 1)] if has_sizes else []
+            sizes.append(folder.unpack_size - sum(sizes))
+            folder.substream_sizes = sizes
+        if has_sizes:
+            property_id = header.read_byte()
+
+        while property_id != K_END:
+            if property_id == K_CRC:
+                number_of_digests = sum(number for folder, number in zip(folders, numbers_of_streams) if not (number == 1 and folder.has_crc))
+                header.skip_digests(number_of_digests)
+            else:
+                raise Seven_Zip_Error(f"Unexpected substreams info property: {property_id}")
+            property_id = header.read_byte()
+
+    def read_files_info(self, header: Header_Reader, folders: typing.List[Folder]):
+        number_of_files = header.read_number()
+        names = []
+        empty_streams = [False] * number_of_files
+
+        while True:
+            property_id = header.read_byte()
+            if property_id == K_END:
+                break
+
+            data = Header_Reader(header.read(header.read_number()))
+            if property_id == K_EMPTY_STREAM:
+                empty_streams = data.read_bits(number_of_files)
+            elif property_id == K_NAME:
+                if data.read_byte():
+                    raise Seven_Zip_Error("External names are not supported.")
+                names = data.read().decode('utf-16-le').split('\x00')[:number_of_files]
+
+        if len(names) != number_of_files:
+            raise Seven_Zip_Error("The file names are missing.")
+
+        streams = ((folder, offset, size) for folder in folders for offset, size in zip(
+            (sum(folder.substream_sizes[:index]) for index in range(len(folder.substream_sizes))), folder.substream_sizes))
+
+        for name, is_empty in zip(names, empty_streams):
+            name = name.replace('\\', '/')
+            if is_empty:
+                self.members[name] = Member(name)
+            else:
+                folder, offset, size = next(streams)
+                self.members[name] = Member(name, folder, offset, size)
+
+    @staticmethod
+    def get_filter(id: bytes, properties: bytes) -> dict:
+        if id == CODER_LZMA:
+            lc_lp_pb, dict_size = struct.unpack('<BI', properties[:5])
+            pb, lc_lp = divmod(lc_lp_pb, 45)
+            lp, lc = divmod(lc_lp, 9)
+            return {'id': lzma.FILTER_LZMA1, 'lc': lc, 'lp': lp, 'pb': pb, 'dict_size': dict_size}
+        elif id == CODER_LZMA2:
+            bits = properties[0]
+            dict_size = 0xFFFFFFFF if bits == 40 else (2 | (bits & 1)) << (bits // 2 + 11)
+            return {'id': lzma.FILTER_LZMA2, 'dict_size': dict_size}
+        elif id == CODER_DELTA:
+            return {'id': lzma.FILTER_DELTA, 'dist': properties[0] + 1}
+        elif id in CODER_BCJ_FILTERS:
+            return {'id': CODER_BCJ_FILTERS[id]}
+        raise Seven_Zip_Error(f"The coder is not supported: {id.hex()}")
+
+    def get_decompressor(self, folder: Folder):
+        """ `None` for the stored folders. """
+        if folder.number_of_pack_streams != 1 or folder.number_of_out_streams != len(folder.coders):
+            raise Seven_Zip_Error("Only linear coder chains are supported.")
+
+        if len(folder.coders) == 1 and folder.coders[0][0] == CODER_COPY:
+            return None
+
+        # from the coder of the folder output to the coder of the packed stream, the same as the `lzma` raw filters order
+        chain = [folder.main_out_stream]
+        while chain[-1] in folder.bind_pairs and len(chain) <= len(folder.coders):
+            chain.append(folder.bind_pairs[chain[-1]])
+
+        filters = [self.get_filter(*folder.coders[index]) for index in chain]
+        if filters[-1]['id'] not in (lzma.FILTER_LZMA1, lzma.FILTER_LZMA2):
+            raise Seven_Zip_Error("The last coder is not LZMA.")
+
+        return lzma.LZMADecompressor(lzma.FORMAT_RAW, filters = filters)
+
+    def iter_folder(self, folder: Folder) -> typing.Iterator[bytes]:
+        """ Decompressed chunks of the folder. """
+        decompressor = self.get_decompressor(folder)
+
+        self.file.seek(folder.pack_position)
+        pack_remaining = folder.pack_size
+        unpack_remaining = folder.unpack_size
+
+        while unpack_remaining > 0:
+            if decompressor is None or decompressor.needs_input:
+                data = self.file.read(min(CHUNK_SIZE, pack_remaining))
+                pack_remaining -= len(data)
+                if not data and (decompressor is None or decompressor.needs_input):
+                    raise Seven_Zip_Error("Unexpected end of the packed stream.")
+            else:
+                data = b''
+
+            chunk = data if decompressor is None else decompressor.decompress(data, max_length = CHUNK_SIZE)
+            chunk = chunk[:unpack_remaining]
+            unpack_remaining -= len(chunk)
+            if chunk:
+                yield chunk
+
+            if decompressor is not None and decompressor.eof and unpack_remaining:
+                raise Seven_Zip_Error("Unexpected end of the compressed stream.")
+
+    def read(self, name: str) -> bytes:
+        """ Decompresses the folder of the member up to the end of the member. """
+        member = self.members.get(name)
+        if member is None:
+            raise KeyError(f"There is no item named {name!r} in the archive.")
+
+        if not member.size:
+            return b''
+
+        data = bytearray()
+        position = 0
+        end = member.offset + member.size
+        try:
+            for chunk in self.iter_folder(member.folder):
+                chunk_end = position + len(chunk)
+                if chunk_end > member.offset:
+                    data += chunk[max(0, member.offset - position):end - position]
+                position = chunk_end
+                if position >= end:
+                    break
+        except lzma.LZMAError as e:
+            raise Seven_Zip_Error(f"Cannot read {name!r}: {e}") from e
+
+        if len(data) != member.size:
+            raise Seven_Zip_Error(f"Cannot read {name!r}.")
+
+        return bytes(data)
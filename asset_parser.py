@@ -5,6 +5,13 @@ import subprocess
 import tempfile
 import operator
 import typing
+import threading
+import contextlib
+import urllib.parse
+import sqlite3
+import hashlib
+import time
+import shutil
 from collections import Counter
 
 import logging
@@ -15,9 +22,11 @@ if __package__:
     import bpy
     from . import utils
     from . import bl_utils
+    from . import archive_utils
     # from . import type_definer
 else:
     import utils
+    import archive_utils
     # import bl_utils
     # import type_definer
     
@@ -40,46 +49,498 @@ else:
 # import tldextract
 # import validators
 
-try:
-    import winreg
-    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\7-Zip") as key:
-        seven_z = winreg.QueryValueEx(key, "Path")[0]
-        seven_z = os.path.join(seven_z, "7z.exe")
-except:
-    seven_z = "7z"
-finally:
+def find_seven_z():
     try:
-        subprocess.run([seven_z], stdout=subprocess.DEVNULL)
+        import winreg
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\7-Zip") as key:
+            seven_z = os.path.join(winreg.QueryValueEx(key, "Path")[0], "7z.exe")
+            if os.path.exists(seven_z):
+                return seven_z
     except:
-        print("7z is not found. The sbsar info auto import is unavailable.")
-        seven_z = None
+        pass
+
+    for name in ("7z", "7za"):
+        seven_z = shutil.which(name)
+        if seven_z:
+            return seven_z
+
+    raise utils.Probe_Error("7z is not found. It is only used for the .sbsar files that the built-in reader cannot read.")
+
+SEVEN_Z = utils.Probe('7z', find_seven_z, validate = os.path.exists)
+
+HTTP_CACHE_PATH = os.path.join(utils.DIR_PATH, "__http_cache__.db")
+HTTP_CACHE_TTL = 7 * 24 * 60 * 60
+
+class HTTP_Cache_Database:
+    """ Responses of the metadata requests keyed by the method, the url and the request body. """
+
+    def __enter__(self):
+        self.connection = sqlite3.connect(HTTP_CACHE_PATH, timeout = 30)
+        self.cursor = self.connection.cursor()
+        self.cursor.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    url TEXT,
+                    status INTEGER,
+                    headers TEXT,
+                    content BLOB,
+                    etag TEXT,
+                    last_modified TEXT,
+                    time REAL
+                    )
+            """)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.connection.commit()
+        self.cursor.close()
+        self.connection.close()
+
+    def get(self, key) -> typing.Optional[dict]:
+        self.cursor.execute("SELECT url, status, headers, content, etag, last_modified, time FROM responses WHERE key = ?", (key,))
+        row = self.cursor.fetchone()
+        if not row:
+            return None
+        return dict(zip(('url', 'status', 'headers', 'content', 'etag', 'last_modified', 'time'), row))
+
+    def set(self, key, response):
+        headers = dict(response.headers)
+        self.cursor.execute("INSERT OR REPLACE INTO responses (key, url, status, headers, content, etag, last_modified, time) VALUES(?,?,?,?,?,?,?,?)", (
+            key,
+            response.url,
+            response.status_code,
+            json.dumps(headers, ensure_ascii=False),
+            sqlite3.Binary(response.content),
+            headers.get('ETag', headers.get('etag')),
+            headers.get('Last-Modified', headers.get('last-modified')),
+            time.time()
+        ))
+
+    def touch(self, key):
+        self.cursor.execute("UPDATE responses SET time = ? WHERE key = ?", (time.time(), key))
+
+    def clear(self):
+        self.cursor.execute("DELETE FROM responses")
+
+
+class HTTP_Client:
+    """
+    One pooled `requests.Session` for all the parsers. \n
+    Reuses connections per host, retries failed and throttled requests with exponential backoff, applies a default timeout and limits the concurrent requests per host.
+    """
+
+    def __init__(self, timeout = (10, 30), retries = 3, backoff_factor = 0.5, max_connections_per_host = 4, cache_ttl = HTTP_CACHE_TTL):
+        """
+        `timeout`: `(connect, read)` seconds \n
+        `cache_ttl`: seconds a cached response is used without revalidation
+        """
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.max_connections_per_host = max_connections_per_host
+        self.cache_ttl = cache_ttl
+
+        self.lock = threading.Lock()
+        self._session = None
+        self.semaphores: typing.Dict[str, threading.BoundedSemaphore] = {}
+
+    @property
+    def session(self):
+        with self.lock:
+            if not self._session:
+                self._session = self.get_session()
+            return self._session
+
+    def get_session(self):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry_arguments = dict(total = self.retries, backoff_factor = self.backoff_factor, status_forcelist = (429, 500, 502, 503, 504), raise_on_status = False)
+        methods = frozenset(('GET', 'HEAD', 'POST'))
+        try:
+            retry = Retry(allowed_methods = methods, **retry_arguments)
+        except TypeError: # urllib3 < 1.26
+            retry = Retry(method_whitelist = methods, **retry_arguments)
+
+        adapter = HTTPAdapter(max_retries = retry, pool_connections = 16, pool_maxsize = self.max_connections_per_host)
+
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def get_semaphore(self, url) -> threading.BoundedSemaphore:
+        host = urllib.parse.urlsplit(url).netloc
+        with self.lock:
+            semaphore = self.semaphores.get(host)
+            if not semaphore:
+                semaphore = self.semaphores[host] = threading.BoundedSemaphore(self.max_connections_per_host)
+            return semaphore
+
+    def request(self, method, url, cache = False, **kwargs):
+        """
+        The same as `requests.request`, the response content is read before releasing the host slot. \n
+        `cache`: use the on-disk response cache, see `cached_request`
+        """
+        if cache:
+            return self.cached_request(method, url, **kwargs)
+
+        kwargs.setdefault('timeout', self.timeout)
+        with self.get_semaphore(url):
+            response = self.session.request(method, url, **kwargs)
+            response.content
+            return response
+
+    @staticmethod
+    def get_cache_key(method, url, **kwargs):
+        body = json.dumps([method.upper(), url, kwargs.get('params'), kwargs.get('data'), kwargs.get('json')], sort_keys = True, ensure_ascii = False, default = str)
+        return hashlib.sha256(body.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def get_cached_response(entry: dict):
+        import requests
+        from requests.structures import CaseInsensitiveDict
+
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.url = entry['url']
+        response.headers = CaseInsensitiveDict(json.loads(entry['headers']))
+        response._content = bytes(entry['content'])
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        return response
+
+    def cached_request(self, method, url, **kwargs):
+        """
+        A request with the response cached on disk, for the metadata that rarely changes. \n
+        A response younger than `cache_ttl` is returned without a request, an older one is revalidated with `ETag` and `Last-Modified`.
+        If the request fails, the stale response is returned, so the already fetched info is available offline.
+        Only `200` responses are cached.
+        """
+        import requests
+
+        key = self.get_cache_key(method, url, **kwargs)
+
+        with HTTP_Cache_Database() as db:
+            entry = db.get(key)
+
+        if entry and time.time() - entry['time'] < self.cache_ttl:
+            return self.get_cached_response(entry)
+
+        if entry:
+            headers = dict(kwargs.get('headers') or {})
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+            kwargs['headers'] = headers
+
+        try:
+            response = self.request(method, url, **kwargs)
+        except requests.RequestException:
+            if entry:
+                log.warning(f"Using a stale cached response for: {url}")
+                return self.get_cached_response(entry)
+            raise
+
+        if entry and (response.status_code == 304 or response.status_code >= 500 or response.status_code == 429):
+            with HTTP_Cache_Database() as db:
+                if response.status_code == 304:
+                    db.touch(key)
+            return self.get_cached_response(entry)
+
+        if response.status_code == 200:
+            with HTTP_Cache_Database() as db:
+                db.set(key, response)
+
+        return response
+
+    def clear_cache(self):
+        with HTTP_Cache_Database() as db:
+            db.clear()
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    @contextlib.contextmanager
+    def stream(self, url, **kwargs):
+        """ A streamed `GET`, the host slot is held until the context is exited. """
+        kwargs.setdefault('timeout', self.timeout)
+        with self.get_semaphore(url):
+            response = self.session.get(url, stream = True, **kwargs)
+            try:
+                yield response
+            finally:
+                response.close()
+
+HTTP = HTTP_Client()
+
 
 def get_base_url(url):
     return url.split("?")[0].split("#")[0].rstrip("/")
 
-def get_web_file(url, content_folder = None, content_path = None, headers = None):
-    assert not(content_folder == None and content_path == None)
-    
-    import requests
-    response = requests.get(url, headers=headers, stream=True)
-    if response.status_code != 200:
-        return False, response.text
+DOWNLOADS_PATH = os.path.join(utils.DIR_PATH, "__downloads__")
 
-    if content_path:
-        os_path = content_path
-        file_name = os.path.basename(os_path)
-        os.makedirs(os.path.dirname(os_path), exist_ok=True)
-    else:
-        file_name = response.url.split("?")[0].split("#")[0].split("/")[-1] # todo: check if does not have extension
-        os_path = os.path.join(content_folder, file_name)
-        os.makedirs(content_folder, exist_ok=True)
+class Download_Error(Exception):
+    pass
+
+class Download:
+    """ A file being downloaded by `Download_Manager`, `done` and `total` are in bytes. """
+
+    def __init__(self, url, headers = None):
+        self.url = url
+        self.headers = headers
+        self.final_url = url
+        self.total = 0
+        self.done = 0
+        self.accepts_ranges = False
+        self.lock = threading.Lock()
+
+    def add_done(self, size: int):
+        """ The segments of a download are written from several threads. """
+        with self.lock:
+            self.done += size
+
+    @property
+    def key(self):
+        return hashlib.sha256(self.url.encode('utf-8')).hexdigest()
+
+    @property
+    def file_name(self):
+        return get_base_url(self.final_url).split("/")[-1] # todo: check if does not have extension
+
+
+class Download_Manager:
+    """
+    Concurrent downloads with resume. \n
+    A file is downloaded into `DOWNLOADS_PATH` and moved to its destination when complete and its size is verified,
+    so an interrupted download continues with an HTTP `Range` request, within the retries and on the next attempt.
+    A large file from a server accepting ranges is downloaded in several segments at once.
+    The number of connections per host is limited, the chunk size adapts to the speed of the connection.
+    """
+
+    MIN_CHUNK_SIZE = 64 * 1024
+    MAX_CHUNK_SIZE = 8 * 1024 * 1024
+    CHUNK_TIME = 0.25
+    MIN_SEGMENT_SIZE = 32 * 1024 * 1024
+
+    def __init__(self, client: HTTP_Client = HTTP, max_workers = 8, max_connections_per_host = 4, max_segments = 4, retries = 5):
+        self.client = client
+        self.max_workers = max_workers
+        self.max_connections_per_host = max_connections_per_host
+        self.max_segments = max_segments
+        self.retries = retries
+
+        self.lock = threading.Lock()
+        self.semaphores: typing.Dict[str, threading.BoundedSemaphore] = {}
+
+    def get_semaphore(self, url) -> threading.BoundedSemaphore:
+        host = urllib.parse.urlsplit(url).netloc
+        with self.lock:
+            semaphore = self.semaphores.get(host)
+            if not semaphore:
+                semaphore = self.semaphores[host] = threading.BoundedSemaphore(self.max_connections_per_host)
+            return semaphore
+
+    def get(self, url, headers = None, byte_range = None):
+        headers = dict(headers or {})
+        if byte_range:
+            headers['Range'] = 'bytes={}-{}'.format(*byte_range)
+            headers['Accept-Encoding'] = 'identity' # the range offsets are of the raw bytes
+        return self.client.session.get(url, headers = headers, stream = True, timeout = self.client.timeout)
+
+    def probe(self, download: Download):
+        """ Get the size, the final url and whether `Range` requests are supported. """
+
+        for attempt in range(self.retries + 1):
+            try:
+                with self.get_semaphore(download.url):
+                    response = self.get(download.url, download.headers, byte_range = (0, ''))
+                    try:
+                        if response.status_code not in (200, 206):
+                            raise Download_Error(f"{response.status_code}: {response.text[:200]}")
+                        download.final_url = response.url
+                        download.accepts_ranges = response.status_code == 206
+                        if download.accepts_ranges:
+                            total = response.headers.get('content-range', '').rpartition('/')[2]
+                        else:
+                            total = response.headers.get('content-length', '')
+                        download.total = int(total) if total.isdigit() else 0
+                    finally:
+                        response.close()
+                return
+            except Download_Error:
+                if attempt == self.retries:
+                    raise
+            except Exception as e:
+                if attempt == self.retries:
+                    raise Download_Error(f"{type(e).__name__}: {e}")
+
+            time.sleep(min(2 ** attempt * self.client.backoff_factor, 30))
+
+    def fetch(self, download: Download, path: str, start = 0, end = None):
+        """ Download the bytes `start` to `end` inclusive into `path`, appending to what is already there. """
+
+        for attempt in range(self.retries + 1):
+
+            size = os.path.getsize(path) if os.path.exists(path) else 0
+            if end is not None and start + size > end:
+                return
+
+            byte_range = None
+            if download.accepts_ranges and (start + size or end is not None): # a segment is always ranged, even the first one
+                byte_range = (start + size, '' if end is None else end)
+            elif size:
+                download.add_done(-size)
+                size = 0
+
+            try:
+                with self.get_semaphore(download.url):
+                    response = self.get(download.url, download.headers, byte_range)
+                    try:
+                        if byte_range and response.status_code == 200 and start == 0 and end is None:
+                            # the range is ignored, start over
+                            download.add_done(-size)
+                            byte_range = None
+                        if byte_range and response.status_code == 416:
+                            os.remove(path)
+                            download.add_done(-size)
+                            raise Download_Error("The requested range is not satisfiable.")
+                        if response.status_code not in (200, 206) or (byte_range and response.status_code != 206):
+                            raise Download_Error(f"{response.status_code}: {response.text[:200]}")
+
+                        with open(path, 'ab' if byte_range else 'wb') as file:
+                            self.write(response, file, download, decode_content = not byte_range)
+                    finally:
+                        response.close()
+                return
+            except Download_Error:
+                if attempt == self.retries:
+                    raise
+            except Exception as e:
+                if attempt == self.retries:
+                    raise Download_Error(f"{type(e).__name__}: {e}")
+
+            time.sleep(min(2 ** attempt * self.client.backoff_factor, 30))
+
+    def write(self, response, file, download: Download, decode_content = True):
+        """ `decode_content`: `False` for a range as a decoded part cannot be appended to the raw bytes """
+        chunk_size = self.MIN_CHUNK_SIZE
+        while True:
+            start_time = time.perf_counter()
+            chunk = response.raw.read(chunk_size, decode_content = decode_content)
+            if not chunk:
+                break
+            file.write(chunk)
+            download.add_done(len(chunk))
+
+            elapsed = time.perf_counter() - start_time
+            if elapsed < self.CHUNK_TIME / 2:
+                chunk_size = min(chunk_size * 2, self.MAX_CHUNK_SIZE)
+            elif elapsed > self.CHUNK_TIME * 2:
+                chunk_size = max(chunk_size // 2, self.MIN_CHUNK_SIZE)
+
+    def get_segments(self, download: Download):
+        if not download.accepts_ranges or download.total < self.MIN_SEGMENT_SIZE * 2:
+            return [(0, None)]
+
+        number = min(self.max_segments, self.max_connections_per_host, download.total // self.MIN_SEGMENT_SIZE)
+        step = -(-download.total // number)
+        return [(start, min(start + step, download.total) - 1) for start in range(0, download.total, step)]
+
+    def download(self, url, content_folder = None, content_path = None, headers = None, download: Download = None) -> str:
+        """
+        Download a file to `content_path` or into `content_folder` with the name from the url. \n
+        `return`: the path of the file \n
+        `raise`: `Download_Error`
+        """
+        import concurrent.futures
+        assert not(content_folder == None and content_path == None)
+
+        if not download:
+            download = Download(url, headers)
+        self.probe(download)
+
+        if content_path:
+            os_path = content_path
+        else:
+            os_path = os.path.join(content_folder, download.file_name)
+        assert not os.path.exists(os_path)
+
+        os.makedirs(DOWNLOADS_PATH, exist_ok = True)
+        segments = self.get_segments(download)
+        part_paths = [os.path.join(DOWNLOADS_PATH, f"{download.key}.{len(segments)}.{index}.part") for index in range(len(segments))]
+        download.done = sum(os.path.getsize(path) for path in part_paths if os.path.exists(path))
+
+        if len(segments) == 1:
+            self.fetch(download, part_paths[0])
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers = len(segments)) as executor:
+                futures = [executor.submit(self.fetch, download, path, start, end) for path, (start, end) in zip(part_paths, segments)]
+                for future in futures:
+                    future.result()
+
+        size = sum(os.path.getsize(path) for path in part_paths)
+        if download.total and size != download.total:
+            if size > download.total: # the file has changed
+                for path in part_paths:
+                    os.remove(path)
+            raise Download_Error(f"The size {size} does not match the expected {download.total}, run again to resume.")
+
+        os.makedirs(os.path.dirname(os_path), exist_ok = True)
+        if len(part_paths) == 1:
+            shutil.move(part_paths[0], os_path)
+        else:
+            temp_path = part_paths[0] + '.joined'
+            with open(temp_path, 'wb') as file:
+                for path in part_paths:
+                    with open(path, 'rb') as part:
+                        shutil.copyfileobj(part, file, self.MAX_CHUNK_SIZE)
+            shutil.move(temp_path, os_path)
+            for path in part_paths:
+                os.remove(path)
+
+        return os_path
+
+    def download_all(self, downloads: typing.List[dict], prefix = 'Files') -> typing.List[typing.Tuple[bool, str]]:
+        """
+        Download the files concurrently. \n
+        `downloads`: the keyword arguments for `download` \n
+        `return`: `(is_ok, path or error)` in the same order
+        """
+        import concurrent.futures
+
+        results = [None] * len(downloads)
+        with concurrent.futures.ThreadPoolExecutor(max_workers = self.max_workers) as executor:
+            futures = {executor.submit(self.download, **kwargs): index for index, kwargs in enumerate(downloads)}
+            for future in bl_utils.iter_with_progress(concurrent.futures.as_completed(futures), prefix = prefix, total = len(futures)):
+                try:
+                    results[futures[future]] = (True, future.result())
+                except Exception as e:
+                    results[futures[future]] = (False, str(e))
+
+        return results
+
+DOWNLOADS = Download_Manager()
 
-    assert not os.path.exists(os_path)
 
-    total = int(response.headers.get('content-length'))
-    bl_utils.download_with_progress(response, os_path, total= total, indent=1, prefix = file_name)
+def get_web_file(url, content_folder = None, content_path = None, headers = None):
+    import concurrent.futures
+
+    download = Download(url, headers)
+    name = os.path.basename(content_path) if content_path else get_base_url(url).split("/")[-1]
 
-    return True, os_path
+    with concurrent.futures.ThreadPoolExecutor(max_workers = 1) as executor:
+        future = executor.submit(DOWNLOADS.download, url, content_folder, content_path, headers, download)
+        bl_utils.wait_with_progress(future, lambda: download.done, lambda: download.total, indent = 1, prefix = name)
+        try:
+            return True, future.result()
+        except Download_Error as e:
+            return False, str(e)
 
 
 def get_web_ambientcg_info(url, content_folder):
@@ -100,8 +561,7 @@ def get_web_ambientcg_info(url, content_folder):
 
     headers = {'User-Agent': 'Blender'}
 
-    import requests
-    response = requests.get(api_url, headers=headers)
+    response = HTTP.get(api_url, headers=headers, cache=True)
     if response.status_code != 200:
         return False, response.text
         
@@ -185,8 +645,7 @@ def get_web_polyhaven_info(url, content_folder):
 
     api_url = f"https://api.polyhaven.com/info/{id}"
 
-    import requests
-    response = requests.get(api_url)
+    response = HTTP.get(api_url, cache=True)
     if response.status_code != 200:
         return False, response.text
 
@@ -240,7 +699,7 @@ def get_web_polyhaven_info(url, content_folder):
     utils.remove_empty(info)
     
     api_url = f"https://api.polyhaven.com/files/{id}"
-    response = requests.get(api_url)
+    response = HTTP.get(api_url, cache=True)
     if response.status_code == 200:
         
         data = response.json() 
@@ -289,13 +748,15 @@ def get_web_polyhaven_asset(url, content_folder):
         return False, info
 
     downloads = info.pop('downloads') # type: typing.List[dict]
-    for download in bl_utils.iter_with_progress(downloads, prefix = "Files"):
+    arguments = []
+    for download in downloads:
         rel_path = download.get('rel_path')
         if rel_path:
-            content_path = os.path.join(content_folder, *os.path.split(rel_path))
-            is_ok, result = get_web_file(download['url'], content_path = content_path)
+            arguments.append(dict(url = download['url'], content_path = os.path.join(content_folder, *os.path.split(rel_path))))
         else:
-            is_ok, result = get_web_file(download['url'], content_folder)
+            arguments.append(dict(url = download['url'], content_folder = content_folder))
+
+    for download, (is_ok, result) in zip(downloads, DOWNLOADS.download_all(arguments)):
         if not is_ok:
             print(f"Cannot download {download}", result)
 
@@ -343,70 +804,85 @@ def get_info_from_substance_json(data):
     utils.remove_empty(info)
     return info
 
-def get_info_from_sbsar_xml(xml_file):
-    with open(xml_file , 'r',encoding = "utf-8") as xml_text:
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(xml_text.read(), "html.parser")
-        graph = soup.find("graph")
-        attrs = graph.attrs # type: dict
-
-        tags = []
-        keywords = attrs.get("keywords")
-        if keywords:
-            tags = re.split(r" |;|,", keywords.strip("; ").lower())
-        
-        category = attrs.get("category")
-        if category:
-            tags.extend(re.split(r" |/|,", category.lower()))
-        
-        tags = utils.deduplicate(tags)
-        tags = list(filter(None, tags))
-
-        id = None
-        pkgurl = attrs.get("pkgurl")
-        if pkgurl:
-            match = re.search(r"(?<=pkg:\/\/).+", pkgurl)
-            if match:
-                id = match.group(0)
-
-        if id:
-            name = id
-        else:
-            name = os.path.splitext(os.path.basename(xml_file))[0]
-        label = attrs.get("label")
-        if label:
-            name = label.strip(" ")
-
-        dimensions = {}
-        physicalsize = attrs.get("physicalsize")
-        if physicalsize:
-            for letter, dimension in zip('xyz' , physicalsize.split(",")):
-                dimensions[letter] = float(dimension)/100.0
-
-        info = {
-            "id": id,
-            "name": name,
-            # "url": "",
-            "author":  attrs.get("author", ""),
-            "author_url": attrs.get("authorurl", ""),
-            # "licence": "",
-            # "licence_url": "",
-            "tags": tags,
-            # "preview_url": "",
-            "description": attrs.get("description", ""),
-            "dimensions": dimensions,
-            "xml_attrs": attrs
-        }
+def get_info_from_sbsar_xml(xml_file, xml_text: str = None):
+    """ `xml_text`: the content of `xml_file` if it is already read """
+    if xml_text is None:
+        with open(xml_file , 'r',encoding = "utf-8") as file:
+            xml_text = file.read()
+
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(xml_text, "html.parser")
+    graph = soup.find("graph")
+    attrs = graph.attrs # type: dict
+
+    tags = []
+    keywords = attrs.get("keywords")
+    if keywords:
+        tags = re.split(r" |;|,", keywords.strip("; ").lower())
+    
+    category = attrs.get("category")
+    if category:
+        tags.extend(re.split(r" |/|,", category.lower()))
+    
+    tags = utils.deduplicate(tags)
+    tags = list(filter(None, tags))
+
+    id = None
+    pkgurl = attrs.get("pkgurl")
+    if pkgurl:
+        match = re.search(r"(?<=pkg:\/\/).+", pkgurl)
+        if match:
+            id = match.group(0)
+
+    if id:
+        name = id
+    else:
+        name = os.path.splitext(os.path.basename(xml_file))[0]
+    label = attrs.get("label")
+    if label:
+        name = label.strip(" ")
+
+    dimensions = {}
+    physicalsize = attrs.get("physicalsize")
+    if physicalsize:
+        for letter, dimension in zip('xyz' , physicalsize.split(",")):
+            dimensions[letter] = float(dimension)/100.0
+
+    info = {
+        "id": id,
+        "name": name,
+        # "url": "",
+        "author":  attrs.get("author", ""),
+        "author_url": attrs.get("authorurl", ""),
+        # "licence": "",
+        # "licence_url": "",
+        "tags": tags,
+        # "preview_url": "",
+        "description": attrs.get("description", ""),
+        "dimensions": dimensions,
+        "xml_attrs": attrs
+    }
 
 
-        utils.remove_empty(info)
-        return info
+    utils.remove_empty(info)
+    return info
 
 def get_info_from_sbsar(sbsar):
+    """ Read the embedded xml in-process, `7z` is used if the archive is not supported by `archive_utils.Seven_Zip_Reader`. """
 
-    global seven_z
+    try:
+        with archive_utils.Seven_Zip_Reader(sbsar) as archive:
+            xml_name = next((name for name in archive.names if name.lower().endswith('.xml')), None)
+            if not xml_name:
+                return False, "No xml in the sbsar."
+            xml_text = archive.read(xml_name).decode('utf-8')
+        return True, get_info_from_sbsar_xml(os.path.basename(xml_name), xml_text)
+    except archive_utils.Seven_Zip_Error as e:
+        log.debug(f"Falling back to 7z: {e}")
+
+    seven_z = SEVEN_Z.value
     if not seven_z:
-        return False, "7z is not found."
+        return False, SEVEN_Z.error
     
     with tempfile.TemporaryDirectory() as temp_dir:
         subprocess.run([seven_z, "e", sbsar, "-o" + temp_dir, "*.xml" ,"-r"], stdout=subprocess.PIPE, check=True)
@@ -470,8 +946,7 @@ def get_web_substance_source_info_by_label(label):
         "query": query_assets
     }
 
-    import requests
-    response = requests.post(substance_api_url, json = substance_search_payload)
+    response = HTTP.post(substance_api_url, json = substance_search_payload, cache = True)
     if response.status_code != 200:
         return False, response.text
 
@@ -540,8 +1015,7 @@ def get_web_substance_source_info(url, content_folder):
         "query": query_asset
         }
 
-    import requests
-    response = requests.post(substance_api_url, json = substance_info_payload)
+    response = HTTP.post(substance_api_url, json = substance_info_payload, cache = True)
     if response.status_code != 200:
         return False, response.text
 
@@ -561,8 +1035,7 @@ def get_web_blendswap_info(url, content_folder):
     if not re.search(r"blendswap.com\/blend\/\d+$", url) and not re.search(r"blendswap.com\/blends\/view\/\d+$", url):
         return False, "Not valid BlendSwap url."
 
-    import requests
-    response = requests.get(url)
+    response = HTTP.get(url, cache=True)
     if response.status_code != 200:
         return False, response.text
 
@@ -656,8 +1129,7 @@ def get_web_sketchfab_info(url, content_folder):
 
     #https://sketchfab.com/i/models/c2933b42e63f4f53bb061e323047615a
 
-    import requests
-    response = requests.get("https://sketchfab.com/i/models/"+ id)
+    response = HTTP.get("https://sketchfab.com/i/models/"+ id, cache=True)
     if response.status_code != 200:
         return False, response.text
 
@@ -777,8 +1249,7 @@ def get_web_megascan_info(url, content_folder):
 
     api_url = f"https://quixel.com/v1/assets/{megascan_id}"
 
-    import requests
-    response = requests.get(api_url)
+    response = HTTP.get(api_url, cache=True)
     if response.status_code != 200:
         return False, response.text
 
@@ -4,6 +4,11 @@ import threading
 import typing
 import os
 import subprocess
+import json
+import sys
+import collections
+import queue
+import concurrent.futures
 import time
 import math
 
@@ -399,10 +404,13 @@ def arrange_by_materials(objects: typing.Iterable[bpy.types.Object], by_material
             object.location = (j*x,  y_offset, 0)
 
 
-def run_blender(filepath: str = None, script: str = None, argv: list = None, use_atool = True, library_path: str = None, stdout = None):
+def get_blender_args(filepath: str = None, script: str = None, argv: list = None, use_atool = True, library_path: str = None, threads: int = None):
 
     args = [bpy.app.binary_path, '-b', '--factory-startup']
 
+    if threads:
+        args.extend(('--threads', str(threads)))
+
     if filepath:
         args.append(filepath)
 
@@ -421,9 +429,236 @@ def run_blender(filepath: str = None, script: str = None, argv: list = None, use
     if argv:
         args.extend(argv)
 
+    return args
+
+
+def run_blender(filepath: str = None, script: str = None, argv: list = None, use_atool = True, library_path: str = None, stdout = None):
+    args = get_blender_args(filepath, script, argv, use_atool, library_path)
     return subprocess.run(args, stdout=stdout, check = True, text = True)
 
 
+class Render_Cancelled(Exception):
+    pass
+
+
+class Cancel_Token:
+    """ Cancels a render running in a `Blender_Worker` by killing the worker's process. """
+
+    def __init__(self):
+        self.is_cancelled = False
+        self.worker: Blender_Worker = None
+
+    def cancel(self):
+        self.is_cancelled = True
+        worker = self.worker
+        if worker:
+            worker.kill()
+
+
+class Blender_Worker:
+    """
+    A supervised background Blender running a `script` from `scripts` with `-server`. \n
+    The script keeps its scene loaded between jobs, the process is restarted if it dies and shut down after `idle_timeout` seconds without jobs.
+    """
+
+    RESULT_PREFIX = 'ATOOL_RENDER_RESULT '
+    script: str = None
+    use_atool = True
+    name = 'Blender worker'
+    STDERR_LINES = 50
+
+    def __init__(self, idle_timeout = 300, max_restarts = 3, threads: int = None):
+        """ `threads`: number of render threads, all the cores if `None` """
+        self.idle_timeout = idle_timeout
+        self.max_restarts = max_restarts
+        self.threads = threads
+
+        self.lock = threading.RLock()
+        self.process: subprocess.Popen = None
+        self.idle_timer: threading.Timer = None
+        self.last_used = time.time()
+        self.stderr: typing.Deque[str] = collections.deque(maxlen = self.STDERR_LINES)
+
+    @property
+    def is_running(self):
+        return self.process is not None and self.process.poll() is None
+
+    def start(self):
+        args = get_blender_args(script = utils.get_script(self.script), argv = ['-server'], use_atool = self.use_atool, threads = self.threads)
+        self.process = subprocess.Popen(args, stdin = subprocess.PIPE, stdout = subprocess.PIPE, stderr = subprocess.PIPE, text = True, encoding = 'utf-8', errors = 'replace', bufsize = 1)
+        threading.Thread(target = self.read_stderr, args = (self.process,), daemon = True).start()
+
+    def read_stderr(self, process: subprocess.Popen):
+        """ Keep the last lines of stderr for error reports and pass them to the console. """
+        for line in process.stderr:
+            self.stderr.append(line)
+            sys.stderr.write(line)
+
+    def get_stderr(self):
+        return ''.join(self.stderr).strip()
+
+    def kill(self):
+        """ Kill the process without waiting for the current render, it is restarted on the next job. """
+        process = self.process
+        if process and process.poll() is None:
+            process.kill()
+
+    @utils.synchronized
+    def stop(self):
+        if self.idle_timer:
+            self.idle_timer.cancel()
+            self.idle_timer = None
+
+        if not self.process:
+            return
+
+        process = self.process
+        self.process = None
+
+        try:
+            process.stdin.close()
+            process.wait(timeout = 10)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+
+    def send(self, jobs: dict) -> dict:
+        self.process.stdin.write(json.dumps(jobs, ensure_ascii = False) + '\n')
+        self.process.stdin.flush()
+
+        for line in self.process.stdout:
+            if line.startswith(self.RESULT_PREFIX):
+                return json.loads(line[len(self.RESULT_PREFIX):])
+
+        raise BrokenPipeError(f"The {self.name} has exited.")
+
+    @utils.synchronized
+    def stop_if_idle(self):
+        if time.time() - self.last_used >= self.idle_timeout:
+            self.stop()
+
+    @utils.synchronized
+    def render(self, jobs: dict, cancel_token: Cancel_Token = None) -> dict:
+        """
+        Send the `jobs` to the script and return its result, blocks until done. \n
+        Raises `Render_Cancelled` if cancelled by `cancel_token` and `RuntimeError` with the stderr of the worker if failed.
+        """
+
+        if self.idle_timer:
+            self.idle_timer.cancel()
+            self.idle_timer = None
+
+        if cancel_token:
+            if cancel_token.is_cancelled:
+                raise Render_Cancelled()
+            cancel_token.worker = self
+
+        try:
+            for attempt in range(self.max_restarts + 1):
+
+                if not self.is_running:
+                    if attempt:
+                        print(f"Restarting the {self.name}, attempt {attempt}.")
+                    self.start()
+
+                self.stderr.clear()
+
+                try:
+                    result = self.send(jobs)
+                except (OSError, ValueError):
+                    self.stop()
+                    if cancel_token and cancel_token.is_cancelled:
+                        raise Render_Cancelled()
+                    continue
+
+                if not result['ok']:
+                    raise RuntimeError(f"The {self.name} has failed: {result['error']}\n{self.get_stderr()}")
+                return result
+
+            raise RuntimeError(f"The {self.name} has crashed {self.max_restarts + 1} times.\n{self.get_stderr()}")
+
+        finally:
+            if cancel_token:
+                cancel_token.worker = None
+            self.last_used = time.time()
+            self.idle_timer = threading.Timer(self.idle_timeout, self.stop_if_idle)
+            self.idle_timer.daemon = True
+            self.idle_timer.start()
+
+
+class Icon_Render_Worker(Blender_Worker):
+    """ Renders asset icons with `scripts/render_icon.py`, keeps the icon scene loaded. """
+    script = 'render_icon.py'
+    name = 'icon render worker'
+
+
+class Preview_Worker(Blender_Worker):
+    """ Renders viewport previews with `scripts/preview.py`, keeps the last scene loaded. """
+    script = 'preview.py'
+    use_atool = False
+    name = 'preview render worker'
+
+
+class Icon_Render_Pool:
+    """
+    Several `Icon_Render_Worker` splitting the CPU cores between them. \n
+    Small icon renders do not load all the cores of one Blender, so the jobs are sharded across the workers: each job goes to the first idle one.
+    """
+
+    def __init__(self, number_of_workers: int = None, idle_timeout = 300):
+        self.lock = threading.Lock()
+        self.idle_timeout = idle_timeout
+        self.workers: typing.List[Icon_Render_Worker] = []
+        self.idle_workers: queue.Queue = None
+        self.resize(number_of_workers)
+
+    @staticmethod
+    def get_default_number_of_workers():
+        return max(1, min(4, (os.cpu_count() or 1) // 4))
+
+    @utils.synchronized
+    def resize(self, number_of_workers: int = None):
+        """ `number_of_workers`: `None` for the default by the number of the cores """
+
+        if not number_of_workers:
+            number_of_workers = self.get_default_number_of_workers()
+
+        if len(self.workers) == number_of_workers:
+            return
+
+        for worker in self.workers:
+            worker.stop()
+
+        threads = max(1, (os.cpu_count() or 1) // number_of_workers) if number_of_workers > 1 else None
+        self.workers = [Icon_Render_Worker(idle_timeout = self.idle_timeout, threads = threads) for _ in range(number_of_workers)]
+
+        self.idle_workers = queue.Queue()
+        for worker in self.workers:
+            self.idle_workers.put(worker)
+
+    def render(self, jobs: dict, cancel_token: Cancel_Token = None):
+        """ Render the `jobs` with the first idle worker, blocks until done. """
+
+        idle_workers = self.idle_workers
+        worker = idle_workers.get() # type: Icon_Render_Worker
+        try:
+            worker.render(jobs, cancel_token)
+        finally:
+            idle_workers.put(worker)
+
+    def map(self, jobs_list: typing.List[dict]) -> typing.Iterator[typing.Tuple[int, typing.Optional[Exception]]]:
+        """ Render the `jobs_list` concurrently, yields `(index, exception)` in the order of completion. """
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers = len(self.workers)) as executor:
+            futures = {executor.submit(self.render, jobs): index for index, jobs in enumerate(jobs_list)}
+            for future in concurrent.futures.as_completed(futures):
+                yield futures[future], future.exception()
+
+    def stop(self):
+        for worker in self.workers:
+            worker.stop()
+
+
 def get_world_dimensions(objects: typing.Iterable[bpy.types.Object]):
     
     vertices = []
@@ -579,6 +814,32 @@ def download_with_progress(response, path: str, total: int, region: bpy.types.Re
                 f.write(chunk)
 
 
+def wait_with_progress(future, get_done: typing.Callable[[], int], get_total: typing.Callable[[], int], indent = 0, prefix = ''):
+    """ Draw the progress of a download running in `future` until it is done. `get_done` and `get_total` return bytes. """
+
+    def iter_chunks():
+        chunk = 0
+        while not future.done():
+            total = math.ceil(get_total() / CHUNK_SIZE)
+            done = min(get_done() // CHUNK_SIZE, total)
+            while chunk < done:
+                chunk += 1
+                yield chunk
+            time.sleep(DRAWER_SLEEP_TIME)
+
+    while not future.done() and not get_total():
+        time.sleep(DRAWER_SLEEP_TIME)
+
+    total = get_total()
+    if bpy.app.background or not total:
+        future.exception()
+        return
+
+    with Progress_Drawer(iter_chunks(), is_file = True, prefix = prefix, total = math.ceil(total / CHUNK_SIZE), indent = indent) as drawer:
+        for _ in drawer:
+            pass
+
+
 def abspath(path, library:bpy.types.Library = None):
     return os.path.realpath(bpy.path.abspath(path, library = library))
 
@@ -1,4 +1,6 @@
 import json
+import hashlib
+import collections
 import math
 import os
 import random
@@ -13,7 +15,6 @@ from timeit import default_timer as timer
 import subprocess
 
 import bpy
-from PIL import Image as pillow_image
 from cached_property import cached_property
 
 import _bpy # type: ignore
@@ -256,6 +257,8 @@ class Asset:
     system_tags_mtime: float
     ctime: float
     
+    AUTO_ID_LOCK = threading.Lock() # the id allocation of the concurrent auto imports
+
     def __init__(self, path: os.DirEntry, is_remote = False):
         self.info: dict
         self.path: str
@@ -329,7 +332,6 @@ class Asset:
     def default(cls, path: os.DirEntry): # type: (os.DirEntry) -> Asset
         asset = cls(path)
         
-        global json_reading_time
         start = timer()
 
         try:
@@ -345,7 +347,7 @@ class Asset:
             import traceback
             traceback.print_exc()
             
-        json_reading_time += timer() - start
+        utils.PROFILER.count('json reading time', timer() - start)
 
         asset.standardize_info()
         asset.update_system_tags()
@@ -391,31 +393,61 @@ class Asset:
 
     @classmethod
     def auto(cls, path: os.DirEntry, asset_data_path, ignore_info = False): # type: (os.DirEntry, str, bool) -> typing.Tuple[str, Asset]
-        info = {}
-        preview = None
+        """ A failed import of a file leaves the auto folder as it was. """
 
         id = os.path.splitext(path.name)[0]
         if os.path.dirname(path.path) != asset_data_path:
-            if id:
-                number = 2
-                id_path = os.path.join(asset_data_path, id)
-                while True:
-                    if os.path.exists(id_path):
-                        id_path = os.path.join(asset_data_path, id + f"_{number}")
-                        number += 1
-                    else:
-                        break                 
-            else:
-                id_chars = "".join((string.ascii_lowercase, string.digits))
-                while True:
-                    id = ''.join(random.choice(id_chars) for _ in range(11))
+            with cls.AUTO_ID_LOCK:
+                if id:
+                    number = 2
                     id_path = os.path.join(asset_data_path, id)
-                    if not os.path.exists(id_path):
-                        break
+                    while True:
+                        if os.path.exists(id_path):
+                            id_path = os.path.join(asset_data_path, id + f"_{number}")
+                            number += 1
+                        else:
+                            break                 
+                else:
+                    id_chars = "".join((string.ascii_lowercase, string.digits))
+                    while True:
+                        id = ''.join(random.choice(id_chars) for _ in range(11))
+                        id_path = os.path.join(asset_data_path, id)
+                        if not os.path.exists(id_path):
+                            break
+                is_reserved = path.is_file()
+                if is_reserved:
+                    os.makedirs(id_path) # reserve the id
             id_path = utils.PseudoDirEntry(id_path)
         else:
+            is_reserved = False
             id_path = path
-        
+
+        moved = [] # type: typing.List[typing.Tuple[str, str]]
+        try:
+            return cls.auto_import(path, id_path, asset_data_path, ignore_info, moved)
+        except:
+            if is_reserved:
+                cls.release_auto_folder(id_path.path, moved)
+            raise
+
+    @classmethod
+    def release_auto_folder(cls, path: str, moved: typing.List[typing.Tuple[str, str]]):
+        """ Return the `moved` files of a failed auto import and remove the reserved folder, so it is not loaded as an empty asset. """
+        for old_path, new_path in reversed(moved):
+            try:
+                if not os.path.exists(old_path):
+                    shutil.move(new_path, old_path)
+            except OSError as e:
+                print(f"Cannot return {new_path} to {old_path}, the folder {path} is kept: {e}")
+                return
+        shutil.rmtree(path, ignore_errors = True)
+
+    @classmethod
+    def auto_import(cls, path: os.DirEntry, id_path: utils.PseudoDirEntry, asset_data_path: str, ignore_info: bool, moved: typing.List[typing.Tuple[str, str]]) -> typing.Tuple[str, Asset]:
+        """ `moved`: the files moved from the auto folder as `(old path, new path)` """
+        info = {}
+        preview = None
+
         extra_folder = os.path.join(id_path.path, "__extra__")
         archive_folder = os.path.join(id_path.path, "__archive__")
         gallery_folder = os.path.join(id_path.path, "__gallery__")
@@ -436,18 +468,19 @@ class Asset:
             url_files = [url for url in url_files if url.exists() and url.type == "url"]
             for url_file in url_files:
                 url = url_file.data
-                utils.move_to_folder(url_file, extra_folder)
+                moved.append((str(url_file), utils.move_to_folder(url_file, extra_folder)))
 
             if url:
                 info, preview = get_info()
 
             if file.type == "zip":
                 utils.extract_zip(file, id_path.path)
-                utils.move_to_folder(file, archive_folder)
+                moved.append((str(file), utils.move_to_folder(file, archive_folder)))
             else:
-                utils.move_to_folder(file, id_path.path)
+                moved.append((str(file), utils.move_to_folder(file, id_path.path)))
         else:
-            id_path = utils.PseudoDirEntry(utils.move_to_folder(path.path, asset_data_path))
+            with cls.AUTO_ID_LOCK:
+                id_path = utils.PseudoDirEntry(utils.move_to_folder(path.path, asset_data_path))
 
         files = utils.File_Filter.from_dir(id_path, ignore = ("__extra__", "__archive__"))
 
@@ -457,7 +490,8 @@ class Asset:
                 old_info = existing_info.data
                 break
             else:
-                return id, cls.default(id_path)
+                asset = cls.default(id_path)
+                return asset.id, asset
 
         zips = files.get_by_type("zip")
         if zips:
@@ -493,7 +527,7 @@ class Asset:
                 if info:
                     break
         
-        if not info and asset_parser.seven_z:
+        if not info:
             for sbsar in files.get_by_type("sbsar"):
                 is_ok, result = asset_parser.get_info_from_sbsar(str(sbsar))
                 if is_ok:
@@ -532,8 +566,7 @@ class Asset:
         asset.save(info)
         asset.standardize_info()
         
-        id = id.lower()
-        return id, asset
+        return asset.id, asset
 
     @classmethod
     def new(cls, path: typing.Union[str, os.DirEntry, utils.PseudoDirEntry], exist_ok = False): # type: (typing.Union[str, os.DirEntry, utils.PseudoDirEntry], bool) -> Asset
@@ -654,7 +687,7 @@ class Asset:
             return None
 
         for file in [item for item in os.scandir(self.gallery) if item.is_file() and item.name.lower().endswith(tuple(utils.IMAGE_EXTENSIONS))]:
-            with pillow_image.open(file.path) as image:
+            with image_utils.pillow_image.open(file.path) as image:
                 icon_path = image_utils.save_as_icon(image, self.path)
                 self.icon = icon_path
                 return icon_path
@@ -744,8 +777,13 @@ class Asset:
                 return True
         return False
 
-    @utils.synchronized
+    @property
+    def has_icon_source(self):
+        """ A `.blend` or images to render an icon from. """
+        return self.is_blend or bool(self.get_images())
+
     def get_web_info(self, context):
+        """ The lock is only held for the save, not for the request. """
         url = self.info.get("url")
         if not url:
             return "No url."
@@ -766,12 +804,247 @@ class Asset:
     def mtime(self):
         return max(os.path.getmtime(self.json_path), os.path.getmtime(self.path))
 
+REMOTE_ASSET_INDEX = utils.File_Index("__asset__.json")
+
+ICON_RENDER_POOL = bl_utils.Icon_Render_Pool()
+
+ICON_CACHE_PATH = os.path.join(utils.DIR_PATH, '__icon_cache__')
+ICON_CACHE_MAX_FILES = 4096
+
+def get_icon_render_digest(jobs: dict) -> str:
+    """
+    A digest of everything an icon render depends on: the renderer script and scene, the file hashes and the job settings. \n
+    The paths themselves are not included, so an identical asset in another folder gets the same digest.
+    """
+
+    hashes = {}
+    def get_hash(path):
+        hash = hashes.get(path)
+        if not hash:
+            hash = hashes[path] = utils.get_file_hash(path)
+        return hash
+
+    key = {
+        'renderer': [get_hash(utils.get_script('render_icon.py')), get_hash(utils.get_script('render_icon.blend'))],
+        'quality': jobs.get('quality', 'FINAL'),
+        'type_definer_config': jobs.get('type_definer_config'),
+        'materials': [{
+            'files': [(os.path.basename(file), get_hash(file)) for file in job['files']],
+            'invert_normal_y': {os.path.basename(file): value for file, value in job['invert_normal_y'].items()},
+            'displacement_scale': round(job['displacement_scale'], 6)
+        } for job in jobs.get('materials', [])],
+        'objects': [get_hash(job['filepath']) for job in jobs.get('objects', [])]
+    }
+
+    return hashlib.sha256(json.dumps(key, sort_keys = True).encode()).hexdigest()
+
+def get_cached_icon(digest: str):
+    """ A hit updates the icon's mtime, the least recently used icons are evicted first. """
+    path = os.path.join(ICON_CACHE_PATH, digest + '.png')
+    try:
+        os.utime(path)
+    except OSError:
+        return None
+    return path
+
+def cache_icon(digest: str, icon_path: str):
+    os.makedirs(ICON_CACHE_PATH, exist_ok = True)
+    path = os.path.join(ICON_CACHE_PATH, digest + '.png')
+    temp_path = path + f'.{threading.get_ident()}.tmp'
+    shutil.copyfile(icon_path, temp_path)
+    os.replace(temp_path, path)
+
+    files = []
+    for file in os.scandir(ICON_CACHE_PATH):
+        try:
+            files.append((file.stat().st_mtime, file.path))
+        except FileNotFoundError: # evicted by another render thread
+            pass
+
+    if len(files) > ICON_CACHE_MAX_FILES:
+        files.sort()
+        for mtime, path in files[:len(files) - ICON_CACHE_MAX_FILES]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+class Icon_Render_Job:
+
+    STATUS_ICONS = {
+        'QUEUED': 'SORTTIME',
+        'RUNNING': 'RENDER_STILL',
+        'DONE': 'CHECKMARK',
+        'FAILED': 'ERROR',
+        'CANCELLED': 'CANCEL',
+        'SKIPPED': 'FORWARD'
+    }
+
+    def __init__(self, asset_data: 'AssetData', id: str, context, quality = 'FINAL'):
+        self.asset_data = asset_data
+        self.id = id
+        self.context = context
+        self.quality = quality
+
+        self.status = 'QUEUED'
+        self.error: str = None
+        self.cancel_token = bl_utils.Cancel_Token()
+
+    @property
+    def is_finished(self):
+        return self.status in ('DONE', 'FAILED', 'CANCELLED', 'SKIPPED')
+
+    @property
+    def icon(self):
+        return self.STATUS_ICONS[self.status]
+
+    def cancel(self):
+        if self.is_finished:
+            return
+        self.cancel_token.cancel()
+        if self.status == 'QUEUED':
+            self.status = 'CANCELLED'
+
+
+class Icon_Render_Queue:
+    """
+    Renders icons in the background, one asset per job. \n
+    Runs as many jobs at once as there are icon render workers, the rest waits in the queue. Jobs can be cancelled, errors are kept in the jobs. \n
+    With `quality_mode` `PROGRESSIVE` the icons are rendered as drafts first and refined to the final quality when no other jobs are queued.
+    """
+
+    def __init__(self, pool: bl_utils.Icon_Render_Pool, max_finished = 50):
+        self.pool = pool
+        self.max_finished = max_finished
+        self.quality_mode = 'FINAL'
+
+        self.lock = threading.Lock()
+        self.jobs: typing.List[Icon_Render_Job] = []
+        self.queue: typing.Deque[Icon_Render_Job] = collections.deque()
+        self.refine_queue: typing.Deque[Icon_Render_Job] = collections.deque()
+        self.number_of_threads = 0
+        self.was_running = False
+
+    @utils.synchronized
+    def submit(self, asset_data: 'AssetData', ids: typing.Iterable[str], context, quality: str = None) -> typing.List[Icon_Render_Job]:
+        """ `quality`: `DRAFT` or `FINAL`, by `quality_mode` if `None` """
+
+        if not quality:
+            quality = 'DRAFT' if self.quality_mode == 'PROGRESSIVE' else 'FINAL'
+
+        pending = {job.id for job in self.jobs if not job.is_finished}
+
+        new_jobs = []
+        for id in ids:
+            if id in pending:
+                continue
+            job = Icon_Render_Job(asset_data, id, context, quality)
+            new_jobs.append(job)
+            self.jobs.append(job)
+            self.queue.append(job)
+
+        finished = [job for job in self.jobs if job.is_finished]
+        for job in finished[:max(0, len(finished) - self.max_finished)]:
+            self.jobs.remove(job)
+
+        if not new_jobs:
+            return new_jobs
+
+        while self.number_of_threads < min(len(self.pool.workers), len(self.queue) + len(self.refine_queue)):
+            self.number_of_threads += 1
+            threading.Thread(target = self.run, daemon = True).start()
+
+        return new_jobs
+
+    @utils.synchronized
+    def get_next(self) -> typing.Optional[Icon_Render_Job]:
+        for queue in (self.queue, self.refine_queue):
+            while queue:
+                job = queue.popleft()
+                if job.status == 'QUEUED':
+                    job.status = 'RUNNING'
+                    return job
+
+        self.number_of_threads -= 1
+        return None
+
+    def run(self):
+        while True:
+            job = self.get_next()
+            if not job:
+                return
+
+            try:
+                quality = job.asset_data.render_icon(job.id, job.context, job.cancel_token, job.quality)
+                job.status = 'DONE' if quality else 'SKIPPED'
+                if quality == 'DRAFT':
+                    self.add_refine_job(job)
+            except bl_utils.Render_Cancelled:
+                job.status = 'CANCELLED'
+            except Exception as e:
+                import traceback
+                traceback.print_exc()
+                job.status = 'FAILED'
+                job.error = str(e)
+                print(f"The icon render for the asset '{job.id}' has failed: {e}")
+
+    @utils.synchronized
+    def add_refine_job(self, draft_job: Icon_Render_Job):
+        job = Icon_Render_Job(draft_job.asset_data, draft_job.id, draft_job.context, 'FINAL')
+        self.jobs.append(job)
+        self.refine_queue.append(job)
+
+    def get_jobs(self):
+        with self.lock:
+            return list(self.jobs)
+
+    def get_counts(self) -> typing.Dict[str, int]:
+        return collections.Counter(job.status for job in self.get_jobs())
+
+    def cancel(self, id: str = None):
+        """ Cancel the job of the asset `id` or all the jobs if `None`. """
+        for job in self.get_jobs():
+            if id is None or job.id == id:
+                job.cancel()
+
+    @utils.synchronized
+    def clear_finished(self):
+        self.jobs = [job for job in self.jobs if not job.is_finished]
+
+    def start_redraw(self):
+        """ Call on the main thread, `submit` is also called from the background threads. """
+        if not bpy.app.background and not bpy.app.timers.is_registered(self.redraw):
+            bpy.app.timers.register(self.redraw, first_interval = 0.5, persistent = True)
+
+    def stop_redraw(self):
+        if bpy.app.timers.is_registered(self.redraw):
+            bpy.app.timers.unregister(self.redraw)
+
+    def redraw(self):
+        """ Redraw the sidebar while the jobs are running and once after. """
+        is_running = bool(self.number_of_threads)
+        if is_running or self.was_running:
+            for window in bpy.context.window_manager.windows:
+                for area in window.screen.areas:
+                    if area.type == 'VIEW_3D':
+                        for region in area.regions:
+                            if region.type == 'UI':
+                                region.tag_redraw()
+
+        self.was_running = is_running
+        return 0.5
+
+ICON_RENDER_QUEUE = Icon_Render_Queue(ICON_RENDER_POOL)
+
+
 class AssetData(typing.Dict[str, Asset], dict):
 
     def __init__(self, library: str = None, auto: str = None, background = bpy.app.background):
 
         self.library: str = None
         self.auto: str = None
+        self.remote_roots: typing.List[str] = []
         if library:
             self.check_path(library, 'library')
         if auto:
@@ -804,6 +1077,17 @@ class AssetData(typing.Dict[str, Asset], dict):
 
         print(f"No valid {type} path is specified.")
 
+    def set_remote_roots(self, remote_roots: str):
+        """ `remote_roots`: folders separated by `;` to search for the remote assets, the config's `remote_roots` list if empty """
+
+        roots = [root.strip() for root in remote_roots.split(';') if root.strip()]
+        if not roots:
+            config = utils.read_local_file("config.json")
+            if config:
+                roots = config.get('remote_roots', [])
+
+        self.remote_roots = [root for root in roots if os.path.isdir(root)]
+
     def __setitem__(self, key: str, value: Asset):
         dict.__setitem__(self, key.lower(), value)
         self.asset_paths.add(value.path)
@@ -825,6 +1109,7 @@ class AssetData(typing.Dict[str, Asset], dict):
         addon_preferences = context.preferences.addons[__package__].preferences
         self.check_path(addon_preferences.library_path, 'library')
         self.check_path(addon_preferences.auto_path, 'auto')
+        self.set_remote_roots(addon_preferences.remote_roots)
 
         if not self.library:
             return
@@ -848,39 +1133,79 @@ class AssetData(typing.Dict[str, Asset], dict):
         
         self.clear()
         
-        global json_reading_time
-        json_reading_time = 0
-        
-        for folder in bl_utils.iter_with_progress(list(os.scandir(self.library)), prefix='Loading Assets'):
-            if folder.is_dir():
-                self[folder.name] = Asset.default(folder)
+        with utils.PROFILER.span('library scan', force = True) as span:
+            for folder in bl_utils.iter_with_progress(list(os.scandir(self.library)), prefix='Loading Assets'):
+                if folder.is_dir():
+                    self[folder.name] = Asset.default(folder)
                 
-        print(f"atool JSON reading time:\t {json_reading_time:.2f} sec")
+        print(f"atool JSON reading time:\t {span.counters.get('json reading time', 0):.2f} sec")
 
         self.update_search(context)
 
     @utils.synchronized
-    def update_auto(self, context = None):
+    def update_auto(self, context = None, max_workers = 4, search_update_interval = 2):
+        """
+        Import the items of the auto folder concurrently. \n
+        The extraction, the web requests and the file moves of each item run in a worker, a failed item is reported and skipped.
+        The lock is held for the whole scan and batch, the workers do not use it.
+        The assets are added as they are imported, the search is updated at most every `search_update_interval` seconds. \n
+        `return`: a dictionary of the failed items to the error messages
+        """
         if not self.auto:
-            return
+            return {}
+
+        import concurrent.futures
+
+        files = [file for file in os.scandir(self.auto) if not file.name.lower().endswith(utils.URL_EXTENSIONS)]
+
+        failures = {}
+        last_search_update = time.perf_counter()
+        with concurrent.futures.ThreadPoolExecutor(max_workers = max_workers) as executor:
+            futures = {executor.submit(Asset.auto, file, self.library): file for file in files}
+            for future in bl_utils.iter_with_progress(concurrent.futures.as_completed(futures), prefix='Auto Importing Assets', total = len(futures)):
+                file = futures[future]
+                try:
+                    id, asset = future.result()
+                except Exception as e:
+                    failures[file.name] = f"{type(e).__name__}: {e}"
+                    print(f"Cannot auto import: {file.path}")
+                    import traceback
+                    traceback.print_exception(type(e), e, e.__traceback__)
+                    continue
 
-        for file in bl_utils.iter_with_progress(list(os.scandir(self.auto)), prefix='Auto Importing Assets'):
-            if not file.name.lower().endswith(utils.URL_EXTENSIONS):
-                id, asset = Asset.auto(file, self.library)
                 self[id] = asset
 
+                if time.perf_counter() - last_search_update > search_update_interval:
+                    self.update_search(context)
+                    last_search_update = time.perf_counter()
+
+        if failures:
+            print(f"Failed to auto import {len(failures)} of {len(files)} items:")
+            for name, message in failures.items():
+                print('\t', name, '-', message)
+
         self.update_search(context)
+        return failures
 
-    @utils.timeit(text = 'atool remote assets import time')
-    def update_remote(self, context = None):
+    def get_remote_asset_files(self) -> typing.List[str]:
+        """ From the `remote_roots` index if the roots are set, otherwise from Everything. """
+
+        if self.remote_roots:
+            with utils.PROFILER.span('remote index update'):
+                return REMOTE_ASSET_INDEX.update(self.remote_roots)
 
         if not utils.EVERYTHING.is_available:
-            print("Everything.exe is not available. Remote asset won't load.")
-            return
+            print(f"Everything.exe is not available and no remote roots are set. Remote asset won't load. {utils.EVERYTHING.error_text}")
+            return []
+
+        return utils.EVERYTHING.get_everything("*" + os.sep + "__asset__.json")
+
+    @utils.timeit(text = 'atool remote assets import time')
+    def update_remote(self, context = None):
 
         re_recycle = re.compile(r'.:\\\$Recycle', flags = re.IGNORECASE)
 
-        for file in utils.EVERYTHING.get_everything("*" + os.sep + "__asset__.json"):
+        for file in self.get_remote_asset_files():
 
             if re_recycle.match(file):
                 print(f'фу, бяка: {file}')
@@ -901,6 +1226,7 @@ class AssetData(typing.Dict[str, Asset], dict):
         self.re_bad_id_string = re.compile(r"^[a-zA-Z0-9]+$" , flags=re.IGNORECASE)
         self.re_query_fragment = re.compile(r'\S+".+?"|\S+', flags=re.IGNORECASE)
 
+    @utils.PROFILER.profile('search')
     def get_result(self, query):
         """ See the `at_search: bpy.props.StringProperty` definition"""
         
@@ -1131,7 +1457,7 @@ class AssetData(typing.Dict[str, Asset], dict):
 
         self[id] = asset
 
-        threading.Thread(target=self.render_icon, args=(id, context)).start()
+        ICON_RENDER_QUEUE.submit(self, [id], context)
 
         update_search(context.window_manager, context)
 
@@ -1171,7 +1497,7 @@ class AssetData(typing.Dict[str, Asset], dict):
 
         self[id] = asset
 
-        threading.Thread(target=self.render_icon, args=(id, context)).start()
+        ICON_RENDER_QUEUE.submit(self, [id], context)
 
         update_search(context.window_manager, context)
 
@@ -1253,7 +1579,8 @@ class AssetData(typing.Dict[str, Asset], dict):
         if result:
             self[id].reload_preview(context)
 
-    def render_icon(self, id, context):
+    def get_icon_render_jobs(self, id, context) -> dict:
+        """ Get `scripts/render_icon.py` jobs for the asset, empty if nothing to render. """
 
         jobs = {}
 
@@ -1316,19 +1643,94 @@ class AssetData(typing.Dict[str, Asset], dict):
                 jobs['type_definer_config'] = type_definer_config.dict
                 jobs['materials'] = [job]
 
-        if not jobs:
-            return
+        return jobs
+
+    @utils.PROFILER.profile('icon render')
+    def render_icon(self, id, context, cancel_token: bl_utils.Cancel_Token = None, quality = 'FINAL') -> typing.Optional[str]:
+        """
+        Render the icon of the asset with an icon render worker, blocks until done. \n
+        The icon is taken from the icon cache if the render inputs are the same. \n
+        `quality`: `DRAFT` or `FINAL`, returns the quality of the resulting icon as a cached final icon is used for a draft, `None` if the asset has nothing to render
+        """
 
-        jobs_path = utils.ensure_unique_path(os.path.join(bpy.app.tempdir, 'atool_icon_render_jobs.json'))
-        with open(jobs_path, 'w', encoding='utf-8') as jobs_file:
-            json.dump(jobs, jobs_file, indent = 4, ensure_ascii = False)
+        asset = self[id]
 
-        render_icon = utils.get_script('render_icon.py')
-        argv = ['-jobs_path', f'"{jobs_path}"' if " " in jobs_path else jobs_path]
-        bl_utils.run_blender(script = render_icon, argv = argv, use_atool=True, library_path=self.library, stdout = subprocess.DEVNULL)
+        jobs = self.get_icon_render_jobs(id, context)
+        if not jobs:
+            print(f"The asset '{id}' has nothing to render, skipped.")
+            return None
+
+        qualities = ('FINAL', 'DRAFT') if quality == 'DRAFT' else ('FINAL',)
+        for cached_quality in qualities:
+            jobs['quality'] = cached_quality
+            cached_icon = get_cached_icon(get_icon_render_digest(jobs))
+            if cached_icon:
+                shutil.copyfile(cached_icon, asset.icon)
+                print(f"The icon for the asset '{id}' is taken from the cache.")
+                asset.reload_preview(context)
+                return cached_quality
+
+        jobs['quality'] = quality
+        ICON_RENDER_POOL.render(jobs, cancel_token)
+        if os.path.exists(asset.icon):
+            cache_icon(get_icon_render_digest(jobs), asset.icon)
+        print(f"An icon for the asset '{id}' has been updated.")
 
-        print(f"An icon for the asset '{asset.id}' has been updated.")
         asset.reload_preview(context)
+        return quality
+
+    def get_ids_without_icon(self):
+        """ The assets without an icon that have something to render it from. """
+        return [asset.id for asset in self.values() if not os.path.exists(asset.icon) and asset.has_icon_source]
+
+    def render_missing_icons(self, context):
+        return ICON_RENDER_QUEUE.submit(self, self.get_ids_without_icon(), context)
+
+    def get_ids_with_url(self, query: str = None):
+        """ `query`: a search query to limit the assets, all the assets if `None` """
+        assets = self.get_result(query) if query else self.values()
+        return [asset.id for asset in assets if asset.info.get("url")]
+
+    def update_web_info(self, ids: typing.Iterable[str], context = None, max_workers = 8) -> typing.Dict[str, str]:
+        """
+        Get the info for the assets from their urls concurrently. \n
+        The requests per host are limited by `asset_parser.HTTP`, each asset is saved once when its info is fetched. \n
+        `return`: a dictionary of the failed ids to the error messages
+        """
+        import concurrent.futures
+
+        assets = [self[id] for id in ids if id in self]
+
+        def fetch(asset: Asset):
+            is_ok, result = asset_parser.get_web(asset.info["url"])
+            if is_ok:
+                asset.save(result)
+            return is_ok, result
+
+        failures = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers = max_workers) as executor:
+            futures = {executor.submit(fetch, asset): asset for asset in assets}
+            for future in bl_utils.iter_with_progress(concurrent.futures.as_completed(futures), prefix = 'Getting Web Info', total = len(futures)):
+                asset = futures[future]
+                try:
+                    is_ok, result = future.result()
+                except Exception as e:
+                    is_ok, result = False, f"{type(e).__name__}: {e}"
+                if not is_ok:
+                    failures[asset.id] = str(result)
+
+        print(f"The info has been updated for {len(assets) - len(failures)} of {len(assets)} assets.")
+        if failures:
+            print(f"Failed {len(failures)}:")
+            for id, message in failures.items():
+                print('\t', id, '-', message.strip().splitlines()[0] if message.strip() else message)
+
+        if context:
+            context.window_manager.current_browser_asset_id = ''
+            update_search(context.window_manager, context)
+
+        return failures
+
 
     def is_sub_asset(self, path):
         path = bl_utils.abspath(path)
@@ -1401,7 +1803,7 @@ class AssetData(typing.Dict[str, Asset], dict):
         asset.save()
         self[asset.id] = asset
 
-        threading.Thread(target=self.render_icon, args=(asset.id, context)).start()
+        ICON_RENDER_QUEUE.submit(self, [asset.id], context)
 
         update_search(context.window_manager, context)
 
@@ -6,11 +6,7 @@ import os
 import sqlite3
 import typing
 
-
-import numpy as np
 from cached_property import cached_property
-from PIL import Image as pillow_image
-from PIL import ImageGrab
 
 log = logging.getLogger("atool")
 
@@ -33,7 +29,11 @@ else:
     set_OPENCV_IO_ENABLE_OPENEXR()
     import type_definer
 
-import cv2 as cv
+# imported on the first use to keep the addon start fast
+np = utils.Lazy_Module('numpy')
+cv = utils.Lazy_Module('cv2')
+pillow_image = utils.Lazy_Module('PIL.Image')
+ImageGrab = utils.Lazy_Module('PIL.ImageGrab')
 
 FILE_PATH = os.path.dirname(os.path.realpath(__file__))
 CASHE_PATH = os.path.join(FILE_PATH, "__cache__.db")
@@ -172,6 +172,7 @@ class Image:
         return utils.get_file_hash(self.path)
 
     @cached_property
+    @utils.PROFILER.profile('image load')
     def image(self):
         if self.extension in (".tga",):
             with pillow_image.open(self.path) as pil_image:
@@ -242,6 +243,7 @@ class Image:
     def aspect_ratio(self):
         return self.shape[0]/self.shape[1]
         
+    @utils.PROFILER.profile('image pre process')
     def pre_process(self, no_height = False):
 
         self.aspect_ratio
@@ -315,6 +317,7 @@ class Image:
         return image
 
 
+    @utils.PROFILER.profile('image dominant color')
     def get_dominant_color(self, channel: str):  
         dominant_color = self.dominant_color.get(channel)
         if dominant_color:
@@ -354,6 +357,7 @@ class Image:
         return image
 
 
+    @utils.PROFILER.profile('image min max')
     def get_min_max(self, channel: str) -> typing.Tuple[float, float]:
         min_max = self.min_max.get(channel)
         if min_max:
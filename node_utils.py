@@ -736,6 +736,22 @@ def get_all_images(node_tree: bpy.types.NodeTree):
             all_images.extend(get_all_images(node.node_tree))
     return all_images
 
+def reset_material(material: bpy.types.Material):
+    """ Make the material's node tree the same as of a new material. """
+
+    material.use_nodes = True
+    material.blend_method = 'OPAQUE'
+
+    nodes = material.node_tree.nodes
+    nodes.clear()
+
+    output = nodes.new('ShaderNodeOutputMaterial')
+    output.location = (300, 300)
+    principled = nodes.new('ShaderNodeBsdfPrincipled')
+    principled.location = (10, 300)
+    material.node_tree.links.new(principled.outputs[0], output.inputs[0])
+
+
 def get_material(
         textures: typing.Union[typing.List[image_utils.Image], typing.List[str]], 
         name = 'New Material',
@@ -743,10 +759,16 @@ def get_material(
         displacement_scale = 0.1,
         invert_normal_y = {},
         use_fake_user = False,
-        type_definer_config = None
+        type_definer_config = None,
+        material: bpy.types.Material = None
     ):
+    """ `material`: a material to reuse, its nodes are replaced """
 
-    material = bpy.data.materials.new(name = name)
+    if material:
+        reset_material(material)
+        material.name = name
+    else:
+        material = bpy.data.materials.new(name = name)
     material.use_nodes = True
     material.use_fake_user = use_fake_user
     material.cycles.displacement_method = 'DISPLACEMENT'
@@ -1610,6 +1632,7 @@ class Material_Node_Tree(Material_Base):
     
 
 MATERIAL_SETTINGS_PATH = os.path.join(FILE_PATH, "material_settings.db")
+SQLITE_MAX_VARIABLES = 999 # SQLITE_MAX_VARIABLE_NUMBER for SQLite < 3.32.0
 
 class Material_Settings_Database:
     def __enter__(self, report: function = None):
@@ -1637,29 +1660,55 @@ class Material_Settings_Database:
         self.connection.close()
         
     def get(self, image_paths: typing.Iterable[str]) -> dict:
-        
+
         image_hashes = [utils.get_file_hash(image_path) for image_path in image_paths]
 
         self.cursor.execute(f"SELECT * FROM settings WHERE id in ({', '.join(['?']*len(image_hashes))})", image_hashes)
         all_image_settings = self.cursor.fetchall()
-        
-        if not all_image_settings:
-            return {}
-        
+
+        return self.merge_settings(json.loads(image_settings[3]) for image_settings in all_image_settings)
+
+    def get_by_hashes(self, hash_sets: typing.Dict[typing.Hashable, typing.Iterable[str]]) -> typing.Dict[typing.Hashable, dict]:
+        """
+        Batched `get` for already hashed images. \n
+        `hash_sets`: a dictionary of a key to image hashes of a material \n
+        `return`: a dictionary of the same keys to material settings, materials without settings are omitted
+        """
+
+        all_hashes = list(set().union(*hash_sets.values()))
+
+        settings_by_hash = {}
+        for index in range(0, len(all_hashes), SQLITE_MAX_VARIABLES):
+            chunk = all_hashes[index:index + SQLITE_MAX_VARIABLES]
+            self.cursor.execute(f"SELECT * FROM settings WHERE id in ({', '.join(['?']*len(chunk))})", chunk)
+            for image_settings in self.cursor.fetchall():
+                settings_by_hash[image_settings[0]] = json.loads(image_settings[3])
+
+        result = {}
+        for key, image_hashes in hash_sets.items():
+            material_settings = self.merge_settings(settings_by_hash[image_hash] for image_hash in image_hashes if image_hash in settings_by_hash)
+            if material_settings:
+                result[key] = material_settings
+
+        return result
+
+    @staticmethod
+    def merge_settings(all_image_settings: typing.Iterable[dict]) -> dict:
+        """ Get the most common value for each setting of the material images. """
+
         material_settings = {}
-        for image_settings in all_image_settings:
-            settings = json.loads(image_settings[3])
+        for settings in all_image_settings:
             for name, value in settings.items():
                 if name not in material_settings.keys():
                     material_settings[name] = [value]
-                else:     
+                else:
                     material_settings[name].append(value)
 
         for key in material_settings.keys():
             material_settings[key] = utils.get_most_common(material_settings[key])
-            
+
         return material_settings
-        
+
     def set(self, image_paths, material_settings: dict):
 
         image_hashes = [utils.get_file_hash(image_path) for image_path in image_paths]
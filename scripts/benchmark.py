@@ -0,0 +1,422 @@
+"""
+Benchmarks for the hot paths that can run outside of Blender.
+
+    python scripts/benchmark.py
+    python scripts/benchmark.py -sizes 1000 10000 -save bench.json
+    python scripts/benchmark.py -baseline bench.json -tolerance 0.25
+    blender -b --factory-startup --python-exit-code 1 --python scripts/benchmark.py -- -sizes 1000 10000 100000
+    blender -b --factory-startup --python scripts/benchmark.py -- -only icon_render -icon_workers 1 2 4 -icon_count 32
+
+Library load and search (`data.AssetData`) need `bpy` and are measured only when run by Blender.
+The icon render throughput is measured only with `-icon_workers` as it starts background Blender processes.
+All synthetic data is generated from `-seed`, so runs with the same arguments are comparable.
+With `-baseline` the exit code is 1 if any median time is slower than the baseline by more than `-tolerance`.
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import statistics
+import string
+import sys
+import tempfile
+import tracemalloc
+import typing
+from timeit import default_timer as timer
+
+ATOOL_PATH = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+import site
+sys.path.append(site.getusersitepackages())
+sys.path.insert(0, ATOOL_PATH)
+
+parser = argparse.ArgumentParser()
+parser.add_argument('-sizes', type=int, nargs='+', default=[1000, 10000], help='Synthetic library sizes')
+parser.add_argument('-texture_size', type=int, default=1024)
+parser.add_argument('-repeat', type=int, default=5)
+parser.add_argument('-seed', type=int, default=0)
+parser.add_argument('-only', nargs='+', default=None, help='Run only benchmarks whose name starts with one of the prefixes')
+parser.add_argument('-save', help='Save the results to a json file')
+parser.add_argument('-baseline', help='Compare the results with a json file saved by -save')
+parser.add_argument('-tolerance', type=float, default=0.25, help='Allowed relative slowdown against the baseline')
+parser.add_argument('-no_memory', action='store_true', help='Do not measure peak memory with tracemalloc')
+parser.add_argument('-icon_workers', type=int, nargs='+', default=None, help='Numbers of icon render workers to measure the throughput for')
+parser.add_argument('-icon_count', type=int, default=16, help='Number of material icons to render per measurement')
+
+if '--' in sys.argv:
+    args = parser.parse_args(sys.argv[sys.argv.index('--') + 1:])
+else:
+    args = parser.parse_args(sys.argv[1:])
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+import utils
+import type_definer
+
+
+WORDS = ['rock', 'cliff', 'moss', 'brick', 'wall', 'wood', 'plank', 'floor', 'metal', 'plate', 'rust', 'concrete', 'asphalt', 'ground', 'forest', 'leaves', 'bark', 'sand', 'gravel', 'tile', 'marble', 'fabric', 'leather', 'paint', 'plaster', 'stone', 'cobblestone', 'dirt', 'mud', 'grass', 'snow', 'ice', 'roof', 'shingle', 'pebble', 'branch', 'trunk', 'boulder', 'rubble', 'debris', 'tree', 'bush', 'flower', 'chair', 'table', 'lamp', 'barrel', 'crate', 'pipe', 'fence']
+HOSTS = ['https://polyhaven.com/a/', 'https://ambientcg.com/view?id=', 'https://quixel.com/megascans/home?assetId=', 'https://www.blendswap.com/blend/', '']
+AUTHORS = ['Quixel Megascans', 'ambientcg', 'Rob Tuytel', 'Dimitrios Savva', 'Adobe', '']
+TYPE_TOKENS = ['Albedo', 'BaseColor', 'diff', 'Diffuse', 'Normal', 'nrm', 'NormalGL', 'Roughness', 'rough', 'Displacement', 'Height', 'disp', 'AO', 'AmbientOcclusion', 'Metallic', 'metalness', 'Opacity', 'Gloss', 'Specular', 'Bump', 'ARM', 'ORM', 'ddna']
+SEARCH_QUERIES = ['', 'rock', 'rock moss', ':i rock moss brick', ':w rocks', 'wood -floor', 'id:asset_0000042', 's:name', ':no_url', ':more_tags']
+
+
+class Result:
+    def __init__(self, name, times, peak = None, count = 1):
+        self.name = name
+        self.times = times
+        self.peak = peak
+        self.count = count
+
+    @property
+    def median(self):
+        return statistics.median(self.times)
+
+    @property
+    def min(self):
+        return min(self.times)
+
+    @property
+    def dict(self):
+        return {'median': self.median, 'min': self.min, 'peak': self.peak, 'count': self.count}
+
+
+results = [] # type: typing.List[Result]
+
+def is_selected(name):
+    return not args.only or name.startswith(tuple(args.only))
+
+def measure(name, func, setup = None, repeat = None, count = 1):
+    """
+    `func`: called with the result of `setup`, only `func` is timed \n
+    `count`: number of items processed by one call, for per item timings
+    """
+    if not is_selected(name):
+        return None
+
+    if repeat is None:
+        repeat = args.repeat
+
+    def prepare():
+        return setup() if setup else None
+
+    func(prepare()) # warm up
+
+    times = []
+    for _ in range(repeat):
+        prepared = prepare()
+        start = timer()
+        func(prepared)
+        times.append(timer() - start)
+
+    peak = None
+    if not args.no_memory:
+        prepared = prepare()
+        tracemalloc.start()
+        func(prepared)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    result = Result(name, times, peak, count)
+    results.append(result)
+    print_result(result)
+    return result
+
+def format_time(seconds):
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.1f} us"
+
+def print_result(result: Result):
+    peak = f"{result.peak / 1024:.0f} KiB" if result.peak is not None else '-'
+    per_item = format_time(result.median / result.count) if result.count > 1 else ''
+    print(f"{result.name:<48} {format_time(result.median):>10} {format_time(result.min):>10} {peak:>12} {per_item:>10}")
+
+
+def get_name(rng: random.Random, words = 3):
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, words)))
+
+def get_info(rng: random.Random, index):
+    name = get_name(rng)
+    host = rng.choice(HOSTS)
+    return {
+        "name": name.title(),
+        "url": host + name.replace(' ', '_') if host else "",
+        "author": rng.choice(AUTHORS),
+        "licence": "CC0",
+        "tags": utils.deduplicate(rng.choice(WORDS) for _ in range(rng.randint(1, 8))),
+        "system_tags": [],
+        "system_tags_mtime": 0,
+        "ctime": 1600000000 + index
+    }
+
+def get_texture_names(rng: random.Random, number):
+    names = []
+    for _ in range(number):
+        asset = rng.choice(('_', '-', '')).join(word.title() for word in get_name(rng).split())
+        asset_id = ''.join(rng.choice(string.ascii_lowercase) for _ in range(6))
+        resolution = rng.choice(('1K', '2K', '4K', '8K'))
+        for token in rng.sample(TYPE_TOKENS, 4):
+            names.append(f"{asset}_{asset_id}_{resolution}_{token}")
+    return names
+
+
+def bench_utils(temp_dir):
+    rng = random.Random(args.seed)
+
+    small = os.path.join(temp_dir, 'small.bin')
+    large = os.path.join(temp_dir, 'large.bin')
+    with open(small, 'wb') as file:
+        file.write(rng.getrandbits(128 * 1024 * 8).to_bytes(128 * 1024, 'little'))
+    with open(large, 'wb') as file:
+        file.write(rng.getrandbits(8 * 1024 * 1024 * 8).to_bytes(8 * 1024 * 1024, 'little'))
+
+    measure('utils.get_file_hash small', lambda _: [utils.get_file_hash(small) for _ in range(100)], count = 100)
+    measure('utils.get_file_hash large', lambda _: [utils.get_file_hash(large) for _ in range(100)], count = 100)
+
+    texture_names = get_texture_names(rng, 100)
+    name_sets = [texture_names[index:index + 4] for index in range(0, len(texture_names), 4)]
+    object_names = [[f"{get_name(rng).replace(' ', '_')}.{index:03d}" for index in range(count)] for count in (2, 8, 32)]
+
+    measure('utils.get_longest_substring stems', lambda _: [utils.get_longest_substring(names) for names in name_sets], count = len(name_sets))
+    measure('utils.get_longest_substring prefix', lambda _: [utils.get_longest_substring(names, from_beginning = True) for names in name_sets], count = len(name_sets))
+    for names in object_names:
+        measure(f'utils.get_longest_substring {len(names)} objects', lambda _, names = names: utils.get_longest_substring(names))
+
+    words = [rng.choice(WORDS) + rng.choice(('', 's', 'es')) for _ in range(10000)]
+
+    def clear_inflection_cache():
+        utils.cache_pluralize.clear()
+        utils.cache_singularize.clear()
+
+    measure('utils.pluralize cold', lambda _: [utils.pluralize(word) for word in words], setup = clear_inflection_cache, count = len(words))
+    measure('utils.singularize cold', lambda _: [utils.singularize(word) for word in words], setup = clear_inflection_cache, count = len(words))
+    measure('utils.singularize warm', lambda _: [utils.singularize(word) for word in words], count = len(words))
+
+    megascan_like = {
+        'id': 'vlzpfc',
+        'meta': [{'key': key, 'value': f"{rng.random():.2f} m"} for key in ('length', 'width', 'height', 'scanArea')],
+        'components': [{'type': token, 'uris': [{'resolutions': [{'resolution': resolution, 'formats': [{'physicalSize': '2x2 m', 'mimeType': 'image/jpeg', 'uri': f"{token}_{resolution}.jpg"}]} for resolution in ('1K', '2K', '4K', '8K')]}]} for token in TYPE_TOKENS],
+        'tags': [rng.choice(WORDS) for _ in range(50)],
+    }
+    measure('utils.locate_item value', lambda _: utils.locate_item(megascan_like, 'ORM_4K.jpg'))
+    measure('utils.locate_item key', lambda _: utils.locate_item(megascan_like, 'physicalSize', is_dict_key = True, return_as = 'data'))
+    measure('utils.locate_item key and value', lambda _: utils.locate_item(megascan_like, ('resolution', '8K'), return_as = 'parent'))
+
+
+def bench_type_definer():
+    rng = random.Random(args.seed)
+    names = get_texture_names(rng, 250)
+
+    measure('type_definer.get_type', lambda _: [type_definer.get_type(name) for name in names], count = len(names))
+
+    config = type_definer.Filter_Config()
+    config.is_strict = False
+    measure('type_definer.get_type not strict', lambda _: [type_definer.get_type(name, config) for name in names], count = len(names))
+
+    def with_prefix(_):
+        for index in range(0, len(names), 4):
+            config = type_definer.Filter_Config()
+            config.set_common_prefix(names[index:index + 4])
+            for name in names[index:index + 4]:
+                type_definer.get_type(name, config)
+
+    measure('type_definer.get_type with common prefix', with_prefix, count = len(names))
+
+
+def bench_image_utils(temp_dir):
+    import numpy
+    import cv2 as cv
+    import image_utils
+
+    generator = numpy.random.default_rng(args.seed)
+    size = args.texture_size
+
+    gradient = numpy.linspace(0, 1, size, dtype = numpy.float32)
+    gradient = numpy.add.outer(gradient, gradient) / 2
+
+    textures = {
+        'albedo': (numpy.dstack([gradient * 200, gradient * 150, gradient * 100]) + generator.integers(0, 40, (size, size, 3))).astype(numpy.uint8),
+        'normal': numpy.dstack([numpy.full((size, size), 255), generator.integers(100, 156, (size, size)), generator.integers(100, 156, (size, size))]).astype(numpy.uint8),
+        'roughness': (gradient * 180 + generator.integers(0, 60, (size, size))).astype(numpy.uint8),
+        'displacement': (gradient * 60000 + generator.integers(0, 5000, (size, size))).astype(numpy.uint16),
+    }
+
+    paths = {}
+    for type, texture in textures.items():
+        path = os.path.join(temp_dir, f"Synthetic_Texture_{size}_{type}.png")
+        cv.imwrite(path, texture)
+        paths[type] = path
+
+    def new_images():
+        return {type: image_utils.Image(path) for type, path in paths.items()}
+
+    def load(images):
+        for image in images.values():
+            image.image
+
+    def loaded_images():
+        images = new_images()
+        load(images)
+        return images
+
+    measure(f'image_utils.Image load {size}px', load, setup = new_images, count = len(paths))
+    measure(f'image_utils.Image hash {size}px', lambda images: [image.hash for image in images.values()], setup = new_images, count = len(paths))
+    measure(f'image_utils.Image type', lambda images: [image.type for image in images.values()], setup = new_images, count = len(paths))
+    measure(f'image_utils.Image get_min_max {size}px', lambda images: [images[type].get_min_max(channel) for type, channel in (('roughness', 'RGB'), ('displacement', 'RGB'), ('albedo', 'R'))], setup = loaded_images, count = 3)
+    measure(f'image_utils.Image get_dominant_color {size}px', lambda images: [images[type].get_dominant_color('RGB') for type in ('albedo', 'roughness')], setup = loaded_images, count = 2)
+    measure(f'image_utils.Image pre_process {size}px', lambda images: [image.pre_process() for image in images.values()], setup = loaded_images, count = len(paths))
+
+
+def create_library(path, size):
+    rng = random.Random(args.seed)
+    for index in range(size):
+        folder = os.path.join(path, f"asset_{index:07d}")
+        os.mkdir(folder)
+        with open(os.path.join(folder, '__info__.json'), 'w', encoding = 'utf-8') as file:
+            json.dump(get_info(rng, index), file, indent = 4, ensure_ascii = False)
+
+def bench_data(temp_dir):
+
+    if not bpy:
+        print("bpy is not available, library benchmarks are skipped. Run with: blender -b --factory-startup --python scripts/benchmark.py --")
+        return
+
+    import data
+
+    for size in args.sizes:
+
+        if not any(is_selected(name) for name in (f'data.AssetData.update_library {size}', f'data.AssetData.get_result {size}')):
+            continue
+
+        library = os.path.join(temp_dir, f"library_{size}")
+        os.mkdir(library)
+        create_library(library, size)
+
+        asset_data = data.AssetData(library = library)
+        asset_data.update_library() # the first load writes the system tags
+
+        measure(f'data.AssetData.update_library {size}', lambda _: asset_data.update_library(), repeat = min(args.repeat, 3), count = size)
+
+        for query in SEARCH_QUERIES:
+            measure(f'data.AssetData.get_result {size} "{query}"', lambda _, query = query: asset_data.get_result(query))
+
+        shutil.rmtree(library)
+
+
+def bench_icon_render(temp_dir):
+
+    if not args.icon_workers:
+        return
+
+    if not bpy:
+        print("bpy is not available, icon render benchmarks are skipped.")
+        return
+
+    if not any(is_selected(f'icon_render {number} workers') for number in args.icon_workers):
+        return
+
+    import numpy
+    import cv2 as cv
+    import bl_utils
+
+    generator = numpy.random.default_rng(args.seed)
+    size = 256
+
+    jobs_list = []
+    for index in range(args.icon_count):
+        textures = {
+            'albedo': generator.integers(0, 255, (size, size, 3)),
+            'normal': numpy.dstack([numpy.full((size, size), 255), generator.integers(100, 156, (size, size)), generator.integers(100, 156, (size, size))]),
+            'roughness': generator.integers(0, 255, (size, size)),
+        }
+
+        files = []
+        for type, texture in textures.items():
+            path = os.path.join(temp_dir, f"icon_{index:04d}_{type}.png")
+            cv.imwrite(path, texture.astype(numpy.uint8))
+            files.append(path)
+
+        jobs_list.append({
+            'materials': [{
+                'result_path': os.path.join(temp_dir, f"icon_{index:04d}__icon__.png"),
+                'files': files,
+                'invert_normal_y': {file: False for file in files},
+                'displacement_scale': 0.1
+            }],
+            'type_definer_config': type_definer.Filter_Config().dict
+        })
+
+    for number in args.icon_workers:
+
+        name = f'icon_render {number} workers'
+        if not is_selected(name):
+            continue
+
+        pool = bl_utils.Icon_Render_Pool(number)
+        try:
+            # start the workers
+            list(pool.map(jobs_list[:number]))
+
+            start = timer()
+            errors = [error for index, error in pool.map(jobs_list) if error]
+            time = timer() - start
+        finally:
+            pool.stop()
+
+        for error in errors:
+            print(error)
+
+        result = Result(name, [time], count = len(jobs_list))
+        results.append(result)
+        print_result(result)
+        print(f"{'':<48} {len(jobs_list) / time * 60:>10.1f} icons per minute")
+
+
+def compare(baseline_path):
+    with open(baseline_path, encoding = 'utf-8') as file:
+        baseline = json.load(file) # type: dict
+
+    regressions = []
+    for result in results:
+        base = baseline.get(result.name)
+        if not base:
+            continue
+        ratio = result.median / base['median']
+        if ratio > 1 + args.tolerance:
+            regressions.append((result.name, ratio))
+
+    for name, ratio in regressions:
+        print(f"REGRESSION: {name} is {ratio:.2f} times slower than the baseline.")
+
+    if not regressions:
+        print(f"No regressions against {baseline_path}.")
+
+    return regressions
+
+
+def main():
+    print(f"{'benchmark':<48} {'median':>10} {'min':>10} {'peak':>12} {'per item':>10}")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        bench_utils(temp_dir)
+        bench_type_definer()
+        bench_image_utils(temp_dir)
+        bench_data(temp_dir)
+        bench_icon_render(temp_dir)
+
+    if args.save:
+        with open(args.save, 'w', encoding = 'utf-8') as file:
+            json.dump({result.name: result.dict for result in results}, file, indent = 4, ensure_ascii = False)
+
+    if args.baseline and compare(args.baseline):
+        sys.exit(1)
+
+main()
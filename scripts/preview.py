@@ -9,11 +9,12 @@ import mathutils
 
 parser = argparse.ArgumentParser()
 parser.add_argument('-job')
+parser.add_argument('-server', action='store_true', help='Read jobs as JSON lines from stdin and answer each with a RESULT_PREFIX line until stdin is closed')
 
 args = sys.argv[sys.argv.index('--') + 1:]
 args = parser.parse_args(args)
 
-JOB = json.loads(args.job)
+RESULT_PREFIX = 'ATOOL_RENDER_RESULT '
 
 def get_desktop():
     try:
@@ -34,7 +35,7 @@ def get_world():
     world.node_tree.links.new(sky.outputs[0], background.inputs[0])
     return world
 
-def set_render_settings(scene: bpy.types.Scene):
+def set_render_settings(scene: bpy.types.Scene, JOB: dict):
     scene.render.resolution_x = JOB['resolution']
     scene.render.resolution_y = JOB['resolution']
     scene.render.film_transparent = JOB['use_film_transparent']
@@ -56,49 +57,118 @@ def set_render_settings(scene: bpy.types.Scene):
     except:
         pass
     scene.use_nodes = False
+    scene.render.use_persistent_data = True
 
     if JOB['use_default_world']:
         scene.view_settings.exposure = -3.7
         scene.view_settings.view_transform = 'Filmic'
 
         scene.world = get_world()
-    
-bpy.ops.wm.open_mainfile(filepath=JOB['filepath'], load_ui=False, use_scripts=False, display_file_selector=False)
 
-context = bpy.context
-set_render_settings(context.scene)
 
-for object in bpy.data.objects:
+def open_scene(JOB: dict):
+    """ Load the scene and set what does not change between the previews of it. """
 
-    for modifier in object.modifiers:
-        modifier.show_render = modifier.show_viewport
+    bpy.ops.wm.open_mainfile(filepath=JOB['filepath'], load_ui=False, use_scripts=False, display_file_selector=False)
 
-    object.hide_render = not object.visible_get()
+    context = bpy.context
+    set_render_settings(context.scene, JOB)
 
-    if JOB['is_local_view']:
-        object.hide_render = not object.name in JOB['local_view_objects']
+    for object in bpy.data.objects:
 
-    if JOB['use_default_world']:
-        if object.type == 'LIGHT' and object.data.type == 'SUN':
-            object.hide_render = True
+        for modifier in object.modifiers:
+            modifier.show_render = modifier.show_viewport
+
+        object['atool_is_visible'] = object.visible_get()
+
+    camera_data = bpy.data.cameras.new("Camera")
+
+    camera = bpy.data.objects.new("Camera", camera_data)
+    context.collection.objects.link(camera)
+    context.scene.camera = camera
+
+def update_scene(JOB: dict):
+    """ Apply the view of the job to the loaded scene. """
+
+    context = bpy.context
+    scene = context.scene
+
+    scene.render.resolution_x = JOB['resolution']
+    scene.render.resolution_y = JOB['resolution']
+    scene.render.film_transparent = JOB['use_film_transparent']
+    scene.cycles.samples = JOB['samples']
+
+    local_view_objects = set(JOB['local_view_objects'])
+
+    for object in bpy.data.objects:
+
+        if object == scene.camera:
+            continue
+
+        hide_render = not object.get('atool_is_visible', True)
+
+        if JOB['is_local_view']:
+            hide_render = not object.name in local_view_objects
+
+        if JOB['use_default_world']:
+            if object.type == 'LIGHT' and object.data.type == 'SUN':
+                hide_render = True
+
+        if object.hide_render != hide_render:
+            object.hide_render = hide_render
+
+    camera = scene.camera
+    camera.matrix_world = mathutils.Matrix(JOB['view_matrix'])
+    camera.data.lens = JOB['lens']
+    camera.data.clip_start = JOB['clip_start']
+    camera.data.clip_end = JOB['clip_end']
+
+def render(JOB: dict):
+
+    if 0: # debug
+        filepath = os.path.join(get_desktop(), f"preview_render_test_{time.strftime('%y%m%d_%H%M%S')}.blend")
+        bpy.ops.wm.save_as_mainfile(filepath=filepath)
+
+    bpy.ops.render.render()
+
+    image = bpy.data.images['Render Result']
+    render_path = os.path.join(get_desktop(), time.strftime('%y%m%d_%H%M%S') + '.png')
+    image.save_render(render_path)
+    return render_path
+
+
+def serve():
+    """ Keep the last scene loaded, a job with the same `filepath` only updates the view and renders. """
+
+    loaded_job = None
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
 
-camera_data = bpy.data.cameras.new("Camera")
+        try:
+            JOB = json.loads(line)
 
-camera = bpy.data.objects.new("Camera", camera_data)
-context.collection.objects.link(camera)
-context.scene.camera = camera
+            if not loaded_job or any(JOB[key] != loaded_job[key] for key in ('filepath', 'use_default_world')):
+                open_scene(JOB)
+                loaded_job = JOB
 
-camera.matrix_world = mathutils.Matrix(JOB['view_matrix'])
-camera_data.lens = JOB['lens']
-camera_data.clip_start = JOB['clip_start']
-camera_data.clip_end = JOB['clip_end']
+            update_scene(JOB)
+            result = {'ok': True, 'path': render(JOB)}
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            loaded_job = None
+            result = {'ok': False, 'error': f"{type(e).__name__}: {e}"}
 
-if 0: # debug
-    filepath = os.path.join(get_desktop(), f"preview_render_test_{time.strftime('%y%m%d_%H%M%S')}.blend")
-    bpy.ops.wm.save_as_mainfile(filepath=filepath)
+        print(RESULT_PREFIX + json.dumps(result), flush = True)
 
-bpy.ops.render.render()
 
-image = bpy.data.images['Render Result']
-render_path = os.path.join(get_desktop(), time.strftime('%y%m%d_%H%M%S') + '.png')
-image.save_render(render_path)
\ No newline at end of file
+if args.server:
+    serve()
+else:
+    JOB = json.loads(args.job)
+    open_scene(JOB)
+    update_scene(JOB)
+    render(JOB)
@@ -11,6 +11,7 @@ parser = argparse.ArgumentParser()
 parser.add_argument('-atool_path')
 parser.add_argument('-atool_library_path')
 parser.add_argument('-jobs_path')
+parser.add_argument('-server', action='store_true', help='Read jobs as JSON lines from stdin and answer each with a RESULT_PREFIX line until stdin is closed')
 
 args = sys.argv[sys.argv.index('--') + 1:]
 args = parser.parse_args(args)
@@ -18,11 +19,12 @@ args = parser.parse_args(args)
 ATOOL_PATH = args.atool_path
 ATOOL_LIBRARY = args.atool_library_path
 
-with open(args.jobs_path, encoding='utf-8') as jobs_file:
-    jobs = json.load(jobs_file) # type: dict
+RESULT_PREFIX = 'ATOOL_RENDER_RESULT '
+ICON_SCENE_PATH = os.path.join(ATOOL_PATH, 'scripts', 'render_icon.blend')
+ICON_MATERIAL_NAME = 'atool_icon_material'
+BOUNCES_ATTRIBUTES = ('max_bounces', 'diffuse_bounces', 'glossy_bounces', 'transmission_bounces', 'volume_bounces', 'transparent_max_bounces')
 
-material_jobs = jobs.get('materials')
-object_jobs = jobs.get('objects')
+default_bounces = {} # the opened scene's values, restored for the final quality
 
 
 def get_world():
@@ -63,8 +65,55 @@ def set_render_settings(scene: bpy.types.Scene):
 
     scene.world = get_world()
 
+    default_bounces.clear()
+    default_bounces.update({attribute: getattr(scene.cycles, attribute) for attribute in BOUNCES_ATTRIBUTES if hasattr(scene.cycles, attribute)})
 
-if material_jobs:
+def set_quality(scene: bpy.types.Scene, quality: str):
+    """ `quality`: `DRAFT` for a quick icon to refine later or `FINAL` """
+
+    is_final = quality == 'FINAL'
+
+    # blender 2.92+, stops sampling the flat areas early
+    if hasattr(scene.cycles, 'use_adaptive_sampling'):
+        scene.cycles.use_adaptive_sampling = is_final
+        scene.cycles.adaptive_threshold = 0.05
+        scene.cycles.samples = 16 if is_final else 2
+    else:
+        scene.cycles.samples = 10 if is_final else 2
+
+    # the server keeps the scene between the jobs, so both qualities set the bounces
+    for attribute, value in default_bounces.items():
+        setattr(scene.cycles, attribute, value)
+    if not is_final:
+        scene.cycles.max_bounces = 2
+
+
+def purge_orphans():
+    """ Remove the data blocks without users, repeated as removing a node group can orphan its images. """
+
+    collections = (bpy.data.materials, bpy.data.node_groups, bpy.data.images, bpy.data.textures, bpy.data.meshes, bpy.data.worlds)
+
+    is_removed = True
+    while is_removed:
+        is_removed = False
+        for collection in collections:
+            for block in list(collection):
+                if block.users or block.use_fake_user:
+                    continue
+                if getattr(block, 'type', None) == 'RENDER_RESULT':
+                    continue
+                collection.remove(block)
+                is_removed = True
+
+
+def open_icon_scene():
+    bpy.ops.wm.open_mainfile(filepath=ICON_SCENE_PATH, load_ui=False, use_scripts=False, display_file_selector=False)
+    set_render_settings(bpy.context.scene)
+
+def is_icon_scene_open():
+    return bpy.data.filepath == ICON_SCENE_PATH and 'material_sphere' in bpy.data.objects
+
+def render_material_jobs(material_jobs: list, type_definer_config_dict: dict, quality = 'FINAL'):
 
     import site
     sys.path.append(site.getusersitepackages())
@@ -73,28 +122,40 @@ if material_jobs:
     import node_utils
     import type_definer
 
-    filepath = os.path.join(ATOOL_PATH, 'scripts', 'render_icon.blend')
-    bpy.ops.wm.open_mainfile(filepath=filepath, load_ui=False, use_scripts=False, display_file_selector=False)
+    if not is_icon_scene_open():
+        open_icon_scene()
 
     mat_sphere = bpy.data.objects['material_sphere']
+    set_quality(bpy.context.scene, quality)
 
     type_definer_config = type_definer.Filter_Config()
-    type_definer_config.__dict__.update(jobs['type_definer_config'])
+    type_definer_config.__dict__.update(type_definer_config_dict)
 
-    context = bpy.context
-    set_render_settings(context.scene)
+    # one material is recycled and the job's images are removed after the render to keep the memory flat
+    material = bpy.data.materials.get(ICON_MATERIAL_NAME)
 
     for job in material_jobs:
-        type_definer_config.set_common_prefix_from_paths(job['files'])
-        material = node_utils.get_material(job['files'], use_displacement = True, displacement_scale = job['displacement_scale'], invert_normal_y = job['invert_normal_y'], type_definer_config = type_definer_config)
-        mat_sphere.material_slots[0].material = material
-
-        bpy.ops.render.render()
-
-        image = bpy.data.images['Render Result']
-        image.save_render(job['result_path'])
-
-if object_jobs:
+        images = set(bpy.data.images)
+
+        try:
+            type_definer_config.set_common_prefix_from_paths(job['files'])
+            material = node_utils.get_material(job['files'], name = ICON_MATERIAL_NAME, use_displacement = True, displacement_scale = job['displacement_scale'], invert_normal_y = job['invert_normal_y'], type_definer_config = type_definer_config, material = material)
+            mat_sphere.material_slots[0].material = material
+
+            bpy.ops.render.render()
+
+            image = bpy.data.images['Render Result']
+            image.save_render(job['result_path'])
+        finally:
+            # a failed job must not leave its images and nodes to the next jobs of the server
+            if material:
+                node_utils.reset_material(material)
+            for image in set(bpy.data.images) - images:
+                if image.type != 'RENDER_RESULT':
+                    bpy.data.images.remove(image)
+            purge_orphans()
+
+def render_object_jobs(object_jobs: list, quality = 'FINAL'):
     
     for job in object_jobs:
 
@@ -102,6 +163,7 @@ if object_jobs:
 
         context = bpy.context
         set_render_settings(context.scene)
+        set_quality(context.scene, quality)
 
         coordinates = []
         for object in bpy.data.objects:
@@ -176,4 +238,45 @@ if object_jobs:
         bpy.ops.render.render()
 
         image = bpy.data.images['Render Result']
-        image.save_render(job['result_path'])
\ No newline at end of file
+        image.save_render(job['result_path'])
+
+
+def render_jobs(jobs: dict):
+
+    quality = jobs.get('quality', 'FINAL')
+
+    material_jobs = jobs.get('materials')
+    if material_jobs:
+        render_material_jobs(material_jobs, jobs['type_definer_config'], quality)
+
+    object_jobs = jobs.get('objects')
+    if object_jobs:
+        render_object_jobs(object_jobs, quality)
+
+
+def serve():
+    """ Keep Blender and the icon scene loaded and render the incoming jobs back to back. """
+
+    open_icon_scene()
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            render_jobs(json.loads(line))
+            result = {'ok': True}
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            result = {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+
+        print(RESULT_PREFIX + json.dumps(result), flush = True)
+
+
+if args.server:
+    serve()
+else:
+    with open(args.jobs_path, encoding='utf-8') as jobs_file:
+        render_jobs(json.load(jobs_file))
@@ -1,12 +1,23 @@
+"""
+Renders tiles of the scene's camera view into `-path`, run by `render_worker.py`.
+
+Several processes, local or on other machines sharing the folder, can render the same tiles folder at once:
+a tile is claimed by creating its `.lock` file, a rendered tile is never rendered again, so a failed run can be resumed.
+A lock older than `-lock_timeout` seconds is considered left by a crashed process and the tile is claimed again.
+"""
+
 import bpy
 import os
 import sys
 import argparse
 import json
+import socket
+import time
 
 parser = argparse.ArgumentParser()
 parser.add_argument('-dicing', type=int)
 parser.add_argument('-path')
+parser.add_argument('-lock_timeout', type=float, default=6 * 60 * 60)
 
 args = sys.argv[sys.argv.index('--') + 1:]
 args = parser.parse_args(args)
@@ -46,37 +57,67 @@ else:
     shift_lim_x *= k
 
 camera.lens *= m
-render.resolution_x /= m 
-render.resolution_y /= m
+render.resolution_x = int(render.resolution_x / m)
+render.resolution_y = int(render.resolution_y / m)
+
+os.makedirs(args.path, exist_ok = True)
+
+
+def get_tile_path(row, column):
+    return os.path.join(args.path, f"tile_{row}_{column}.png")
+
+def claim(row, column):
+    lock_path = get_tile_path(row, column) + '.lock'
+
+    try:
+        if time.time() - os.path.getmtime(lock_path) > args.lock_timeout:
+            os.remove(lock_path)
+    except OSError:
+        pass
+
+    try:
+        file = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        return False
+
+    with os.fdopen(file, 'w') as lock_file:
+        lock_file.write(f"{socket.gethostname()} {os.getpid()}")
+
+    # finished by another process between the check and the claim
+    if os.path.exists(get_tile_path(row, column)):
+        os.remove(lock_path)
+        return False
+
+    return True
+
+def render_tile(row, column):
+    # the rows are counted from the top of the image
+    camera.shift_x = -shift_lim_x + column * shift_step_x + m * initial_shift_x
+    camera.shift_y = shift_lim_y - row * shift_step_y + m * initial_shift_y
+
+    bpy.ops.render.render()
+
+    path = get_tile_path(row, column)
+    temp_path = path + f'.{os.getpid()}.tmp.png'
+    bpy.data.images['Render Result'].save_render(temp_path)
+    os.replace(temp_path, path)
+
 
-columns = []
-index = 1
 max_index = m*m
+for index in range(max_index):
+    row, column = divmod(index, m)
+
+    if os.path.exists(get_tile_path(row, column)):
+        continue
+
+    if not claim(row, column):
+        continue
+
+    print('--------------------------')
+    print(f'Part: {index + 1}/{max_index}')
+    print('--------------------------')
 
-x = -shift_lim_x
-while x <= shift_lim_x:
-    camera.shift_x = x  + m * initial_shift_x
-    
-    rows = []
-
-    y = -shift_lim_y
-    while y <= shift_lim_y:
-        camera.shift_y = y + m * initial_shift_y
-        
-        print('--------------------------')
-        print(f'Part: {index}/{max_index}')
-        print('--------------------------')
-        bpy.ops.render.render()
-        image = bpy.data.images['Render Result']
-        path = os.path.join(args.path, f"{y}_{x}.png")
-        rows.append(path)
-        image.save_render(path)
-        
-        index += 1
-        y += shift_step_y
-        
-    columns.append(list(reversed(rows)))
-    x += shift_step_x  
-
-with open(os.path.join(args.path, 'done.json'), 'w', encoding='utf-8') as json_file:
-    json.dump(columns, json_file, indent = 4, ensure_ascii = False)
\ No newline at end of file
+    try:
+        render_tile(row, column)
+    finally:
+        os.remove(get_tile_path(row, column) + '.lock')
@@ -1,9 +1,20 @@
+"""
+Renders a .blend file in `-dicing` × `-dicing` tiles with `-workers` Blender processes and stitches them.
+
+The tiles are kept in `-path`, by default a folder next to the .blend file, so an interrupted or failed render is resumed by running the same command again.
+The tiles of a previous version of the .blend file are discarded, the default folder is removed after a successful stitch.
+Machines sharing the folder can help with:
+    blender -b --factory-startup <file> --python render_partial.py -- -dicing <dicing> -path <path>
+"""
+
 import subprocess
 import os
 import sys
 import argparse
 import tempfile
+import socket
 import json
+import shutil
 
 DIR_PATH = os.path.dirname(__file__)
 
@@ -17,45 +28,219 @@ def get_desktop():
 
 parser = argparse.ArgumentParser()
 parser.add_argument('-blender')
-parser.add_argument('-dicing')
+parser.add_argument('-dicing', type=int)
 parser.add_argument('-file')
+parser.add_argument('-workers', type=int, default=1, help='Number of local Blender processes')
+parser.add_argument('-threads', type=int, default=0, help='Render threads per process, 0 to split the cores between the workers')
+parser.add_argument('-path', help='Tiles folder, shared with other machines for a distributed render')
+parser.add_argument('-retries', type=int, default=2, help='Number of reruns for tiles that failed')
+parser.add_argument('-output', help='Result image path, a time stamped .png on the desktop by default')
 
 args = parser.parse_args(sys.argv[1:])
 
 script = os.path.join(DIR_PATH, 'render_partial.py')
 
-args = [args.blender, '-b', '--factory-startup', args.file, '--python', script, '--', '-dicing', args.dicing]
+tiles_path = args.path
+is_default_tiles_path = not tiles_path
+if is_default_tiles_path:
+    tiles_path = os.path.splitext(args.file)[0] + f'_tiles_{args.dicing}'
+
+threads = args.threads
+if not threads and args.workers > 1:
+    threads = max(1, (os.cpu_count() or 1) // args.workers)
+
+blender_args = [args.blender, '-b', '--factory-startup']
+if threads:
+    blender_args.extend(('--threads', str(threads)))
+blender_args.extend((args.file, '--python', script, '--', '-dicing', str(args.dicing), '-path', tiles_path))
+
+
+def get_missing_tiles():
+    return [(row, column) for row in range(args.dicing) for column in range(args.dicing) if not os.path.exists(os.path.join(tiles_path, f"tile_{row}_{column}.png"))]
+
+def remove_locks(pids):
+    """ Remove the tile locks left by the crashed processes, otherwise `render_partial.py` skips the tiles until `-lock_timeout`. """
+
+    owners = {f"{socket.gethostname()} {pid}" for pid in pids}
+    for row, column in get_missing_tiles():
+        lock_path = os.path.join(tiles_path, f"tile_{row}_{column}.png.lock")
+        try:
+            with open(lock_path) as lock_file:
+                owner = lock_file.read().strip()
+            if owner in owners:
+                os.remove(lock_path)
+        except OSError:
+            pass
+
+def check_source():
+    """ Remove the tiles rendered from another version of the .blend file. """
+
+    stat = os.stat(args.file)
+    source = {'mtime': stat.st_mtime_ns, 'size': stat.st_size}
+    source_path = os.path.join(tiles_path, '__source__.json')
+
+    try:
+        with open(source_path) as source_file:
+            is_same = json.load(source_file) == source
+    except (OSError, ValueError):
+        is_same = False
+
+    if is_same:
+        return
+
+    if os.path.isdir(tiles_path):
+        for file in os.scandir(tiles_path):
+            if file.name.startswith('tile_'):
+                print(f"Removing an outdated tile: {file.path}")
+                os.remove(file.path)
+
+    os.makedirs(tiles_path, exist_ok = True)
+    with open(source_path, 'w') as source_file:
+        json.dump(source, source_file)
+
+check_source()
+
+for attempt in range(args.retries + 1):
+
+    missing_tiles = get_missing_tiles()
+    if not missing_tiles:
+        break
+
+    if attempt:
+        print(f"Rerendering {len(missing_tiles)} failed tiles, attempt {attempt}.")
+
+    number_of_workers = min(args.workers, len(missing_tiles))
+    processes = [subprocess.Popen(blender_args) for _ in range(number_of_workers)]
+    for process in processes:
+        process.wait()
+
+    remove_locks([process.pid for process in processes])
+
+missing_tiles = get_missing_tiles()
+if missing_tiles:
+    print(f"The tiles are not rendered: {missing_tiles}")
+    print(f"Run the same command to resume. The rendered tiles are in: {tiles_path}")
+    input('Press any key to exit...')
+    sys.exit(1)
 
-with tempfile.TemporaryDirectory() as temp_dir:
 
-    args.extend(('-path', temp_dir))
+import site
+sys.path.insert(0, site.getusersitepackages())
 
-    subprocess.run(args, check = True)
+import struct
+import zlib
 
-    with open(os.path.join(temp_dir, 'done.json'), 'r', encoding='utf-8') as json_file:
-        columns = json.load(json_file)
+import cv2 as cv
+import numpy
 
-    import site
-    sys.path.insert(0, site.getusersitepackages())
+def get_image(path):
+    return cv.imread(path, cv.IMREAD_UNCHANGED | cv.IMREAD_ANYCOLOR | cv.IMREAD_ANYDEPTH)
 
-    import cv2 as cv
-    import numpy
+def get_strip(row):
+    """ A full width row of tiles. """
+    return numpy.concatenate([get_image(os.path.join(tiles_path, f"tile_{row}_{column}.png")) for column in range(args.dicing)], axis = 1)
 
-    def get_image(path):
-        return cv.imread(path, cv.IMREAD_UNCHANGED | cv.IMREAD_ANYCOLOR | cv.IMREAD_ANYDEPTH)
 
-    render_columns = []
+class PNG_Strip_Writer:
+    """ Encodes a PNG strip by strip, so only the current strip is held in memory. """
 
-    for image_paths in columns:
-        images = [get_image(path) for path in image_paths]
-        render_columns.append(numpy.concatenate(images, axis=0))
+    COLOR_TYPES = {1: 0, 2: 4, 3: 2, 4: 6} # channels: PNG color type
 
-    render = numpy.concatenate(render_columns, axis=1)
+    def __init__(self, path, width, height, channels, dtype, compress_level = 6):
+        self.file = open(path, 'wb')
+        self.channels = channels
+        self.dtype = numpy.dtype(dtype)
+        self.compressor = zlib.compressobj(compress_level)
 
-    from datetime import datetime
+        bit_depth = self.dtype.itemsize * 8
+        self.file.write(b'\x89PNG\r\n\x1a\n')
+        self.write_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, bit_depth, self.COLOR_TYPES[channels], 0, 0, 0))
 
+    def write_chunk(self, type: bytes, data: bytes):
+        self.file.write(struct.pack('>I', len(data)))
+        self.file.write(type)
+        self.file.write(data)
+        self.file.write(struct.pack('>I', zlib.crc32(type + data) & 0xffffffff))
+
+    def write(self, strip: numpy.ndarray):
+        if self.channels == 3:
+            strip = strip[..., [2, 1, 0]] # BGR to RGB
+        elif self.channels == 4:
+            strip = strip[..., [2, 1, 0, 3]]
+
+        strip = numpy.ascontiguousarray(strip, dtype = self.dtype.newbyteorder('>'))
+
+        height = strip.shape[0]
+        scanlines = numpy.zeros((height, 1 + strip.nbytes // height), dtype = numpy.uint8) # the first byte is the filter type: none
+        scanlines[:, 1:] = strip.view(numpy.uint8).reshape(height, -1)
+
+        data = self.compressor.compress(scanlines.tobytes())
+        if data:
+            self.write_chunk(b'IDAT', data)
+
+    def close(self):
+        self.write_chunk(b'IDAT', self.compressor.flush())
+        self.write_chunk(b'IEND', b'')
+        self.file.close()
+
+
+def stitch_png(path):
+    """ Stream the rows of tiles into a PNG, the peak memory is about one row of tiles. """
+
+    writer = None
+    try:
+        for row in range(args.dicing):
+            strip = get_strip(row)
+
+            if writer is None:
+                height, width = strip.shape[:2]
+                channels = strip.shape[2] if strip.ndim == 3 else 1
+                writer = PNG_Strip_Writer(path, width, height * args.dicing, channels, strip.dtype)
+
+            writer.write(strip)
+            del strip
+    finally:
+        if writer:
+            writer.close()
+
+def stitch(temp_dir):
+    """ Assemble the rows of tiles into a memory-mapped array for the formats that cannot be written by strips. """
+
+    render = None
+    y = 0
+    for row in range(args.dicing):
+        strip = get_strip(row)
+
+        if render is None:
+            shape = (strip.shape[0] * args.dicing,) + strip.shape[1:]
+            render = numpy.lib.format.open_memmap(os.path.join(temp_dir, 'render.npy'), mode = 'w+', dtype = strip.dtype, shape = shape)
+
+        render[y:y + strip.shape[0]] = strip
+        y += strip.shape[0]
+        del strip
+
+    render.flush()
+    return render
+
+
+from datetime import datetime
+
+render_path = args.output
+if not render_path:
     ext ='.png'
     render_path = os.path.join(get_desktop(), f"render_{datetime.now().strftime('%y%m%d_%H%M%S')}{ext}")
-    cv.imwrite(render_path, render)
 
-input('Press any key to exit...')
\ No newline at end of file
+if render_path.lower().endswith('.png'):
+    stitch_png(render_path)
+else:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        render = stitch(temp_dir)
+        cv.imwrite(render_path, render)
+        del render
+
+print(f"The render is saved to: {render_path}")
+
+if is_default_tiles_path:
+    shutil.rmtree(tiles_path, ignore_errors = True)
+
+input('Press any key to exit...')
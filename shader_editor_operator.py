@@ -840,64 +840,102 @@ def load_material_settings(operator, context, node_groups = None, node_trees = N
     node_trees = {node_tree: [] for node_tree in node_trees}
     node_trees.update(utils.list_by_key(node_groups, _operator.attrgetter('node_tree')))
 
-    with node_utils.Material_Settings_Database() as settings_db:
-            
-        for node_tree, groups in node_trees.items():
+    library = context.window_manager.at_asset_data # type: data.AssetData
 
-            material_settings = None
+    hashes = {} # type: typing.Dict[str, str]
+    def get_hash(path):
+        hash = hashes.get(path)
+        if not hash:
+            hashes[path] = hash = utils.get_file_hash(path)
+        return hash
 
-            image_paths = [bl_utils.get_block_abspath(node.image) for node in node_tree.nodes if node.type == 'TEX_IMAGE' and node.image]
-            image_paths = utils.deduplicate(image_paths)
+    settings_by_node_tree = {}
+    hash_set_by_node_tree = {} # type: typing.Dict[bpy.types.ShaderNodeTree, frozenset]
 
-            if not image_paths:
-                operator.report({'INFO'}, f"No image was found in the material: {node_tree.name}")
-                continue
+    for node_tree in node_trees:
 
-            library = context.window_manager.at_asset_data # type: data.AssetData
+        image_paths = [bl_utils.get_block_abspath(node.image) for node in node_tree.nodes if node.type == 'TEX_IMAGE' and node.image]
+        image_paths = utils.deduplicate(image_paths)
 
-            if any(library.is_sub_asset(path) for path in image_paths):
-                asset = utils.get_most_common(library.get_asset_by_path(path) for path in image_paths) # type: data.Asset
+        if not image_paths:
+            operator.report({'INFO'}, f"No image was found in the material: {node_tree.name}")
+            continue
 
-                material_settings = asset.info.get("material_settings")
-                if material_settings:
-                    operator.report({'INFO'}, f"Settings were loaded for the library material: {node_tree.name}. ID: {asset.id}")
-            
-            if not material_settings:
-                material_settings = settings_db.get(image_paths)
-                if material_settings:
-                    operator.report({'INFO'}, f"Settings were loaded from the database for the group: {node_tree.name}")
+        if any(library.is_sub_asset(path) for path in image_paths):
+            asset = utils.get_most_common(library.get_asset_by_path(path) for path in image_paths) # type: data.Asset
 
-            if not material_settings:
-                operator.report({'INFO'}, f"No settings were found for the material: {node_tree.name}")
+            material_settings = asset.info.get("material_settings")
+            if material_settings:
+                settings_by_node_tree[node_tree] = material_settings
+                operator.report({'INFO'}, f"Settings were loaded for the library material: {node_tree.name}. ID: {asset.id}")
                 continue
 
-            inputs = node_tree.inputs
-            for key, value in material_settings.items():
-                node_input = inputs.get(key)
-                if node_input:
-                    node_input.default_value = value
+        hash_set_by_node_tree[node_tree] = frozenset(get_hash(path) for path in image_paths if os.path.exists(path))
 
-            default_settings = bl_utils.backward_compatibility_get(node_tree, ("at_default_settings", "ma_default_settings"))
-            if default_settings:
-                default_settings.update(material_settings)
+    if hash_set_by_node_tree:
+        with node_utils.Material_Settings_Database() as settings_db:
+            settings_by_hash_set = settings_db.get_by_hashes({hash_set: hash_set for hash_set in set(hash_set_by_node_tree.values())})
+
+        for node_tree, hash_set in hash_set_by_node_tree.items():
+            material_settings = settings_by_hash_set.get(hash_set)
+            if material_settings:
+                settings_by_node_tree[node_tree] = material_settings
+                operator.report({'INFO'}, f"Settings were loaded from the database for the group: {node_tree.name}")
             else:
-                node_tree["at_default_settings"] = material_settings
+                operator.report({'INFO'}, f"No settings were found for the material: {node_tree.name}")
 
-            for group in groups:
-                for input_index in range(len(group.inputs)):
-                    group.inputs[input_index].default_value = node_tree.inputs[input_index].default_value
+    for node_tree, material_settings in settings_by_node_tree.items():
+
+        inputs = node_tree.inputs
+        for key, value in material_settings.items():
+            node_input = inputs.get(key)
+            if node_input:
+                node_input.default_value = value
+
+        default_settings = bl_utils.backward_compatibility_get(node_tree, ("at_default_settings", "ma_default_settings"))
+        if default_settings:
+            default_settings.update(material_settings)
+        else:
+            node_tree["at_default_settings"] = material_settings
+
+        for group in node_trees[node_tree]:
+            for input_index in range(len(group.inputs)):
+                group.inputs[input_index].default_value = node_tree.inputs[input_index].default_value
 
     return {'FINISHED'}
 
 
+def get_at_groups_from_scene(operator, context):
+
+    materials = {slot.material for object in context.scene.objects for slot in object.material_slots if slot.material and slot.material.node_tree}
+
+    groups = []
+    for material in materials:
+        groups.extend(node for node in material.node_tree.nodes if node_utils.Material_Node_Tree.is_at_node_tree(node))
+
+    if not groups:
+        operator.report({'INFO'}, "No AT materials found in the scene.")
+
+    return groups
+
+
 class ATOOL_OT_load_material_settings(bpy.types.Operator, Shader_Editor_Poll):
     bl_idname = "atool.load_material_settings"
     bl_label = "Load Material Settings"
     bl_description = "Load material settings for the selected AT material node group"
     bl_options = {'REGISTER', 'UNDO'}
 
+    is_scene_wide: bpy.props.BoolProperty(
+        name="Whole Scene",
+        description="Load the settings for all AT material node groups in the scene instead of the selected ones",
+        default = False
+        )
+
     def execute(self, context):
-        groups = get_at_groups_from_selection(self, context)
+        if self.is_scene_wide:
+            groups = get_at_groups_from_scene(self, context)
+        else:
+            groups = get_at_groups_from_selection(self, context)
         if not groups:
             return {'CANCELLED'}
 
@@ -1394,6 +1432,7 @@ class Modal_Material_Import(Material_Import_Properties):
         config = get_definer_config(context)
         config.set_common_prefix_from_paths(self.image_paths)
         
+        @utils.PROFILER.profile('material import: images preload')
         def job():
             
             def pre_process(images: typing.List[image_utils.Image]):
@@ -1446,6 +1485,7 @@ class Modal_Material_Import(Material_Import_Properties):
         return self.apply_material(context)
 
     
+    @utils.PROFILER.profile('material import: apply')
     def apply_material(self, context: bpy.types.Context):
         
         for image in self.images:
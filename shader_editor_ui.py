@@ -62,4 +62,5 @@ class ATOOL_PT_tools(bpy.types.Panel):
 
         subcolumn = column.column(align=True)
         subcolumn.operator("atool.load_material_settings", text = "Load", icon='PASTEDOWN')
-        subcolumn.operator("atool.save_material_settings", text = "Save", icon='COPYDOWN')
\ No newline at end of file
+        subcolumn.operator("atool.save_material_settings", text = "Save", icon='COPYDOWN')
+        subcolumn.operator("atool.load_material_settings", text = "Load All In Scene", icon='SCENE_DATA').is_scene_wide = True
\ No newline at end of file
@@ -49,7 +49,7 @@ with tempfile.TemporaryDirectory() as temp_dir:
 
     with zipfile.ZipFile(zipfile_path, 'w') as zip_file:
         for file in files_to_pack:
-            if file.name in ("ship.py", "config.json"):
+            if file.name in ("ship.py", "config.json", "__probes__.json", "__file_index__.json"):
                 continue
             elif file.name == "data.blend":
                 zip_file.write(temp_blend, arcname = os.path.join(dir_name, file.name), compress_type = zipfile.ZIP_DEFLATED)
@@ -0,0 +1,111 @@
+"""
+A local HTTP server for the tests of `asset_parser.HTTP_Client` and `asset_parser.Download_Manager`.
+
+The tests run outside of Blender with the addon dependencies installed:
+    python -m unittest discover -s tests
+"""
+
+import http.server
+import re
+import sys
+import threading
+import time
+
+
+class Stub_Handler(http.server.BaseHTTPRequestHandler):
+    """ Keep-alive responses, the connections, the requests and the concurrency are counted by the server. """
+
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, status: int, body: bytes, headers: dict = None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests.append((self.path, dict(self.headers)))
+            self.server.active += 1
+            self.server.max_active = max(self.server.max_active, self.server.active)
+        try:
+            self.server.respond(self)
+        finally:
+            with self.server.lock:
+                self.server.active -= 1
+
+
+class Stub_Server(http.server.ThreadingHTTPServer):
+    """
+    `respond`: `respond(handler)` writes the response, by the default the `files` with `Range` support
+    """
+
+    daemon_threads = True
+
+    def __init__(self, files: dict = None, accepts_ranges = True, respond = None):
+        super().__init__(('127.0.0.1', 0), Stub_Handler)
+        self.files = files or {}
+        self.accepts_ranges = accepts_ranges
+        if respond:
+            self.respond = respond
+
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self.server_address[1]}'
+
+    def respond(self, handler: Stub_Handler):
+        body = self.files.get(handler.path)
+        if body is None:
+            handler.send_body(404, b'Not Found')
+            return
+
+        match = re.match(r'bytes=(\d+)-(\d*)$', handler.headers.get('Range', ''))
+        if not (match and self.accepts_ranges):
+            handler.send_body(200, body)
+            return
+
+        start = int(match.group(1))
+        end = int(match.group(2)) if match.group(2) else len(body) - 1
+        if start >= len(body):
+            handler.send_body(416, b'', {'Content-Range': f'bytes */{len(body)}'})
+            return
+
+        end = min(end, len(body) - 1)
+        handler.send_body(206, body[start:end + 1], {'Content-Range': f'bytes {start}-{end}/{len(body)}'})
+
+    def handle_error(self, request, client_address):
+        if isinstance(sys.exc_info()[1], ConnectionError): # a client that has timed out
+            return
+        super().handle_error(request, client_address)
+
+    def __enter__(self):
+        threading.Thread(target = self.serve_forever, daemon = True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
+
+
+def sleep(seconds):
+    """ A `respond` that delays the answer. """
+    def respond(handler: Stub_Handler):
+        time.sleep(seconds)
+        handler.send_body(200, b'ok')
+    return respond
@@ -0,0 +1,82 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+try:
+    import asset_parser
+    import requests
+except ImportError as e:
+    raise unittest.SkipTest(f"The addon dependencies are not installed: {e}")
+
+from http_stub import Stub_Server
+
+
+class Test_Download_Manager(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.downloads_path = asset_parser.DOWNLOADS_PATH
+        asset_parser.DOWNLOADS_PATH = os.path.join(self.temp_dir.name, '__downloads__')
+
+        self.data = os.urandom(3 * 1024 * 1024 + 123)
+        self.manager = asset_parser.Download_Manager(asset_parser.HTTP_Client(retries = 0, backoff_factor = 0), retries = 1)
+        self.manager.MIN_SEGMENT_SIZE = 512 * 1024
+
+    def tearDown(self):
+        asset_parser.DOWNLOADS_PATH = self.downloads_path
+        self.temp_dir.cleanup()
+
+    def download(self, server: Stub_Server):
+        download = asset_parser.Download(server.url + '/file.bin')
+        path = self.manager.download(download.url, content_path = os.path.join(self.temp_dir.name, 'file.bin'), download = download)
+        with open(path, 'rb') as file:
+            return file.read(), download
+
+    def test_segmented_download(self):
+        with Stub_Server({'/file.bin': self.data}) as server:
+            data, download = self.download(server)
+
+        self.assertEqual(data, self.data)
+        self.assertEqual(download.done, len(self.data))
+
+        ranges = [headers.get('Range') for path, headers in server.requests[1:]] # after the probe
+        self.assertEqual(len(ranges), self.manager.max_segments)
+        self.assertTrue(all(ranges), "Every segment, including the first one, must be requested with a range.")
+        self.assertFalse(os.listdir(asset_parser.DOWNLOADS_PATH), "The part files must be removed.")
+
+    def test_download_without_ranges(self):
+        with Stub_Server({'/file.bin': self.data}, accepts_ranges = False) as server:
+            data, download = self.download(server)
+
+        self.assertEqual(data, self.data)
+        self.assertFalse(download.accepts_ranges)
+        self.assertEqual(len(server.requests), 2)
+
+    def test_resume(self):
+        with Stub_Server({'/file.bin': self.data}) as server:
+            download = asset_parser.Download(server.url + '/file.bin')
+            self.manager.probe(download)
+
+            # a part left by an interrupted run
+            segments = self.manager.get_segments(download)
+            os.makedirs(asset_parser.DOWNLOADS_PATH)
+            part_path = os.path.join(asset_parser.DOWNLOADS_PATH, f"{download.key}.{len(segments)}.0.part")
+            with open(part_path, 'wb') as file:
+                file.write(self.data[:1000])
+
+            data, download = self.download(server)
+
+        self.assertEqual(data, self.data)
+        self.assertIn(f'bytes=1000-{segments[0][1]}', [headers.get('Range') for path, headers in server.requests])
+
+    def test_not_found(self):
+        with Stub_Server() as server:
+            with self.assertRaises(asset_parser.Download_Error):
+                self.download(server)
+
+
+if __name__ == '__main__':
+    unittest.main()
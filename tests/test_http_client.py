@@ -0,0 +1,84 @@
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+try:
+    import asset_parser
+    import requests
+except ImportError as e:
+    raise unittest.SkipTest(f"The addon dependencies are not installed: {e}")
+
+import http_stub
+from http_stub import Stub_Server
+
+
+def fail_first(statuses):
+    """ A `respond` that answers with `statuses` and then with `200`. """
+    statuses = list(statuses)
+    lock = threading.Lock()
+    def respond(handler: http_stub.Stub_Handler):
+        with lock:
+            status = statuses.pop(0) if statuses else 200
+        handler.send_body(status, b'ok' if status == 200 else b'error', {'Retry-After': '0'} if status == 429 else None)
+    return respond
+
+
+class Test_HTTP_Client(unittest.TestCase):
+
+    def test_connection_reuse(self):
+        client = asset_parser.HTTP_Client()
+        with Stub_Server({'/info': b'{}'}) as server:
+            for _ in range(5):
+                self.assertEqual(client.get(server.url + '/info').status_code, 200)
+
+        self.assertEqual(len(server.requests), 5)
+        self.assertEqual(server.connections, 1)
+
+    def test_default_timeout(self):
+        client = asset_parser.HTTP_Client(timeout = (1, 0.2), retries = 0)
+        with Stub_Server(respond = http_stub.sleep(1)) as server:
+            with self.assertRaises(requests.exceptions.RequestException):
+                client.get(server.url + '/slow')
+
+    def test_retry_on_throttling_and_server_errors(self):
+        client = asset_parser.HTTP_Client(retries = 3, backoff_factor = 0.01)
+        with Stub_Server(respond = fail_first((429, 500, 503))) as server:
+            response = client.get(server.url + '/info')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(server.requests), 4)
+
+    def test_retries_exhausted(self):
+        client = asset_parser.HTTP_Client(retries = 2, backoff_factor = 0.01)
+        with Stub_Server(respond = fail_first((502,) * 10)) as server:
+            response = client.get(server.url + '/info')
+
+        self.assertEqual(response.status_code, 502)
+        self.assertEqual(len(server.requests), 3)
+
+    def test_no_retry_on_client_errors(self):
+        client = asset_parser.HTTP_Client(retries = 3, backoff_factor = 0.01)
+        with Stub_Server() as server:
+            response = client.get(server.url + '/missing')
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(len(server.requests), 1)
+
+    def test_per_host_concurrency(self):
+        client = asset_parser.HTTP_Client(max_connections_per_host = 2)
+        with Stub_Server(respond = http_stub.sleep(0.2)) as server:
+            threads = [threading.Thread(target = client.get, args = (server.url + '/slow',)) for _ in range(6)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(server.requests), 6)
+        self.assertEqual(server.max_active, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
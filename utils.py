@@ -9,9 +9,12 @@ import functools
 import pathlib
 import re
 import operator
+import collections
+import stat
 import tempfile
 import subprocess
 import sys
+import copy
 from datetime import datetime
 from timeit import default_timer
 
@@ -35,48 +38,110 @@ class PseudoDirEntry:
     def is_dir(self):
         return os.path.isdir(self.path)
 
+class Lazy_Module:
+    """ A module that is imported on the first attribute access. For the heavy modules that are not needed for the addon start. """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def load(self):
+        if self._module is None:
+            start = default_timer()
+            import importlib
+            self._module = importlib.import_module(self._name)
+            PROFILER.count(f'import {self._name}', default_timer() - start)
+        return self._module
+
+    def __getattr__(self, name):
+        return getattr(self.load(), name)
+
+    def __repr__(self):
+        return f"<Lazy_Module {self._name!r}{' loaded' if self._module else ''}>"
+
 def color_to_gray(color):
     return 0.2126*color[0] + 0.7152*color[1] + 0.0722*color[2]
 
 
-@property
-@functools.lru_cache()
-def data(self):
-    if self.type == "megascan_info":
-        with self.open(encoding="utf-8") as json_file:
-            return json.load(json_file)
-    elif self.type == "url":
-        if self.suffix == ".webloc":
-            from xml.dom.minidom import parse as xml_parse
-            tag = xml_parse(str(self)).getElementsByTagName("string")[0]
-            return tag.firstChild.nodeValue
-        else:
-            import configparser
-            config = configparser.ConfigParser(interpolation=None)
-            config.read(str(self))
-            return config[config.sections()[0]].get("URL")
-    elif self.type == "blendswap_info":
-        with self.open(encoding="utf-8") as info_file:
-            match = re.search(r"blendswap.com\/blends\/view\/\d+", info_file.read())
-            if match:
-                return match.group(0)
-    elif self.type == "__info__":
-        with self.open(encoding="utf-8") as json_file:
-            return json.load(json_file)
-    return None
+FILE_SNIFF_SIZE = 16384 # bytes to read to classify a file by its content
+FILE_CACHE_SIZE = 4096
+BLENDSWAP_URL_PATTERN = re.compile(r"blendswap.com\/blends\/view\/\d+")
+MEGASCAN_INFO_PATTERNS = (re.compile(r'"id"\s*:\s*"'), re.compile(r'"meta"\s*:\s*\['))
+
+def stat_cache(max_size = FILE_CACHE_SIZE):
+    """
+    A bounded LRU cache of `func(path, stat_result)` keyed by the path, modification time and size. \n
+    An edited file is reclassified and the paths themselves are not kept alive. Missing files are not cached.
+    """
+
+    def stat_cache_decorator(func):
+
+        cache = collections.OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def stat_cache_func(path):
+            path_str = str(path)
+
+            try:
+                stat_result = os.stat(path_str)
+            except OSError:
+                return func(path, None)
+
+            key = (path_str, stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_mode)
+
+            with lock:
+                if key in cache:
+                    cache.move_to_end(key)
+                    return cache[key]
 
-@property
-@functools.lru_cache()
-def is_meta(self):
-    return self.type in META_TYPES
+            value = func(path, stat_result)
 
-@property
-@functools.lru_cache()
-def file_type(self):
-    name = self.name
+            with lock:
+                cache[key] = value
+                if len(cache) > max_size:
+                    cache.popitem(last = False)
 
-    if not self.is_file():
-        if name in META_FOLDERS:
+            return value
+
+        stat_cache_func.cache_clear = cache.clear
+        return stat_cache_func
+
+    return stat_cache_decorator
+
+def sniff(path: pathlib.Path, size = FILE_SNIFF_SIZE):
+    """ Read the beginning of a text file. """
+    with open(path, encoding="utf-8", errors="ignore") as file:
+        return file.read(size)
+
+def is_megascan_info(path: pathlib.Path, stat_result: os.stat_result):
+
+    head = sniff(path).lstrip()
+    if not head.startswith('{'):
+        return False
+
+    if stat_result.st_size > FILE_SNIFF_SIZE and all(pattern.search(head) for pattern in MEGASCAN_INFO_PATTERNS):
+        match = re.search(r'"points"\s*:\s*(\S)', head)
+        if match:
+            return match.group(1).isdigit()
+
+    # a small file or the keys are not in the beginning of a large one
+    try:
+        if stat_result.st_size <= FILE_SNIFF_SIZE:
+            json_data = json.loads(head)
+        else:
+            with open(path, encoding="utf-8") as json_file:
+                json_data = json.load(json_file)
+    except ValueError:
+        return False
+    return type(json_data) == dict and type(json_data.get("id")) == str and type(json_data.get("meta")) == list and type(json_data.get("points")) == int
+
+@stat_cache()
+def get_file_type(path: pathlib.Path, stat_result: os.stat_result):
+    name = path.name
+
+    if not stat_result or not stat.S_ISREG(stat_result.st_mode):
+        if stat_result and name in META_FOLDERS:
             return name
         return None
     
@@ -87,20 +152,17 @@ def file_type(self):
     elif name == "BLENDSWAP_LICENSE.txt":
         return "blendswap_info"
     elif name.lower().endswith("license.html"):
-        with self.open(encoding="utf-8") as info_file:
-            if re.search(r"blendswap.com\/blends\/view\/\d+", info_file.read()):
-                return "blendswap_info"
+        if BLENDSWAP_URL_PATTERN.search(sniff(path)):
+            return "blendswap_info"
 
-    suffix = self.suffix
+    suffix = path.suffix
     if suffix == ".sbsar":
         return "sbsar"
     elif suffix == ".zip":
         return "zip"
     elif suffix == ".json":
-        with self.open(encoding="utf-8") as json_file:
-            json_data = json.load(json_file)
-            if type(json_data.get("id")) == str and type(json_data.get("meta")) == list and type(json_data.get("points")) == int:
-                return "megascan_info"
+        if is_megascan_info(path, stat_result):
+            return "megascan_info"
     elif suffix in IMAGE_EXTENSIONS:
         return "image"
     elif suffix in GEOMETRY_EXTENSIONS:
@@ -110,9 +172,39 @@ def file_type(self):
 
     return None
 
-pathlib.Path.type = file_type
-pathlib.Path.is_meta = is_meta
-pathlib.Path.data = data
+@stat_cache(max_size = 256)
+def read_file_data(path: pathlib.Path, stat_result: os.stat_result):
+    type = get_file_type(path)
+    if type == "megascan_info":
+        with path.open(encoding="utf-8") as json_file:
+            return json.load(json_file)
+    elif type == "url":
+        if path.suffix == ".webloc":
+            from xml.dom.minidom import parse as xml_parse
+            tag = xml_parse(str(path)).getElementsByTagName("string")[0]
+            return tag.firstChild.nodeValue
+        else:
+            import configparser
+            config = configparser.ConfigParser(interpolation=None)
+            config.read(str(path))
+            return config[config.sections()[0]].get("URL")
+    elif type == "blendswap_info":
+        with path.open(encoding="utf-8") as info_file:
+            match = BLENDSWAP_URL_PATTERN.search(info_file.read())
+            if match:
+                return match.group(0)
+    elif type == "__info__":
+        with path.open(encoding="utf-8") as json_file:
+            return json.load(json_file)
+    return None
+
+pathlib.Path.type = property(get_file_type)
+pathlib.Path.is_meta = property(lambda self: get_file_type(self) in META_TYPES)
+def get_file_data(path: pathlib.Path):
+    """ A copy of the cached data, the callers modify the json dictionaries. """
+    return copy.deepcopy(read_file_data(path))
+
+pathlib.Path.data = property(get_file_data)
 
 class File_Filter(typing.Dict[str, pathlib.Path] , dict):
     def __init__(self):
@@ -262,29 +354,89 @@ def remove_empty(iterable):
     else:
         raise TypeError(f"The argument type should be \"dict\" or \"list\" not {type(iterable)}")
 
-def extract_zip(file: typing.Union[str, typing.IO[bytes]], path = None, extract = True, recursively = True):
+ZIP_PARALLEL_MIN_SIZE = 4 * 1024 * 1024
+ZIP_COPY_BUFFER_SIZE = 1024 * 1024
+ZIP_NESTED_MEMORY_SIZE = 64 * 1024 * 1024
+
+def get_zip_member_path(to_path: str, name: str):
+    """ The same path sanitization as `zipfile.ZipFile.extract`. """
+    arcname = name.replace('/', os.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    invalid_path_parts = ('', os.path.curdir, os.path.pardir)
+    arcname = os.path.sep.join(part for part in arcname.split(os.path.sep) if part not in invalid_path_parts)
+    if os.path.sep == '\\':
+        arcname = zipfile.ZipFile._sanitize_windows_name(arcname, os.path.sep)
+    return os.path.join(to_path, arcname)
+
+def extract_zip_member(zip_file: zipfile.ZipFile, info: zipfile.ZipInfo, to_path: str):
+    """ Stream a member into a preallocated file. """
+    target_path = get_zip_member_path(to_path, info.filename)
+
+    if info.is_dir():
+        os.makedirs(target_path, exist_ok=True)
+        return target_path
+
+    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+    with zip_file.open(info) as source, open(target_path, 'wb') as target:
+        if info.file_size:
+            target.truncate(info.file_size)
+        shutil.copyfileobj(source, target, ZIP_COPY_BUFFER_SIZE)
+    return target_path
+
+def extract_zip(file: typing.Union[str, typing.IO[bytes]], path = None, extract = True, recursively = True, max_workers = None):
     """
     `file`: a path to a zip file \n
     `path`: a target root folder, if `None` the zip's folder is used \n
     `extract`: if `False` the function only returns the list of files without an extraction \n
-    `recursively`: extract zips recursively
+    `recursively`: extract zips recursively \n
+    `max_workers`: threads for the members larger than `ZIP_PARALLEL_MIN_SIZE`, the decompression runs without the GIL
+
+    The members are streamed to the disk. A nested zip smaller than `ZIP_NESTED_MEMORY_SIZE` is read into memory,
+    a larger one is streamed to a temporary file first, as a seek in a member of a zip re-reads it from the start.
     """
-    extracted_files = []
+    import concurrent.futures
+
     if path is None:
         path = os.path.splitext(file)[0]
     to_path = path.replace("/", os.sep)
     if extract:
         os.makedirs(to_path, exist_ok=True)
-    with zipfile.ZipFile(file) as zip_file:
-        for name in zip_file.namelist():
+
+    results = [] # type: typing.List[typing.Union[str, typing.List[str], concurrent.futures.Future]]
+
+    with zipfile.ZipFile(file) as zip_file, concurrent.futures.ThreadPoolExecutor(max_workers = max_workers or min(8, os.cpu_count() or 1)) as executor:
+        for info in zip_file.infolist():
+            name = info.filename
+
             if name.endswith(".zip") and recursively:
                 inner_path =  '/'.join((path, name[:-4]))
-                extracted_files.extend(extract_zip(io.BytesIO(zip_file.read(name)), inner_path, extract, recursively))
-            else:
-                if extract:
-                    extracted_files.append(zip_file.extract(name, to_path))
+
+                if info.file_size < ZIP_NESTED_MEMORY_SIZE:
+                    with io.BytesIO(zip_file.read(info)) as inner_file:
+                        results.append(extract_zip(inner_file, inner_path, extract, recursively, max_workers))
                 else:
-                    extracted_files.append(os.path.join(to_path, name.replace("/", os.sep)))
+                    with tempfile.TemporaryDirectory(dir = to_path if extract else None) as temp_dir:
+                        inner_zip = extract_zip_member(zip_file, info, temp_dir)
+                        results.append(extract_zip(inner_zip, inner_path, extract, recursively, max_workers))
+
+            elif not extract:
+                results.append(get_zip_member_path(to_path, name))
+            elif info.file_size >= ZIP_PARALLEL_MIN_SIZE:
+                results.append(executor.submit(extract_zip_member, zip_file, info, to_path))
+            else:
+                results.append(extract_zip_member(zip_file, info, to_path))
+
+        extracted_files = []
+        for result in results:
+            if isinstance(result, concurrent.futures.Future):
+                extracted_files.append(result.result())
+            elif isinstance(result, list):
+                extracted_files.extend(result)
+            else:
+                extracted_files.append(result)
+
     return extracted_files
 
 def get_last_file(path: str, type: typing.Union[str, typing.Tuple[str]], recursively = True) -> str:
@@ -392,78 +544,138 @@ def locate_item(iter, item, is_dict_key = False, return_as = None, mode = 'eq'):
         return [Item_Location(path, iter) for path in locate(iter, item)]
         
 
-class Everything:
-    def __init__(self):
-        self.exe = None
-        self.es_exe = None
-        self.error_text = ""
-        self.is_initialized = False
+PROBES_PATH = os.path.join(DIR_PATH, "__probes__.json")
+PROBE_RETRY_TIME = 24 * 60 * 60
+
+class Probe_Error(Exception):
+    pass
+
+class Probe:
+    """
+    A lazy check of an external tool, run on the first use and persisted in `PROBES_PATH` between the sessions. \n
+    `probe`: returns the value, raises `Probe_Error` with the reason if the tool is unavailable \n
+    `validate`: checks a persisted value, a positive result is probed again if it fails \n
+    A negative result is probed again after `PROBE_RETRY_TIME`, an unexpected exception is only kept for the session.
+    """
+
+    file_lock = threading.Lock()
+
+    def __init__(self, name: str, probe: typing.Callable[[], typing.Any], validate: typing.Callable[[typing.Any], bool] = bool):
+        self.name = name
+        self.probe = probe
+        self.validate = validate
+
         self.lock = threading.RLock()
+        self.is_initialized = False
+        self._value = None
+        self.error = ""
 
     @property
-    def is_available(self):
+    def value(self):
+        with self.lock:
+            if not self.is_initialized:
+                self.load()
+            return self._value
+
+    def load(self):
+        with self.file_lock:
+            result = (read_local_file(os.path.basename(PROBES_PATH)) or {}).get(self.name)
+
+        if result:
+            value = result.get('value')
+            if (value and self.validate(value)) or (not value and datetime.now().timestamp() - result.get('time', 0) < PROBE_RETRY_TIME):
+                self._value = value
+                self.error = result.get('error', '')
+                self.is_initialized = True
+                return
 
-        if self.is_initialized:
-            return bool(self.es_exe)
-        else:
-            self.set_es_exe()
-            if not self.es_exe:
-                print(self.error_text)
-            return bool(self.es_exe)
+        self.run()
 
-    def set_es_exe(self):
+    def run(self):
+        try:
+            self._value = self.probe()
+            self.error = ""
+        except Probe_Error as e:
+            self._value = None
+            self.error = str(e)
+        except Exception as e:
+            # an unexpected failure is not a verdict on the tool, it is probed again in the next session
+            self._value = None
+            self.error = f"{type(e).__name__}: {e}"
+            self.is_initialized = True
+            print(f"atool: the probe '{self.name}' has failed: {self.error}")
+            import traceback
+            traceback.print_exc()
+            return
+        self.is_initialized = True
+
+        with self.file_lock:
+            probes = read_local_file(os.path.basename(PROBES_PATH)) or {}
+            probes[self.name] = {'value': self._value, 'error': self.error, 'time': datetime.now().timestamp()}
+            temp_path = PROBES_PATH + f'.{os.getpid()}.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(probes, file, indent = 4, ensure_ascii = False)
+            os.replace(temp_path, PROBES_PATH)
 
+    def reset(self):
         with self.lock:
+            self.run()
 
-            if self.is_initialized:
-                return
 
-            print('atool: checking es.exe')
+def find_es_exe():
 
-            if not os.name == 'nt':
-                self.error_text = "Current OS is not supported."
-                self.is_initialized = True
-                return
+    print('atool: checking es.exe')
 
-            es_exe = os.path.join(os.path.dirname(__file__), 'es.exe')
-            if os.path.exists(es_exe):
-                self.es_exe = es_exe
-                self.is_initialized = True
-                return 
+    if not os.name == 'nt':
+        raise Probe_Error("Current OS is not supported.")
 
-            try:
-                import winreg
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Classes\Everything.FileList\DefaultIcon") as key:
-                    self.exe = winreg.QueryValueEx(key, "")[0].split(",")[0]
-            except:
-                self.error_text = "Everything.exe is not found."
-                self.is_initialized = True
-                return
-        
-            with tempfile.TemporaryDirectory() as temp_dir:
+    es_exe = os.path.join(os.path.dirname(__file__), 'es.exe')
+    if os.path.exists(es_exe):
+        return es_exe
 
-                if __package__:
-                    from . import asset_parser
-                else:
-                    import asset_parser
+    try:
+        import winreg
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Classes\Everything.FileList\DefaultIcon") as key:
+            winreg.QueryValueEx(key, "")
+    except:
+        raise Probe_Error("Everything.exe is not found.")
 
-                is_success, zip = asset_parser.get_web_file(r"https://www.voidtools.com/ES-1.1.0.18.zip", content_folder = temp_dir)
-                if not is_success:
-                    self.error_text = "Cannot download es.exe"
-                    self.is_initialized = True
-                    return
+    with tempfile.TemporaryDirectory() as temp_dir:
 
-                for file in extract_zip(zip):
-                    if os.path.basename(file) == 'es.exe':
-                        move_to_folder(file, os.path.dirname(__file__), create = False)
-                
-                if not os.path.exists(es_exe):
-                    self.error_text = "Cannot find es.exe in downloads."
-                    self.is_initialized = True
-                    return None
+        if __package__:
+            from . import asset_parser
+        else:
+            import asset_parser
 
-                self.es_exe = es_exe
-                self.is_initialized = True
+        is_success, zip = asset_parser.get_web_file(r"https://www.voidtools.com/ES-1.1.0.18.zip", content_folder = temp_dir)
+        if not is_success:
+            raise Probe_Error("Cannot download es.exe")
+
+        for file in extract_zip(zip):
+            if os.path.basename(file) == 'es.exe':
+                move_to_folder(file, os.path.dirname(__file__), create = False)
+
+    if not os.path.exists(es_exe):
+        raise Probe_Error("Cannot find es.exe in downloads.")
+
+    return es_exe
+
+
+class Everything:
+    def __init__(self):
+        self.probe = Probe('es.exe', find_es_exe, validate = os.path.exists)
+
+    @property
+    def es_exe(self):
+        return self.probe.value
+
+    @property
+    def error_text(self):
+        return self.probe.error
+
+    @property
+    def is_available(self):
+        return bool(self.es_exe)
 
     def find(self, names):
 
@@ -495,6 +707,102 @@ class Everything:
 EVERYTHING = Everything()
 
 
+FILE_INDEX_PATH = os.path.join(DIR_PATH, "__file_index__.json")
+FILE_INDEX_SKIP = {'$RECYCLE.BIN', 'System Volume Information', '__pycache__'}
+
+class File_Index:
+    """
+    Locations of the files named `file_name` under `roots`, a cross-platform alternative to Everything. \n
+    The folder tree is walked with `os.scandir` in parallel and persisted with the folders' mtimes.
+    A refresh only lists the folders whose mtime has changed, the unchanged ones are just `stat`-ed.
+    The meta folders of the found assets, hidden folders and symlinks are not walked.
+    """
+
+    def __init__(self, file_name: str, path = FILE_INDEX_PATH, max_workers = 16):
+        self.file_name = file_name
+        self.path = path
+        self.max_workers = max_workers
+        self.lock = threading.Lock()
+        self.folders_lock = threading.Lock()
+        self.folders: typing.Dict[str, dict] = {} # path: {'mtime': int, 'dirs': [names], 'has_file': bool}
+
+    def load(self):
+        try:
+            with open(self.path, encoding='utf-8') as file:
+                data = json.load(file)
+            if data.get('file_name') == self.file_name:
+                self.folders = data['folders']
+        except (OSError, ValueError, KeyError):
+            self.folders = {}
+
+    def save(self):
+        temp_path = self.path + f'.{os.getpid()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump({'file_name': self.file_name, 'folders': self.folders}, file, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+
+    def scan_folder(self, path: str, old_folders: typing.Dict[str, dict], new_folders: typing.Dict[str, dict]) -> typing.List[str]:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return []
+
+        folder = old_folders.get(path)
+        if not folder or folder['mtime'] != mtime:
+            dirs = []
+            has_file = False
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.name == self.file_name:
+                            has_file = True
+                        elif entry.is_dir(follow_symlinks = False) and not entry.name.startswith('.') and entry.name not in FILE_INDEX_SKIP:
+                            dirs.append(entry.name)
+            except OSError:
+                return []
+            if has_file:
+                dirs = [name for name in dirs if name not in META_FOLDERS]
+            folder = {'mtime': mtime, 'dirs': dirs, 'has_file': has_file}
+
+        with self.folders_lock:
+            new_folders[path] = folder
+
+        return [os.path.join(path, name) for name in folder['dirs']]
+
+    @staticmethod
+    def get_unique_roots(roots: typing.Iterable[str]) -> typing.List[str]:
+        """ Resolved existing roots without the duplicates and the ones inside another root, which would be walked twice. """
+        roots = {os.path.normcase(root): root for root in (os.path.realpath(root) for root in roots if os.path.isdir(root))}
+        return [root for key, root in roots.items() if not any(key != other and key.startswith(os.path.join(other, '')) for other in roots)]
+
+    def update(self, roots: typing.Iterable[str]) -> typing.List[str]:
+        """ Walk the `roots` reusing the unchanged folders and persist the index. \n `return`: the found file paths """
+        import concurrent.futures
+
+        with self.lock: # one update at a time
+            if not self.folders:
+                self.load()
+
+            old_folders = self.folders
+            new_folders = {}
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers = self.max_workers) as executor:
+                pending = {executor.submit(self.scan_folder, root, old_folders, new_folders) for root in self.get_unique_roots(roots)}
+                while pending:
+                    done, pending = concurrent.futures.wait(pending, return_when = concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        for path in future.result():
+                            pending.add(executor.submit(self.scan_folder, path, old_folders, new_folders))
+
+            self.folders = new_folders
+            self.save()
+
+            return self.get_files()
+
+    def get_files(self) -> typing.List[str]:
+        return sorted(os.path.join(path, self.file_name) for path, folder in self.folders.items() if folder['has_file'])
+
+
 def get_closest_path(lost_path, string_paths):
 
     lost_path = lost_path.lower().split(os.sep)[:-1]
@@ -627,37 +935,140 @@ def get_time_stamp():
     return datetime.now().strftime('%y%m%d_%H%M%S')
 
 
+class Suffix_Automaton:
+    """ A suffix automaton of `string`, it recognizes all of its substrings in linear time. """
+
+    def __init__(self, string: str):
+        self.string = string
+
+        self.length = [0]
+        self.link = [-1]
+        self.next = [{}] # type: typing.List[typing.Dict[str, int]]
+        self.first_end = [-1] # the end index of the first occurrence of the state's substrings
+
+        last = 0
+        for index, char in enumerate(string):
+            last = self.extend(last, char, index)
+
+        # states by length descending for propagating matches up the suffix links
+        self.order = sorted(range(1, len(self.length)), key = self.length.__getitem__, reverse = True)
+
+    def add_state(self, length, link, next, first_end):
+        self.length.append(length)
+        self.link.append(link)
+        self.next.append(next)
+        self.first_end.append(first_end)
+        return len(self.length) - 1
+
+    def extend(self, last, char, index):
+        length = self.length
+        link = self.link
+        next = self.next
+
+        current = self.add_state(length[last] + 1, -1, {}, index)
+
+        state = last
+        while state != -1 and char not in next[state]:
+            next[state][char] = current
+            state = link[state]
+
+        if state == -1:
+            link[current] = 0
+            return current
+
+        target = next[state][char]
+        if length[state] + 1 == length[target]:
+            link[current] = target
+            return current
+
+        clone = self.add_state(length[state] + 1, link[target], next[target].copy(), self.first_end[target])
+        while state != -1 and next[state].get(char) == target:
+            next[state][char] = clone
+            state = link[state]
+        link[target] = clone
+        link[current] = clone
+
+        return current
+
+    def get_matches(self, string: str) -> typing.List[int]:
+        """ The longest length of the state's substrings that are also substrings of `string`. """
+
+        length = self.length
+        link = self.link
+        next = self.next
+
+        matches = [0] * len(length)
+
+        state = 0
+        match_length = 0
+        for char in string:
+            while state and char not in next[state]:
+                state = link[state]
+                match_length = length[state]
+
+            state = next[state].get(char)
+            if state is None:
+                state = 0
+                match_length = 0
+                continue
+
+            match_length += 1
+            if match_length > matches[state]:
+                matches[state] = match_length
+
+        for state in self.order:
+            if matches[state]:
+                parent = link[state]
+                matches[parent] = max(matches[parent], min(matches[state], length[parent]))
+
+        return matches
+
+
 def get_longest_substring(strings: typing.Iterable[str], from_beginning = False):
+    """
+    Get the longest string that is a substring of all the `strings`. \n
+    `from_beginning`: get the longest common prefix \n
+    Of the several longest substrings the one that occurs first in the shortest string is returned.
+    """
+
+    strings = list(strings)
+
+    if not strings:
+        return ""
 
     if len(strings) == 1:
-        return  list(strings)[0]
+        return strings[0]
 
-    sets = []
     if from_beginning:
-        for string in strings:
-            string_set = []
-            string_len = len(string)
-            for i in range(string_len):
-                string_set.append(string[:i + 1])
-            sets.append(set(string_set))
-    else:
-        for string in strings:
-            string_set = []
-            string_len = len(string)
-            for i in range(string_len):
-                for j in range(i + 1, string_len + 1):
-                    string_set.append(string[i:j])
-            sets.append(set(string_set))
+        return os.path.commonprefix(strings)
 
-    mega_set = set().union(*sets)
+    strings = list(dict.fromkeys(strings))
+    shortest = min(strings, key = len)
+    if not shortest:
+        return ""
 
-    for string_set in sets:
-        mega_set.intersection_update(string_set)
+    automaton = Suffix_Automaton(shortest)
 
-    if not mega_set:
-        return ""
+    common = list(automaton.length)
+    for string in strings:
+        if string is shortest:
+            continue
+        for state, match_length in enumerate(automaton.get_matches(string)):
+            if match_length < common[state]:
+                common[state] = match_length
 
-    return max(mega_set, key=len)
+    best_length = 0
+    best_start = 0
+    for state in range(1, len(common)):
+        match_length = common[state]
+        if not match_length:
+            continue
+        start = automaton.first_end[state] - match_length + 1
+        if match_length > best_length or (match_length == best_length and start < best_start):
+            best_length = match_length
+            best_start = start
+
+    return shortest[best_start:best_start + best_length]
 
 
 def get_slug(string):
@@ -822,32 +1233,200 @@ def get_most_common(items: typing.Iterable):
     return sorted(dictionary.items(), key = operator.itemgetter(1), reverse = True)[0][0]
 
 
-def timeit(text = None, digits = 2, average = False, timeit_average_dict = {}):
-    """To getting average text should true and be unique for a testing item."""
+class Span:
+    """ A named timed section of `Profiler`, spans nest per thread. """
+
+    __slots__ = ('profiler', 'name', 'start', 'end', 'parent', 'depth', 'thread_id', 'counters')
+
+    def __init__(self, profiler: 'Profiler', name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start: float = None
+        self.end: float = None
+        self.parent: str = None
+        self.depth = 0
+        self.thread_id = threading.get_ident()
+        self.counters: typing.Dict[str, float] = {}
+
+    def __enter__(self):
+        stack = self.profiler.get_stack()
+        if stack:
+            self.parent = stack[-1].name
+        self.depth = len(stack)
+        stack.append(self)
+        self.start = default_timer()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.end = default_timer()
+        self.profiler.get_stack().pop()
+        self.profiler.add(self)
+
+    def count(self, name: str, value: float = 1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    @property
+    def duration(self):
+        return self.end - self.start
+
+    @property
+    def dict(self):
+        return {
+            'name': self.name,
+            'parent': self.parent,
+            'depth': self.depth,
+            'thread_id': self.thread_id,
+            'start': self.start - self.profiler.origin,
+            'duration': self.duration,
+            'counters': self.counters
+        }
+
+class Null_Span:
+    """ Returned by a disabled `Profiler`. """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def count(self, name: str, value: float = 1):
+        pass
+
+NULL_SPAN = Null_Span()
+
+class Profiler:
+    """
+    Collects named nested spans with counters. \n
+    Does nothing but a flag check when disabled. Keeps only the last `max_spans` spans and the totals per span name.
+    """
+
+    def __init__(self, max_spans = 10000):
+        self.is_enabled = False
+        self.origin = default_timer()
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.spans: typing.Deque[Span] = collections.deque(maxlen = max_spans)
+        self.stats: typing.Dict[str, typing.List[float]] = {} # name: [count, total, max]
+
+    def get_stack(self) -> typing.List[Span]:
+        stack = getattr(self.local, 'stack', None)
+        if stack is None:
+            self.local.stack = stack = []
+        return stack
+
+    def span(self, name: str, force = False) -> typing.Union[Span, Null_Span]:
+        """ `force`: record the span and its counters even if disabled, for the ones that are always reported """
+        if not (self.is_enabled or force):
+            return NULL_SPAN
+        return Span(self, name)
+
+    def profile(self, name: str = None):
+        """ A decorator to put each call of a function into a span. """
+
+        def profile_decorator(func):
+
+            span_name = name if name else func.__qualname__
+
+            @functools.wraps(func)
+            def profile_func(*args, **kwargs):
+                if not self.is_enabled:
+                    return func(*args, **kwargs)
+                with Span(self, span_name):
+                    return func(*args, **kwargs)
+
+            return profile_func
+
+        return profile_decorator
+
+    def count(self, name: str, value: float = 1):
+        """ Add `value` to the counter `name` of the current span of the thread. """
+
+        if not (self.is_enabled or getattr(self.local, 'stack', None)): # a forced span
+            return
+
+        stack = self.get_stack()
+        if stack:
+            stack[-1].count(name, value)
+
+    def add(self, span: Span):
+        duration = span.duration
+        with self.lock:
+            self.spans.append(span)
+            stats = self.stats.get(span.name)
+            if stats:
+                stats[0] += 1
+                stats[1] += duration
+                stats[2] = max(stats[2], duration)
+            else:
+                self.stats[span.name] = [1, duration, duration]
+
+    def clear(self):
+        with self.lock:
+            self.spans.clear()
+            self.stats.clear()
+
+    def get_slowest(self, number = 10) -> typing.List[Span]:
+        with self.lock:
+            spans = list(self.spans)
+        return sorted(spans, key = operator.attrgetter('duration'), reverse = True)[:number]
+
+    def get_stats(self) -> typing.Dict[str, dict]:
+        with self.lock:
+            return {name: {'count': count, 'total': total, 'average': total/count, 'max': max} for name, (count, total, max) in self.stats.items()}
+
+    def dump_json(self, path):
+        with self.lock:
+            spans = [span.dict for span in self.spans]
+        with open(path, 'w', encoding='utf-8') as json_file:
+            json.dump({'stats': self.get_stats(), 'spans': spans}, json_file, indent = 4, ensure_ascii = False)
+
+    def dump_chrome_trace(self, path):
+        """ The trace can be opened with `chrome://tracing` or https://ui.perfetto.dev """
+
+        pid = os.getpid()
+        with self.lock:
+            events = [{
+                'name': span.name,
+                'ph': 'X',
+                'ts': (span.start - self.origin) * 1e6,
+                'dur': span.duration * 1e6,
+                'pid': pid,
+                'tid': span.thread_id,
+                'args': span.counters
+            } for span in self.spans]
+        with open(path, 'w', encoding='utf-8') as json_file:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, json_file, ensure_ascii = False)
+
+PROFILER = Profiler()
+
+
+def timeit(text = None, digits = 2, average = False):
+    """
+    Print the time of each call, the call is also recorded as a `PROFILER` span. \n
+    `average`: print the average time of all the calls of the function instead
+    """
 
     def timeit_decorator(func):
 
+        name = text if text else func.__name__ + ' took'
+        total = [0, 0.0] # count, time
+
         @functools.wraps(func)
         def timeit_func(*args, **kwargs):
-        
+
             start = default_timer()
-            return_value = func(*args, **kwargs)
+            with PROFILER.span(name):
+                return_value = func(*args, **kwargs)
             end = default_timer()
 
-            nonlocal text
-
             time = end - start
-            if average and text:
-                result = timeit_average_dict.get(text)
-                if result:
-                    count, func_time = result
-                    timeit_average_dict[text] = (count + 1, func_time + time)
-                    time = (func_time + time)/(count + 1)
-                else:
-                    timeit_average_dict[text] = (1, time)
-
-            if not text:
-                text = func.__name__ + ' took'
+            if average:
+                total[0] += 1
+                total[1] += time
+                time = total[1]/total[0]
 
             if time >= 1:
                 time = round(time, digits)
@@ -858,7 +1437,7 @@ def timeit(text = None, digits = 2, average = False, timeit_average_dict = {}):
                     time = round(time, digits + index)
                     break
 
-            print(f"{text}: {format(time, 'f').rstrip('.0')} s")
+            print(f"{name}: {format(time, 'f').rstrip('.0')} s")
 
             return return_value
 
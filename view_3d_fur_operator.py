@@ -236,6 +236,56 @@ class ATOOL_OT_show_all_particle_systems(bpy.types.Operator, Poll):
         return {'FINISHED'}
 
 
+PREVIEW_WORKER = bl_utils.Preview_Worker()
+PREVIEW_SCENE = {'filepath': None, 'source': None, 'is_changed': True, 'selection': None}
+
+def get_selection(view_layer: bpy.types.ViewLayer):
+    active = view_layer.objects.active
+    return frozenset(object.name for object in view_layer.objects.selected), active.name if active else None
+
+@bpy.app.handlers.persistent
+def on_load_post(dummy):
+    PREVIEW_SCENE['is_changed'] = True
+
+@bpy.app.handlers.persistent
+def on_depsgraph_update(scene, depsgraph):
+    if PREVIEW_SCENE['is_changed']:
+        return
+
+    # a selection change updates the scene without changing the render
+    selection = get_selection(depsgraph.view_layer)
+    is_selection_update = selection != PREVIEW_SCENE['selection']
+    PREVIEW_SCENE['selection'] = selection
+
+    for update in depsgraph.updates:
+        if update.is_updated_geometry or update.is_updated_transform or update.is_updated_shading:
+            PREVIEW_SCENE['is_changed'] = True
+            return
+        # deleted or linked objects, scene and render settings
+        if isinstance(update.id, (bpy.types.Scene, bpy.types.Collection)) and not is_selection_update:
+            PREVIEW_SCENE['is_changed'] = True
+            return
+
+PREVIEW_HANDLERS = (('depsgraph_update_post', on_depsgraph_update), ('load_post', on_load_post))
+
+def ensure_preview_handlers():
+    for handlers_name, function in PREVIEW_HANDLERS:
+        handlers = getattr(bpy.app.handlers, handlers_name)
+        for handler in list(handlers):
+            if getattr(handler, '__name__', None) == function.__name__ and handler is not function:
+                handlers.remove(handler) # from before an addon reload
+        if not function in handlers:
+            handlers.append(function)
+
+def remove_preview_handlers():
+    """ The handlers are persistent, they stay after the addon is disabled otherwise. """
+    for handlers_name, function in PREVIEW_HANDLERS:
+        handlers = getattr(bpy.app.handlers, handlers_name)
+        for handler in list(handlers):
+            if getattr(handler, '__name__', None) == function.__name__:
+                handlers.remove(handler)
+
+
 class ATOOL_OT_render_view(bpy.types.Operator, bl_utils.Object_Mode_Poll):
     bl_idname = "atool.render_view"
     bl_label = "Render View"
@@ -247,6 +297,11 @@ class ATOOL_OT_render_view(bpy.types.Operator, bl_utils.Object_Mode_Poll):
 
     use_default_world: bpy.props.BoolProperty(name = 'Default World', default = False)
     use_film_transparent: bpy.props.BoolProperty(name = 'Film Transparent', default = False)
+    use_warm_start: bpy.props.BoolProperty(
+        name = 'Keep Scene Loaded',
+        description = 'Render in a background Blender that keeps the scene loaded between the previews. Only the view is sent if the scene has not changed',
+        default = True
+        )
 
     def invoke(self, context, event):
         return context.window_manager.invoke_props_dialog(self, width = 300)
@@ -265,8 +320,18 @@ class ATOOL_OT_render_view(bpy.types.Operator, bl_utils.Object_Mode_Poll):
         view_matrix = region_3d.view_matrix.inverted()
         view_matrix_serializable = [list(row) for row in view_matrix]
     
-        filepath = os.path.join(bpy.app.tempdir, utils.get_time_stamp() + '.blend')
-        bpy.ops.wm.save_as_mainfile(filepath = filepath, copy=True, compress = False, check_existing = False)
+        if self.use_warm_start:
+            ensure_preview_handlers()
+
+        filepath = PREVIEW_SCENE['filepath']
+        is_same_source = PREVIEW_SCENE['source'] == bpy.data.filepath
+        if not self.use_warm_start or PREVIEW_SCENE['is_changed'] or not is_same_source or not (filepath and os.path.exists(filepath)):
+            filepath = os.path.join(bpy.app.tempdir, utils.get_time_stamp() + '.blend')
+            bpy.ops.wm.save_as_mainfile(filepath = filepath, copy=True, compress = False, check_existing = False)
+            PREVIEW_SCENE['filepath'] = filepath
+            PREVIEW_SCENE['source'] = bpy.data.filepath
+            PREVIEW_SCENE['selection'] = get_selection(context.view_layer)
+            PREVIEW_SCENE['is_changed'] = False
 
         data = {
             'resolution': self.resolution,
@@ -285,11 +350,16 @@ class ATOOL_OT_render_view(bpy.types.Operator, bl_utils.Object_Mode_Poll):
             'filepath': filepath
         }
 
-        render_preview = utils.get_script('preview.py')
-        argv = ['-job', json.dumps(data)]
+        if self.use_warm_start:
+            def run():
+                result = PREVIEW_WORKER.render(data)
+                print(f"The preview is saved to: {result['path']}")
+        else:
+            render_preview = utils.get_script('preview.py')
+            argv = ['-job', json.dumps(data)]
 
-        def run():
-            bl_utils.run_blender(script = render_preview, argv = argv, use_atool = False) #, stdout = subprocess.DEVNULL)
+            def run():
+                bl_utils.run_blender(script = render_preview, argv = argv, use_atool = False) #, stdout = subprocess.DEVNULL)
 
         threading.Thread(target = run, args = ()).start()
 
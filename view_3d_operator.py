@@ -14,6 +14,7 @@ from datetime import datetime
 import bpy
 import bmesh
 import mathutils
+from bpy_extras.io_utils import ExportHelper
 
 from . import utils
 from . import bl_utils
@@ -1081,6 +1082,39 @@ class ATOOL_OT_get_web_info(bpy.types.Operator, Object_Mode_Poll):
         return {'FINISHED'}
 
 
+class ATOOL_OT_get_web_info_batch(bpy.types.Operator, Object_Mode_Poll):
+    bl_idname = "atool.get_web_info_batch"
+    bl_label = "Get Info From Urls"
+    bl_description = "Get the info from the url for all the assets that have one, concurrently"
+
+    use_search: bpy.props.BoolProperty(
+        name = "Only Search Result",
+        description = "Only the assets matching the current search query",
+        default = False
+        )
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+
+        asset_data = context.window_manager.at_asset_data # type: data.AssetData
+        if not asset_data:
+            self.report({'INFO'}, "The library is empty.")
+            return {'CANCELLED'}
+
+        query = context.window_manager.at_search if self.use_search else None
+        ids = asset_data.get_ids_with_url(query)
+        if not ids:
+            self.report({'INFO'}, "No assets with a url.")
+            return {'CANCELLED'}
+
+        threading.Thread(target=asset_data.update_web_info, args=(ids, context)).start()
+        self.report({'INFO'}, f"Getting the info for {len(ids)} assets. See the console for the result.")
+
+        return {'FINISHED'}
+
+
 class ATOOL_OT_open_info(bpy.types.Operator, Object_Mode_Poll):
     bl_idname = "atool.open_info"
     bl_label = "Open Info"
@@ -1619,12 +1653,57 @@ class ATOOL_OT_render_icon(bpy.types.Operator, Object_Mode_Poll):
 
     def execute(self, context):
 
-        data, id = get_asset_data_and_id(self, context)
-        if not (data and id):
+        asset_data, id = get_asset_data_and_id(self, context)
+        if not (asset_data and id):
+            return {'CANCELLED'}
+
+        data.ICON_RENDER_QUEUE.submit(asset_data, [id], context)
+
+        return {'FINISHED'}
+
+
+class ATOOL_OT_render_missing_icons(bpy.types.Operator):
+    bl_idname = "atool.render_missing_icons"
+    bl_label = "Render Missing Icons"
+    bl_description = "Render previews for all the assets without an icon. The same as the :no_icon search"
+
+    def execute(self, context):
+
+        asset_data = context.window_manager.at_asset_data # type: data.AssetData
+        if not asset_data:
+            self.report({'INFO'}, "The library is empty.")
+            return {'CANCELLED'}
+
+        number_of_ids = len(asset_data.get_ids_without_icon())
+        if not number_of_ids:
+            self.report({'INFO'}, "All the assets have icons.")
             return {'CANCELLED'}
 
-        threading.Thread(target=data.render_icon, args = (id, context)).start()
+        asset_data.render_missing_icons(context)
+        self.report({'INFO'}, f"{number_of_ids} icons are queued for rendering.")
+
+        return {'FINISHED'}
+
+
+class ATOOL_OT_cancel_icon_render(bpy.types.Operator):
+    bl_idname = "atool.cancel_icon_render"
+    bl_label = "Cancel Icon Render"
+    bl_description = "Cancel the icon render. All the queued and running ones if no asset is specified"
 
+    id: bpy.props.StringProperty(options = {'SKIP_SAVE'})
+
+    def execute(self, context):
+        data.ICON_RENDER_QUEUE.cancel(self.id if self.id else None)
+        return {'FINISHED'}
+
+
+class ATOOL_OT_clear_icon_render_queue(bpy.types.Operator):
+    bl_idname = "atool.clear_icon_render_queue"
+    bl_label = "Clear Finished"
+    bl_description = "Remove the finished icon renders from the list"
+
+    def execute(self, context):
+        data.ICON_RENDER_QUEUE.clear_finished()
         return {'FINISHED'}
 
 
@@ -1967,6 +2046,12 @@ class ATOOL_OT_render_partial(bpy.types.Operator, Object_Mode_Poll):
     bl_description = "Render image in parts from the command line with .bat file"
 
     dicing: bpy.props.IntProperty(default=2)
+    workers: bpy.props.IntProperty(
+        name="Workers",
+        description="Number of Blender processes rendering the tiles in parallel",
+        default = 1,
+        min = 1
+        )
 
     def invoke(self, context, event):
 
@@ -2005,7 +2090,7 @@ class ATOOL_OT_render_partial(bpy.types.Operator, Object_Mode_Poll):
         bat_file_path = os.path.join(os.path.dirname(bpy.data.filepath) , 'partial_render.bat')
 
         with open(bat_file_path, 'w',encoding='utf-8') as bat_file:
-            bat_file.write(f'{python_binary} {script} -blender {blender_binary} -file {blend_path} -dicing {self.dicing}')
+            bat_file.write(f'{python_binary} {script} -blender {blender_binary} -file {blend_path} -dicing {self.dicing} -workers {self.workers}')
 
         self.report({'INFO'}, "Bat file created.")
 
@@ -2337,7 +2422,7 @@ class ATOOL_OT_import_sketchfab(bpy.types.Operator):
         source_dir = os.path.join(extraction_dir, 'source')
         textures_dir = os.path.join(extraction_dir, 'textures')
         
-        files = utils.extract_zip(path, path = extraction_dir, extract = 'False')
+        files = utils.extract_zip(path, path = extraction_dir, extract = False)
         
         for file in files:
             if not (os.path.commonpath((source_dir, file)) == source_dir or os.path.commonpath((textures_dir, file)) == textures_dir):
@@ -2702,4 +2787,41 @@ class ATOOL_OT_open_url(bpy.types.Operator, Object_Mode_Poll):
        
         utils.web_open(self.url)
             
-        return {'FINISHED'}
\ No newline at end of file
+        return {'FINISHED'}
+
+class ATOOL_OT_dump_profile(bpy.types.Operator, ExportHelper):
+    bl_idname = "atool.dump_profile"
+    bl_label = "Export Profile"
+    bl_description = "Save the recorded profiler spans. The Chrome trace can be opened with chrome://tracing or ui.perfetto.dev"
+
+    filename_ext = ".json"
+    filter_glob: bpy.props.StringProperty(default="*.json", options={'HIDDEN'})
+
+    format: bpy.props.EnumProperty(
+        name = 'Format',
+        items = [
+            ('CHROME_TRACE', 'Chrome Trace', 'Chrome Trace Event Format'),
+            ('JSON', 'JSON', 'The spans and the totals per span name')
+        ],
+        default = 'CHROME_TRACE'
+    )
+
+    def execute(self, context):
+
+        if self.format == 'CHROME_TRACE':
+            utils.PROFILER.dump_chrome_trace(self.filepath)
+        else:
+            utils.PROFILER.dump_json(self.filepath)
+
+        self.report({'INFO'}, f"The profile has been saved to: {self.filepath}")
+        return {'FINISHED'}
+
+
+class ATOOL_OT_clear_profile(bpy.types.Operator):
+    bl_idname = "atool.clear_profile"
+    bl_label = "Clear Profile"
+    bl_description = "Remove all the recorded profiler spans"
+
+    def execute(self, context):
+        utils.PROFILER.clear()
+        return {'FINISHED'}
@@ -77,6 +77,8 @@ class ATOOL_MT_asset_library(bpy.types.Menu):
         layout = self.layout
         
         layout.operator("atool.process_auto", text = "Process Auto Folder", icon="NEWFOLDER")
+        layout.operator("atool.render_missing_icons", icon='RESTRICT_RENDER_OFF')
+        layout.operator("atool.get_web_info_batch", icon='INFO')
         layout.separator()
         layout.operator("atool.reload_addon", text = "Reload Addon")
         layout.separator()
@@ -451,4 +453,68 @@ class ATOOL_PT_view_3d_fur_tools(bpy.types.Panel):
                 row = box.row(align = True)
                 row.label(text = 'No Particle Systems')
 
-        column.operator("atool.render_view")
\ No newline at end of file
+        column.operator("atool.render_view")
+
+class ATOOL_PT_icon_render_queue(bpy.types.Panel):
+    bl_idname = "ATOOL_PT_icon_render_queue"
+    bl_label = "Icon Renders"
+    bl_category = "AT"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = "UI"
+
+    @classmethod
+    def poll(cls, context):
+        return bool(data.ICON_RENDER_QUEUE.jobs)
+
+    def draw(self, context):
+
+        column = self.layout.column()
+
+        counts = data.ICON_RENDER_QUEUE.get_counts()
+        row = column.row(align=True)
+        row.label(text = f"Queued: {counts['QUEUED']}  Running: {counts['RUNNING']}  Done: {counts['DONE']}  Failed: {counts['FAILED']}  Skipped: {counts['SKIPPED']}")
+
+        row = column.row(align=True)
+        row.operator("atool.cancel_icon_render", text = "Cancel All", icon='CANCEL')
+        row.operator("atool.clear_icon_render_queue", text = "Clear Finished", icon='TRASH')
+
+        box = column.box().column(align=True)
+        for job in data.ICON_RENDER_QUEUE.get_jobs():
+            row = box.row(align=True)
+            row.label(text = job.id if job.quality == 'FINAL' else f"{job.id} (Draft)", icon = job.icon)
+            if not job.is_finished:
+                row.operator("atool.cancel_icon_render", text = "", icon='X').id = job.id
+            elif job.error:
+                row.label(text = job.error.splitlines()[0])
+
+
+class ATOOL_PT_profiler(bpy.types.Panel):
+    bl_idname = "ATOOL_PT_profiler"
+    bl_label = "Profiler"
+    bl_category = "AT"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = "UI"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        return utils.PROFILER.is_enabled
+
+    def draw(self, context):
+
+        column = self.layout.column()
+
+        row = column.row(align=True)
+        row.operator("atool.dump_profile", text = "Export", icon='EXPORT')
+        row.operator("atool.clear_profile", text = "", icon='TRASH')
+        column.separator()
+
+        column.label(text='Slowest', icon='SORTTIME')
+        box = column.box().column(align=True)
+        slowest = utils.PROFILER.get_slowest(10)
+        if not slowest:
+            box.label(text = 'No Records')
+        for span in slowest:
+            row = box.row()
+            row.label(text = span.name)
+            row.label(text = f"{span.duration:.3f} s")